@@ -1,8 +1,20 @@
 from flask import Flask, render_template, request, jsonify, send_file
 from flask_cors import CORS
+from flask_caching import Cache
+from flask_compress import Compress
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
+import gzip
+import hashlib
+import time
+import random
+import mimetypes
 from datetime import datetime, timedelta
 import json
+import numpy as np
+import brotli
+import requests
 
 # Import our enhanced modules
 from utils.nasa_api import nasa_client, get_asteroid_data, get_close_approach_data
@@ -12,19 +24,47 @@ from utils.enhanced_nasa_integration import (
 )
 from models.asteroid import Asteroid
 from models.impact import ImpactSimulator
-from models.deflection import DeflectionSimulator
+from models.deflection import DeflectionSimulator, evaluate_all, strategy_masks, strategy_grid
 from models.solar_system import SolarSystemDatabase
 from models.space_tracker import SpaceTracker, StellariumEngine
-from models.impact_physics import ImpactPhysicsCalculator, ImpactParameters, calculate_impact as calc_impact_physics
-from models.mitigation import MitigationCalculator, DeflectionMission, simulate_deflection_scenario
+from models.impact_physics import (
+    ImpactPhysicsCalculator, ImpactParameters, calculate_impact as calc_impact_physics,
+    calculate_enhanced_impact as calc_enhanced_impact_physics
+)
+from models.mitigation import MitigationCalculator, DeflectionMission, simulate_deflection_scenario, asteroid_mass
+from utils.json_provider import OrjsonProvider
+from utils.background import PeriodicSnapshot, BackgroundWriter
+from utils.leaderboard import Leaderboard
+from utils.request_args import typed_args
+from utils.jit import njit
+from utils.schemas import (
+    ImpactRequest, DeflectionRequest, PhysicsImpactRequest, ImpactScenarioRequest,
+    DeflectionCompareRequest, DeflectionScenarioRequest, ProfessionalImpactRequest,
+    MitigationStrategiesRequest, MitigationGridRequest, OrbitalTrajectoryRequest, ThreatBatchRequest,
+    ValidationError, validation_error_response
+)
 import config
 
 app = Flask(__name__)
 app.config.from_object(config.Config)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for frontend integration
+cache = Cache(app)
+Compress(app)
 
 # Initialize our comprehensive space systems
 solar_system_db = SolarSystemDatabase()
+
+# The solar system database is constant, so serve it from bytes encoded once at startup
+_PLANETS_JSON = app.json.dumps_bytes(solar_system_db.get_all_planets())
+_PLANET_JSON = {name: app.json.dumps_bytes(planet) for name, planet in solar_system_db.planets.items()}
+_MOONS_JSON = app.json.dumps_bytes(solar_system_db.moons)
+_DWARF_PLANETS_JSON = app.json.dumps_bytes(solar_system_db.dwarf_planets)
+_MISSIONS_JSON = app.json.dumps_bytes(solar_system_db.missions)
+_MISSIONS_BY_COUNTRY_JSON = {
+    country: app.json.dumps_bytes(solar_system_db.get_missions_by_country(country))
+    for country in {mission.country.upper() for mission in solar_system_db.missions.values()}
+}
 space_tracker = SpaceTracker()
 stellarium_engine = StellariumEngine()
 
@@ -33,6 +73,80 @@ enhanced_nasa_client = EnhancedNASAClient(config.Config.NASA_API_KEY)
 usgs_seismic = USGSSeismicIntegration()
 neossat_client = CSANEOSSATIntegration()
 
+# Shared pool for fanning out independent upstream API calls
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Live feeds are refreshed by one background thread each, independent of request rate
+_ISS_SNAPSHOT = PeriodicSnapshot(
+    space_tracker.get_iss_real_time, config.Config.ISS_UPDATE_INTERVAL, 'iss-refresh',
+    encode=app.json.dumps_bytes
+).start()
+_PEOPLE_IN_SPACE_SNAPSHOT = PeriodicSnapshot(
+    nasa_client.get_people_in_space, config.Config.PEOPLE_IN_SPACE_UPDATE_INTERVAL, 'people-in-space-refresh',
+    encode=app.json.dumps_bytes
+).start()
+
+def fetch_enhanced_neo_data():
+    """NEO feed for the snapshot; an empty result means the upstream call failed"""
+    return enhanced_nasa_client.get_enhanced_neo_data() or {'error': 'NEO feed unavailable'}
+
+# Parsed NEO feed, kept as a dict for handlers that count or filter it
+_NEO_SNAPSHOT = PeriodicSnapshot(
+    fetch_enhanced_neo_data, config.Config.ASTEROID_UPDATE_INTERVAL, 'neo-refresh',
+    retry_interval=config.Config.REAL_TIME_UPDATE_INTERVAL
+).start()
+
+def json_bytes_response(body, etag=None):
+    """Return pre-serialized JSON bytes without re-encoding them"""
+    response = app.response_class(body, mimetype='application/json')
+    if etag:
+        # Answers a matching If-None-Match with an empty 304
+        response.set_etag(etag)
+        response.make_conditional(request)
+    return response
+
+def body_etag(body):
+    """Strong ETag for a response body"""
+    return hashlib.sha1(body).hexdigest()
+
+_utc_second = (0, '')
+
+def now_iso():
+    """UTC timestamp at one-second resolution, formatted once per second"""
+    global _utc_second
+    second = int(time.time())
+    cached_second, stamp = _utc_second
+    if cached_second != second:
+        stamp = datetime.utcfromtimestamp(second).isoformat()
+        # Rebind as one tuple so concurrent readers never pair a second with another's string
+        _utc_second = (second, stamp)
+    return stamp
+
+def precompress(body):
+    """Identity, brotli and gzip encodings of a constant body (with ETags), compressed once"""
+    etag = body_etag(body)
+    return {
+        'identity': (body, etag),
+        'br': (brotli.compress(body), f'{etag}-br'),
+        'gzip': (gzip.compress(body), f'{etag}-gzip')
+    }
+
+def precompressed_json_response(encodings):
+    """Serve a precompress() result in the best encoding the client accepts"""
+    encoding = request.accept_encodings.best_match(('br', 'gzip'), default='identity')
+    response = json_bytes_response(*encodings[encoding])
+    response.vary.add('Accept-Encoding')
+    if encoding != 'identity':
+        # Flask-Compress leaves responses that already carry a Content-Encoding alone
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def cacheable_response(rv):
+    """Only cache successful responses, not errors proxied from upstream APIs"""
+    if isinstance(rv, tuple):
+        return False
+    return rv.status_code == 200 and not rv.get_data().lstrip(b'{ \n').startswith(b'"error"')
+
 @app.route('/')
 def index():
     """Render the professional landing page"""
@@ -56,18 +170,14 @@ def classic_meteor_madness():
 # === ORIGINAL ASTEROID DEFENSE ROUTES ===
 
 @app.route('/api/asteroids')
-def asteroids():
+@typed_args(start_date=str, end_date=str, page=(int, 0), size=(int, 20))
+def asteroids(start_date, end_date, page, size):
     """Get asteroid data from NASA API with enhanced features"""
-    start_date = request.args.get('start_date', None)
-    end_date = request.args.get('end_date', None)
-    page = request.args.get('page', 0)
-    size = request.args.get('size', 20)
-    
     try:
         if start_date or end_date:
             data = nasa_client.get_asteroid_data(start_date, end_date)
         else:
-            data = nasa_client.get_asteroid_browse(int(page), int(size))
+            data = nasa_client.get_asteroid_browse(page, size)
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -78,33 +188,16 @@ def asteroids():
 def calculate_enhanced_impact():
     """Enhanced impact calculation with detailed physics"""
     try:
-        data = request.get_json()
+        params = ImpactRequest.model_validate_json(request.get_data())
         
-        # Extract parameters
-        diameter = float(data.get('diameter', 100))  # meters
-        velocity = float(data.get('velocity', 20))    # km/s
-        density = float(data.get('density', 3000))    # kg/m³
-        angle = float(data.get('angle', 45))          # degrees
-        location = data.get('location', 'ocean')      # impact location
-        
-        # Calculate enhanced impact effects
-        from models.impact_physics import calculate_enhanced_impact
-        results = calculate_enhanced_impact(
-            diameter=diameter,
-            velocity=velocity,
-            density=density,
-            angle=angle,
-            location=location
-        )
+        # Calculate enhanced impact effects (a shared cached dict, so copy it to add the timestamp)
+        results = {**calc_enhanced_impact_physics(**params.model_dump()),
+                   'timestamp': datetime.now().isoformat()}
         
-        # Add timestamp
-        enhanced_results = {
-            **results,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        return jsonify(enhanced_results)
+        return jsonify(results)
         
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": f"Impact calculation failed: {str(e)}"}), 500
 
@@ -112,23 +205,9 @@ def calculate_enhanced_impact():
 def simulate_enhanced_deflection():
     """Advanced deflection mission simulation"""
     try:
-        data = request.get_json()
-        
-        # Asteroid parameters
-        asteroid_params = {
-            'diameter': float(data.get('diameter', 100)),
-            'velocity': float(data.get('velocity', 20)),
-            'density': float(data.get('density', 3000)),
-            'distance': float(data.get('distance', 1.0))  # AU from Earth
-        }
-        
-        # Mission parameters
-        mission_params = {
-            'method': data.get('method', 'kinetic'),
-            'warning_time': float(data.get('warning_time', 5)),
-            'budget': float(data.get('budget', 1e9)),  # USD
-            'technology_level': data.get('technology_level', 'current')
-        }
+        body = DeflectionRequest.model_validate_json(request.get_data())
+        asteroid_params = body.asteroid_params()
+        mission_params = body.mission_params()
         
         # Create deflection mission
         mission = DeflectionMission(
@@ -168,91 +247,95 @@ def simulate_enhanced_deflection():
         
         return jsonify(enhanced_results)
         
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": f"Deflection simulation failed: {str(e)}"}), 500
 
+# Predefined scenarios are static, so serialize them once at import time
+PREDEFINED_SCENARIOS = {
+    'impactor_2025': {
+        'name': 'Impactor-2025',
+        'description': 'Hypothetical 340m asteroid with 28.5 km/s velocity',
+        'parameters': {
+            'diameter': 340,
+            'velocity': 28.5,
+            'density': 2800,
+            'angle': 60,
+            'location': 'ocean',
+            'composition': 'stony'
+        },
+        'threat_level': 'high',
+        'discovery_circumstances': 'Discovered 2 years before impact'
+    },
+    'chelyabinsk_2013': {
+        'name': 'Chelyabinsk Event (2013)',
+        'description': 'Real event - 20m meteor over Russia',
+        'parameters': {
+            'diameter': 20,
+            'velocity': 19.2,
+            'density': 3300,
+            'angle': 18,
+            'location': 'land',
+            'composition': 'chondrite'
+        },
+        'threat_level': 'moderate',
+        'discovery_circumstances': 'Undetected until entry'
+    },
+    'tunguska_1908': {
+        'name': 'Tunguska Event (1908)',
+        'description': 'Historical airburst over Siberia',
+        'parameters': {
+            'diameter': 60,
+            'velocity': 27.0,
+            'density': 1000,
+            'angle': 45,
+            'location': 'forest',
+            'composition': 'comet'
+        },
+        'threat_level': 'high',
+        'discovery_circumstances': 'Historical event'
+    },
+    'chicxulub': {
+        'name': 'Chicxulub Impactor',
+        'description': 'Dinosaur extinction event - 66 million years ago',
+        'parameters': {
+            'diameter': 10000,
+            'velocity': 20.0,
+            'density': 2500,
+            'angle': 60,
+            'location': 'coast',
+            'composition': 'carbonaceous'
+        },
+        'threat_level': 'extinction',
+        'discovery_circumstances': 'Geological evidence'
+    }
+}
+
+_SCENARIOS_JSON = app.json.dumps_bytes(PREDEFINED_SCENARIOS)
+
 @app.route('/api/meteor-madness/scenarios')
 def get_predefined_scenarios():
     """Get predefined impact scenarios including Impactor-2025"""
-    try:
-        scenarios = {
-            'impactor_2025': {
-                'name': 'Impactor-2025',
-                'description': 'Hypothetical 340m asteroid with 28.5 km/s velocity',
-                'parameters': {
-                    'diameter': 340,
-                    'velocity': 28.5,
-                    'density': 2800,
-                    'angle': 60,
-                    'location': 'ocean',
-                    'composition': 'stony'
-                },
-                'threat_level': 'high',
-                'discovery_circumstances': 'Discovered 2 years before impact'
-            },
-            'chelyabinsk_2013': {
-                'name': 'Chelyabinsk Event (2013)',
-                'description': 'Real event - 20m meteor over Russia',
-                'parameters': {
-                    'diameter': 20,
-                    'velocity': 19.2,
-                    'density': 3300,
-                    'angle': 18,
-                    'location': 'land',
-                    'composition': 'chondrite'
-                },
-                'threat_level': 'moderate',
-                'discovery_circumstances': 'Undetected until entry'
-            },
-            'tunguska_1908': {
-                'name': 'Tunguska Event (1908)',
-                'description': 'Historical airburst over Siberia',
-                'parameters': {
-                    'diameter': 60,
-                    'velocity': 27.0,
-                    'density': 1000,
-                    'angle': 45,
-                    'location': 'forest',
-                    'composition': 'comet'
-                },
-                'threat_level': 'high',
-                'discovery_circumstances': 'Historical event'
-            },
-            'chicxulub': {
-                'name': 'Chicxulub Impactor',
-                'description': 'Dinosaur extinction event - 66 million years ago',
-                'parameters': {
-                    'diameter': 10000,
-                    'velocity': 20.0,
-                    'density': 2500,
-                    'angle': 60,
-                    'location': 'coast',
-                    'composition': 'carbonaceous'
-                },
-                'threat_level': 'extinction',
-                'discovery_circumstances': 'Geological evidence'
-            }
-        }
-        
-        return jsonify({
-            'scenarios': scenarios,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        return jsonify({"error": f"Failed to load scenarios: {str(e)}"}), 500
+    timestamp = datetime.now().isoformat().encode()
+    return json_bytes_response(
+        b'{"scenarios":' + _SCENARIOS_JSON + b',"timestamp":"' + timestamp + b'"}'
+    )
 
 @app.route('/api/meteor-madness/real-time-data')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_LIVE, response_filter=cacheable_response)
 def get_real_time_asteroid_data():
     """Fetch real-time asteroid data from NASA APIs"""
     try:
-        # Get current close approaches
-        close_approaches = get_close_approach_data()
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        tomorrow = (now + timedelta(days=1)).strftime('%Y-%m-%d')
         
-        # Get asteroid feed
-        today = datetime.now().strftime('%Y-%m-%d')
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        asteroid_feed = nasa_client.get_asteroid_data(today, tomorrow)
+        # Fetch close approaches and the daily feed concurrently
+        close_approaches_future = _EXECUTOR.submit(get_close_approach_data)
+        asteroid_feed_future = _EXECUTOR.submit(nasa_client.get_asteroid_data, today, tomorrow)
+        close_approaches = close_approaches_future.result()
+        asteroid_feed = asteroid_feed_future.result()
         
         # Process and enhance the data
         enhanced_data = {
@@ -260,7 +343,7 @@ def get_real_time_asteroid_data():
             'daily_feed': asteroid_feed,
             'threat_assessment': assess_current_threats(close_approaches),
             'observation_recommendations': generate_observation_recommendations(),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         return jsonify(enhanced_data)
@@ -270,33 +353,48 @@ def get_real_time_asteroid_data():
 
 def assess_current_threats(close_approaches):
     """Assess current asteroid threats"""
-    threats = []
+    names, diameters, velocities, miss_distances = [], [], [], []
     
     for approach in close_approaches.get('data', []):
         try:
             # Extract relevant data
             name = approach.get('name', 'Unknown')
             diameter_min = float(approach.get('estimated_diameter', {}).get('meters', {}).get('estimated_diameter_min', 0))
-            velocity = float(approach.get('close_approach_data', [{}])[0].get('relative_velocity', {}).get('kilometers_per_second', 0))
-            miss_distance = float(approach.get('close_approach_data', [{}])[0].get('miss_distance', {}).get('kilometers', float('inf')))
-            
-            # Calculate threat level
-            threat_score = calculate_threat_score(diameter_min, velocity, miss_distance)
-            
-            if threat_score > 0.5:  # Significant threat
-                threats.append({
-                    'name': name,
-                    'threat_score': threat_score,
-                    'diameter': diameter_min,
-                    'velocity': velocity,
-                    'miss_distance': miss_distance,
-                    'recommendation': get_threat_recommendation(threat_score)
-                })
-                
-        except (KeyError, ValueError, TypeError):
+            close_approach = approach.get('close_approach_data', [{}])[0]
+            velocity = float(close_approach.get('relative_velocity', {}).get('kilometers_per_second', 0))
+            miss_distance = float(close_approach.get('miss_distance', {}).get('kilometers', float('inf')))
+        except (KeyError, ValueError, TypeError, IndexError, AttributeError):
             continue  # Skip malformed data
+        names.append(name)
+        diameters.append(diameter_min)
+        velocities.append(velocity)
+        miss_distances.append(miss_distance)
+    
+    if not names:
+        return []
+    
+    diameters = np.array(diameters, dtype=np.float64)
+    velocities = np.array(velocities, dtype=np.float64)
+    miss_distances = np.array(miss_distances, dtype=np.float64)
+    scores = calculate_threat_scores(diameters, velocities, miss_distances)
     
-    return sorted(threats, key=lambda x: x['threat_score'], reverse=True)
+    # Filter to significant threats before ranking so Python only touches survivors
+    significant = np.flatnonzero(scores > 0.5)
+    ranked = significant[np.argsort(-scores[significant], kind='stable')]
+    
+    threats = []
+    for i in ranked:
+        threat_score = float(scores[i])
+        threats.append({
+            'name': names[i],
+            'threat_score': threat_score,
+            'diameter': float(diameters[i]),
+            'velocity': float(velocities[i]),
+            'miss_distance': float(miss_distances[i]),
+            'recommendation': get_threat_recommendation(threat_score)
+        })
+    
+    return threats
 
 def calculate_threat_score(diameter, velocity, miss_distance):
     """Calculate a normalized threat score (0-1)"""
@@ -308,6 +406,16 @@ def calculate_threat_score(diameter, velocity, miss_distance):
     # Weighted threat score
     return (size_factor * 0.4 + velocity_factor * 0.3 + distance_factor * 0.3)
 
+# The explicit signature compiles at import, so the first request isn't cold
+@njit('float64[:](float64[:], float64[:], float64[:])', cache=True)
+def calculate_threat_scores(diameters, velocities, miss_distances):
+    """Vectorized calculate_threat_score over float64 NumPy arrays"""
+    size_factor = np.minimum(1, diameters / 1000)
+    velocity_factor = np.minimum(1, velocities / 70)
+    distance_factor = np.maximum(0, 1 - miss_distances / 7500000)
+    
+    return (size_factor * 0.4 + velocity_factor * 0.3 + distance_factor * 0.3)
+
 def get_threat_recommendation(threat_score):
     """Get recommendation based on threat score"""
     if threat_score > 0.8:
@@ -319,20 +427,22 @@ def get_threat_recommendation(threat_score):
     else:
         return "Standard monitoring protocol"
 
+OBSERVATION_RECOMMENDATIONS = {
+    'priority_targets': ['2023 DZ2', '2021 PDC', 'Apophis'],
+    'observation_windows': {
+        'optimal': 'Next 7 days - New moon phase',
+        'backup': 'Following 14 days - Partial moon'
+    },
+    'recommended_facilities': [
+        'Arecibo Observatory (if available)',
+        'Goldstone Deep Space Communications Complex',
+        'Catalina Sky Survey'
+    ]
+}
+
 def generate_observation_recommendations():
-    """Generate current observation recommendations"""
-    return {
-        'priority_targets': ['2023 DZ2', '2021 PDC', 'Apophis'],
-        'observation_windows': {
-            'optimal': 'Next 7 days - New moon phase',
-            'backup': 'Following 14 days - Partial moon'
-        },
-        'recommended_facilities': [
-            'Arecibo Observatory (if available)',
-            'Goldstone Deep Space Communications Complex',
-            'Catalina Sky Survey'
-        ]
-    }
+    """Generate current observation recommendations (shared, read-only)"""
+    return OBSERVATION_RECOMMENDATIONS
 
 @app.route('/api/asteroid/<asteroid_id>')
 def asteroid_detail(asteroid_id):
@@ -387,6 +497,7 @@ def calculate_deflection():
 # === COMPREHENSIVE SPACE DATA ROUTES ===
 
 @app.route('/api/apod')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, query_string=True, response_filter=cacheable_response)
 def astronomy_picture():
     """Get Astronomy Picture of the Day"""
     date = request.args.get('date')
@@ -398,7 +509,43 @@ def astronomy_picture():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/apod/image')
+@typed_args(date=str)
+def astronomy_picture_image(date):
+    """Serve the APOD image for a date from the local image cache"""
+    date = date or datetime.now().strftime('%Y-%m-%d')
+    try:
+        # Only canonical YYYY-MM-DD, since the date also names the cached file
+        if datetime.fromisoformat(date).date().isoformat() != date:
+            raise ValueError(date)
+    except ValueError:
+        return jsonify({"error": "date must be YYYY-MM-DD"}), 400
+    
+    try:
+        cache_dir = app.config['APOD_IMAGE_CACHE_DIR']
+        path = nasa_client.cached_apod_image(date, cache_dir)
+        
+        if path is None:
+            apod = nasa_client.get_apod(date=date)
+            if 'error' in apod:
+                return jsonify(apod), 502
+            if apod.get('media_type') != 'image':
+                return jsonify({"error": f"APOD for {date} is not an image"}), 404
+            path = nasa_client.download_apod_image(date, apod['url'], cache_dir)
+        
+        accel_prefix = app.config['APOD_IMAGE_ACCEL_PREFIX']
+        if accel_prefix:
+            # nginx streams the file (and handles conditional requests); Flask only sends headers
+            response = app.response_class(mimetype=mimetypes.guess_type(path)[0])
+            response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{os.path.basename(path)}"
+            return response
+        
+        return send_file(path, conditional=True, max_age=86400)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/mars')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, query_string=True, response_filter=cacheable_response)
 def mars_data():
     """Get comprehensive Mars data"""
     rover = request.args.get('rover', 'curiosity')
@@ -406,8 +553,10 @@ def mars_data():
     earth_date = request.args.get('earth_date')
     
     try:
-        photos = nasa_client.get_mars_rover_photos(rover, sol, earth_date)
-        rover_info = nasa_client.get_mars_rover_info(rover)
+        photos_future = _EXECUTOR.submit(nasa_client.get_mars_rover_photos, rover, sol, earth_date)
+        rover_info_future = _EXECUTOR.submit(nasa_client.get_mars_rover_info, rover)
+        photos = photos_future.result()
+        rover_info = rover_info_future.result()
         
         return jsonify({
             'photos': photos,
@@ -418,12 +567,9 @@ def mars_data():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/earth')
-def earth_imagery():
+@typed_args(lat=float, lon=float, date=str)
+def earth_imagery(lat, lon, date):
     """Get Earth satellite imagery"""
-    lat = request.args.get('lat', type=float)
-    lon = request.args.get('lon', type=float)
-    date = request.args.get('date')
-    
     if lat is None or lon is None:
         return jsonify({"error": "Latitude and longitude required"}), 400
     
@@ -439,6 +585,7 @@ def earth_imagery():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/epic')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, query_string=True, response_filter=cacheable_response)
 def epic_images():
     """Get EPIC Earth images"""
     date = request.args.get('date')
@@ -456,19 +603,14 @@ def epic_images():
 def iss_live():
     """Get real-time ISS data"""
     try:
-        data = space_tracker.get_iss_real_time()
-        return jsonify(data)
+        return json_bytes_response(_ISS_SNAPSHOT.get())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/iss/passes')
-def iss_passes():
+@typed_args(lat=(float, 0), lon=(float, 0), alt=(float, 0), days=(int, 5))
+def iss_passes(lat, lon, alt, days):
     """Get ISS passes for location"""
-    lat = request.args.get('lat', type=float, default=0)
-    lon = request.args.get('lon', type=float, default=0)
-    alt = request.args.get('alt', type=float, default=0)
-    days = request.args.get('days', type=int, default=5)
-    
     try:
         passes = space_tracker.get_iss_passes(lat, lon, alt, days)
         return jsonify(passes)
@@ -492,8 +634,7 @@ def satellites():
 def people_in_space():
     """Get people currently in space"""
     try:
-        data = nasa_client.get_people_in_space()
-        return jsonify(data)
+        return json_bytes_response(_PEOPLE_IN_SPACE_SNAPSHOT.get())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -502,92 +643,64 @@ def people_in_space():
 @app.route('/api/planets')
 def planets():
     """Get all planets information"""
-    try:
-        planets_data = solar_system_db.get_all_planets()
-        return jsonify([planet.__dict__ for planet in planets_data])
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return json_bytes_response(_PLANETS_JSON)
 
 @app.route('/api/planet/<planet_name>')
 def planet_detail(planet_name):
     """Get detailed planet information"""
-    try:
-        planet = solar_system_db.get_planet_info(planet_name)
-        if planet:
-            return jsonify(planet.__dict__)
-        else:
-            return jsonify({"error": f"Planet {planet_name} not found"}), 404
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    planet = _PLANET_JSON.get(planet_name.lower())
+    if planet:
+        return json_bytes_response(planet)
+    else:
+        return jsonify({"error": f"Planet {planet_name} not found"}), 404
 
 @app.route('/api/moons')
 def moons():
     """Get all moons information"""
-    try:
-        return jsonify({name: moon.__dict__ for name, moon in solar_system_db.moons.items()})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return json_bytes_response(_MOONS_JSON)
 
 @app.route('/api/dwarf-planets')
 def dwarf_planets():
     """Get dwarf planets information"""
-    try:
-        return jsonify({name: planet.__dict__ for name, planet in solar_system_db.dwarf_planets.items()})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return json_bytes_response(_DWARF_PLANETS_JSON)
 
 @app.route('/api/missions')
 def space_missions():
     """Get space missions information"""
     country = request.args.get('country')
     
-    try:
-        if country:
-            missions = solar_system_db.get_missions_by_country(country)
-            return jsonify([mission.__dict__ for mission in missions])
-        else:
-            return jsonify({name: mission.__dict__ for name, mission in solar_system_db.missions.items()})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    if country:
+        return json_bytes_response(_MISSIONS_BY_COUNTRY_JSON.get(country.upper(), b'[]'))
+    else:
+        return json_bytes_response(_MISSIONS_JSON)
 
 # === STELLARIUM-LIKE SKY VIEW ===
 
 @app.route('/api/sky-view')
-def sky_view():
+@typed_args(lat=(float, 0), lon=(float, 0), elevation=(float, 0), time=str)
+def sky_view(lat, lon, elevation, time):
     """Get Stellarium-like sky view"""
-    lat = request.args.get('lat', type=float, default=0)
-    lon = request.args.get('lon', type=float, default=0)
-    elevation = request.args.get('elevation', type=float, default=0)
-    time_str = request.args.get('time')
-    
     try:
-        stellarium_engine.set_observer_location(lat, lon, elevation)
-        
-        if time_str:
-            observation_time = datetime.fromisoformat(time_str)
-            stellarium_engine.set_observation_time(observation_time)
-        
-        sky_data = stellarium_engine.get_sky_view()
-        return jsonify(sky_data)
+        observation_time = datetime.fromisoformat(time) if time else None
+        sky_data = stellarium_engine.get_sky_view(lat, lon, elevation, observation_time)
+        return app.json.stream_response(sky_data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/sky-view/planets')
-def sky_planets():
+@typed_args(lat=(float, 0), lon=(float, 0))
+def sky_planets(lat, lon):
     """Get planet positions in sky"""
-    lat = request.args.get('lat', type=float, default=0)
-    lon = request.args.get('lon', type=float, default=0)
-    
     try:
-        stellarium_engine.set_observer_location(lat, lon)
-        sky_data = stellarium_engine.get_sky_view()
-        return jsonify(sky_data['planets'])
+        sky_data = stellarium_engine.get_sky_view(lat, lon)
+        return app.json.stream_response(sky_data['planets'])
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 # === EXOPLANETS ===
 
 @app.route('/api/exoplanets')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, query_string=True, response_filter=cacheable_response)
 def exoplanets():
     """Get exoplanet data"""
     limit = request.args.get('limit', type=int, default=100)
@@ -601,6 +714,7 @@ def exoplanets():
 # === REAL-TIME EVENTS ===
 
 @app.route('/api/events/live')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_EVENTS, response_filter=cacheable_response)
 def live_events():
     """Get current space events"""
     try:
@@ -612,6 +726,7 @@ def live_events():
 # === SEARCH FUNCTIONALITY ===
 
 @app.route('/api/search')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_STATIC, query_string=True, response_filter=cacheable_response)
 def search():
     """Search across all space data"""
     query = request.args.get('q', '')
@@ -621,15 +736,10 @@ def search():
         results = {}
         
         if category in ['all', 'bodies']:
-            results['celestial_bodies'] = [
-                body.__dict__ for body in solar_system_db.search_celestial_bodies(query)
-            ]
+            results['celestial_bodies'] = solar_system_db.search_celestial_bodies(query)
         
         if category in ['all', 'missions']:
-            results['missions'] = [
-                mission.__dict__ for mission in solar_system_db.missions.values()
-                if query.lower() in mission.name.lower() or query.lower() in mission.country.lower()
-            ]
+            results['missions'] = solar_system_db.search_missions(query)
         
         return jsonify(results)
     except Exception as e:
@@ -637,18 +747,22 @@ def search():
 
 # === COUNTRY-SPECIFIC DATA ===
 
+_COUNTRIES_JSON = app.json.dumps_bytes(config.Config.SPACE_AGENCIES)
+_COUNTRIES_ETAG = body_etag(_COUNTRIES_JSON)
+
 @app.route('/api/countries')
 def space_agencies():
     """Get space agencies by country"""
-    return jsonify(config.Config.SPACE_AGENCIES)
+    return json_bytes_response(_COUNTRIES_JSON, _COUNTRIES_ETAG)
 
 @app.route('/api/country/<country>/missions')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_STATIC, response_filter=cacheable_response)
 def country_missions(country):
     """Get missions by country"""
     try:
         data = nasa_client.get_country_missions(country.upper())
         missions = solar_system_db.get_missions_by_country(country)
-        data['detailed_missions'] = [mission.__dict__ for mission in missions]
+        data['detailed_missions'] = missions
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -694,19 +808,15 @@ def calculate_impact_physics():
     }
     """
     try:
-        data = request.get_json()
-        
-        diameter = float(data.get('diameter', 100))
-        velocity = float(data.get('velocity', 20))
-        density = float(data.get('density', 3000))
-        angle = float(data.get('angle', 45))
-        target_type = data.get('target_type', 'land')
+        params = PhysicsImpactRequest.model_validate_json(request.get_data())
         
         # Calculate impact
-        results = calc_impact_physics(diameter, velocity, density, angle, target_type)
+        results = calc_impact_physics(**params.model_dump())
         
         return jsonify(results)
     
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -726,15 +836,15 @@ def impact_scenario():
     }
     """
     try:
-        data = request.get_json()
+        body = ImpactScenarioRequest.model_validate_json(request.get_data())
         
-        asteroid_id = data.get('asteroid_id', 'Unknown')
-        latitude = float(data.get('latitude', 0))
-        longitude = float(data.get('longitude', 0))
-        impact_date = data.get('impact_date', datetime.now().strftime('%Y-%m-%d'))
-        diameter = float(data.get('diameter', 100))
-        velocity = float(data.get('velocity', 20))
-        target_type = data.get('target_type', 'land')
+        asteroid_id = body.asteroid_id
+        latitude = body.latitude
+        longitude = body.longitude
+        impact_date = body.impact_date or datetime.now().strftime('%Y-%m-%d')
+        diameter = body.diameter
+        velocity = body.velocity
+        target_type = body.target_type
         
         # Calculate impact physics
         impact_results = calc_impact_physics(diameter, velocity, 3000, 45, target_type)
@@ -763,6 +873,8 @@ def impact_scenario():
         
         return jsonify(scenario)
     
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -782,25 +894,21 @@ def simulate_deflection():
     }
     """
     try:
-        data = request.get_json()
-        
-        diameter = float(data.get('asteroid_diameter', 300))
-        velocity = float(data.get('asteroid_velocity', 15))
-        warning_years = float(data.get('warning_years', 10))
-        impact_date_str = data.get('impact_date', '2035-01-01')
-        strategy = data.get('strategy', 'kinetic_impactor')
-        mission_duration = float(data.get('mission_duration_years', 5))
+        body = DeflectionScenarioRequest.model_validate_json(request.get_data())
         
-        # Parse impact date
-        impact_date = datetime.strptime(impact_date_str, '%Y-%m-%d')
+        # The schema already parsed the date; the models work in datetimes
+        impact_date = datetime.combine(body.impact_date, datetime.min.time())
         
         # Run simulation
         results = simulate_deflection_scenario(
-            diameter, velocity, warning_years, impact_date, strategy, mission_duration
+            body.asteroid_diameter, body.asteroid_velocity, body.warning_years,
+            impact_date, body.strategy, body.mission_duration_years
         )
         
         return jsonify(results)
     
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -818,22 +926,16 @@ def compare_deflection_strategies():
     }
     """
     try:
-        data = request.get_json()
+        body = DeflectionCompareRequest.model_validate_json(request.get_data())
+        diameter = body.asteroid_diameter
+        velocity = body.asteroid_velocity
+        warning_years = body.warning_years
         
-        diameter = float(data.get('asteroid_diameter', 300))
-        velocity = float(data.get('asteroid_velocity', 15))
-        warning_years = float(data.get('warning_years', 10))
-        impact_date_str = data.get('impact_date', '2035-01-01')
+        # The schema already parsed the date; the models work in datetimes
+        impact_date = datetime.combine(body.impact_date, datetime.min.time())
         
-        # Parse impact date
-        impact_date = datetime.strptime(impact_date_str, '%Y-%m-%d')
-        
-        # Calculate asteroid mass
-        import math
-        radius = diameter / 2
-        volume = (4/3) * math.pi * (radius ** 3)
-        density = 3000  # kg/m³
-        mass = volume * density
+        # Calculate asteroid mass (3000 kg/m³ rocky body)
+        mass = asteroid_mass(diameter)
         
         # Create mission
         launch_date = impact_date - timedelta(days=warning_years * 365.25)
@@ -853,6 +955,8 @@ def compare_deflection_strategies():
         
         return jsonify(comparison)
     
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -868,6 +972,8 @@ def threat_assessment(asteroid_id):
         
         if not asteroid_data:
             return jsonify({"error": "Asteroid not found"}), 404
+        if 'error' in asteroid_data:
+            return jsonify(asteroid_data), 502
         
         # Extract parameters
         diameter = asteroid_data.get('estimated_diameter', {}).get('meters', {}).get('estimated_diameter_max', 100)
@@ -885,15 +991,18 @@ def threat_assessment(asteroid_id):
         elif miss_distance < earth_radius * 100:
             threat_level = 'MODERATE'
         
-        # Calculate potential impact
-        impact_calc = calc_impact_physics(diameter, velocity, 3000, 45, 'land')
+        # Impact and deflection models are independent, so run them side by side
+        impact_future = _EXECUTOR.submit(calc_impact_physics, diameter, velocity, 3000, 45, 'land')
         
         # Simulate deflection options (assuming 10 years warning)
         impact_date = datetime.now() + timedelta(days=10*365)
-        deflection_options = simulate_deflection_scenario(
-            diameter, velocity, 10, impact_date, 'kinetic_impactor', 5
+        deflection_future = _EXECUTOR.submit(
+            simulate_deflection_scenario, diameter, velocity, 10, impact_date, 'kinetic_impactor', 5
         )
         
+        impact_calc = impact_future.result()
+        deflection_options = deflection_future.result()
+        
         assessment = {
             'asteroid_id': asteroid_id,
             'name': asteroid_data.get('name', 'Unknown'),
@@ -918,69 +1027,116 @@ def threat_assessment(asteroid_id):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-@app.route('/api/impactor-2025')
-def impactor_2025_scenario():
+# Miss-distance thresholds (10, 50 and 100 Earth radii) used by threat_assessment
+_THREAT_DISTANCE_BINS_KM = np.array([10, 50, 100]) * 6371.0
+_THREAT_LEVELS = np.array(['CRITICAL', 'HIGH', 'MODERATE', 'LOW'])
+
+@app.route('/api/asteroids/threat-batch', methods=['POST'])
+def threat_batch():
     """
-    Special endpoint for the challenge's "Impactor-2025" scenario
-    Pre-configured threat scenario
+    Classify many asteroids by miss distance in one call
+    
+    POST body:
+    {
+        "ids": ["2000433", "3542519"],
+        "miss_km": [45000, 2500000]
+    }
     """
     try:
-        # Fictional but realistic Impactor-2025 parameters
-        scenario = {
-            'asteroid_id': 'IMPACTOR-2025',
-            'name': 'Impactor-2025 (Fictional Scenario)',
-            'discovery_date': '2025-01-15',
-            'impact_probability': 0.87,  # 87% chance
-            'predicted_impact_date': '2035-08-22',
-            'warning_time_years': 10,
-            
-            'physical_characteristics': {
-                'diameter_m': 450,
-                'estimated_mass_kg': 4.297e11,  # ~430 million tonnes
-                'composition': 'Rocky (S-type)',
-                'rotation_period_hours': 8.4
-            },
-            
-            'orbital_parameters': {
-                'velocity_kms': 18.5,
-                'impact_angle_degrees': 45,
-                'predicted_location': {
-                    'latitude': 35.6762,
-                    'longitude': 139.6503,
-                    'location_name': 'Tokyo Bay, Pacific Ocean'
-                }
-            }
-        }
-        
-        # Calculate impact effects
-        impact_results = calc_impact_physics(450, 18.5, 3000, 45, 'water')
-        
-        # Calculate deflection options
-        impact_date = datetime(2035, 8, 22)
-        deflection_analysis = simulate_deflection_scenario(
-            450, 18.5, 10, impact_date, 'kinetic_impactor', 3
-        )
+        batch = ThreatBatchRequest.model_validate_json(request.get_data())
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
+    
+    levels = _THREAT_LEVELS[np.digitize(batch.miss_km, _THREAT_DISTANCE_BINS_KM)]
+    return jsonify({
+        'ids': batch.ids,
+        'threat_levels': levels.tolist(),
+        'count': len(batch.ids)
+    })
+
+def build_impactor_2025_scenario():
+    """Build the challenge's "Impactor-2025" scenario (all inputs are constants)"""
+    # Fictional but realistic Impactor-2025 parameters
+    scenario = {
+        'asteroid_id': 'IMPACTOR-2025',
+        'name': 'Impactor-2025 (Fictional Scenario)',
+        'discovery_date': '2025-01-15',
+        'impact_probability': 0.87,  # 87% chance
+        'predicted_impact_date': '2035-08-22',
+        'warning_time_years': 10,
+        
+        'physical_characteristics': {
+            'diameter_m': 450,
+            'estimated_mass_kg': 4.297e11,  # ~430 million tonnes
+            'composition': 'Rocky (S-type)',
+            'rotation_period_hours': 8.4
+        },
         
-        # Complete scenario
-        complete_scenario = {
-            **scenario,
-            'impact_analysis': impact_results,
-            'deflection_options': deflection_analysis,
-            'status': 'ACTIVE THREAT',
-            'recommended_action': 'IMMEDIATE DEFLECTION MISSION REQUIRED',
-            'story': {
-                'discovery': 'Discovered by Pan-STARRS telescope on January 15, 2025',
-                'initial_assessment': 'Orbital refinement over 90 days increased impact probability from 3% to 87%',
-                'threat_level': 'Regional catastrophe if impact occurs',
-                'decision_point': 'International space agencies must decide on deflection strategy within 6 months',
-                'public_status': 'Information released to public after confirmation'
+        'orbital_parameters': {
+            'velocity_kms': 18.5,
+            'impact_angle_degrees': 45,
+            'predicted_location': {
+                'latitude': 35.6762,
+                'longitude': 139.6503,
+                'location_name': 'Tokyo Bay, Pacific Ocean'
             }
         }
-        
-        return jsonify(complete_scenario)
+    }
     
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    # Calculate impact effects
+    impact_results = calc_impact_physics(450, 18.5, 3000, 45, 'water')
+    
+    # Calculate deflection options
+    impact_date = datetime(2035, 8, 22)
+    deflection_analysis = simulate_deflection_scenario(
+        450, 18.5, 10, impact_date, 'kinetic_impactor', 3
+    )
+    
+    # Complete scenario
+    scenario.update({
+        'impact_analysis': impact_results,
+        'deflection_options': deflection_analysis,
+        'status': 'ACTIVE THREAT',
+        'recommended_action': 'IMMEDIATE DEFLECTION MISSION REQUIRED',
+        'story': {
+            'discovery': 'Discovered by Pan-STARRS telescope on January 15, 2025',
+            'initial_assessment': 'Orbital refinement over 90 days increased impact probability from 3% to 87%',
+            'threat_level': 'Regional catastrophe if impact occurs',
+            'decision_point': 'International space agencies must decide on deflection strategy within 6 months',
+            'public_status': 'Information released to public after confirmation'
+        }
+    })
+    
+    return scenario
+
+# Every input is fixed, so the physics runs once at startup and the bytes are reused
+_IMPACTOR_2025_JSON = precompress(app.json.dumps_bytes(build_impactor_2025_scenario()))
+
+@app.route('/api/impactor-2025')
+def impactor_2025_scenario():
+    """
+    Special endpoint for the challenge's "Impactor-2025" scenario
+    Pre-configured threat scenario
+    """
+    return precompressed_json_response(_IMPACTOR_2025_JSON)
+
+@lru_cache(maxsize=8192)
+def _binned_deflection_scenario(diameter_bin, velocity_bin, warning_bin, strategy):
+    # Launch date is derived from the impact date, so the result depends only on
+    # the warning window. A fixed impact date (epoch 0) keeps the keys of the
+    # mitigation memo stable across calls
+    return simulate_deflection_scenario(
+        diameter_bin, velocity_bin, warning_bin, 0.0, strategy, 3
+    )
+
+def game_deflection_scenario(diameter, velocity, warning_years, strategy):
+    """Deflection scenario for the game, memoized on 10 m / 0.5 km/s / 0.5 year bins"""
+    return _binned_deflection_scenario(
+        round(diameter / 10) * 10, round(velocity * 2) / 2, round(warning_years * 2) / 2, strategy
+    )
+
+leaderboard = Leaderboard(config.Config.LEADERBOARD_REDIS_URL, config.Config.LEADERBOARD_SIZE)
+_LEADERBOARD_WRITER = BackgroundWriter(leaderboard.add, 'leaderboard-writer').start()
 
 @app.route('/api/gamification/defend-earth', methods=['POST'])
 def defend_earth_game():
@@ -1005,18 +1161,12 @@ def defend_earth_game():
         budget = float(data.get('budget_million_usd', 500))
         
         # Generate random asteroid if not specified
-        import random
         diameter = random.randint(100, 800)
         velocity = random.uniform(12, 30)
         warning_years = random.uniform(3, 20)
         
-        # Calculate if player's choices would work
-        impact_date = datetime.now() + timedelta(days=warning_years * 365)
-        
-        # Check if timing is appropriate
-        deflection_result = simulate_deflection_scenario(
-            diameter, velocity, launch_timing, impact_date, strategy, 3
-        )
+        # Check if the player's choices would work
+        deflection_result = game_deflection_scenario(diameter, velocity, launch_timing, strategy)
         
         strategy_data = deflection_result['strategies'][strategy]
         required_budget = strategy_data['mission_cost_million_usd']
@@ -1070,24 +1220,40 @@ def defend_earth_game():
             }
         }
         
+        # Persist the score off the request path
+        _LEADERBOARD_WRITER.put(game_result['leaderboard_entry'])
+        
         return jsonify(game_result)
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/gamification/leaderboard')
+@typed_args(limit=(int, 10))
+def game_leaderboard(limit):
+    """Top defend-earth scores"""
+    try:
+        return jsonify({'leaderboard': leaderboard.top(max(1, min(limit, config.Config.LEADERBOARD_SIZE)))})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 def calculate_affected_regions(lat, lon, crater_radius_km, blast_effects):
     """Helper function to calculate affected regions"""
-    regions = []
+    effects = list(blast_effects.values())
+    
+    # Classify every blast ring at once
+    pressures = np.array([effect_data['overpressure_psi'] for effect_data in effects], dtype=float)
+    severities = np.select([pressures > 10, pressures > 5], ['extreme', 'high'], 'moderate').tolist()
     
-    for distance_km, effect_data in blast_effects.items():
-        regions.append({
+    return [
+        {
             'distance_km': distance_km,
             'radius_from_impact': distance_km,
             'effect': effect_data['effect'],
-            'severity': 'extreme' if effect_data['overpressure_psi'] > 10 else 'high' if effect_data['overpressure_psi'] > 5 else 'moderate'
-        })
-    
-    return regions
+            'severity': severity
+        }
+        for distance_km, effect_data, severity in zip(blast_effects, effects, severities)
+    ]
 
 def generate_evacuation_zones(lat, lon, calculations):
     """Helper function to generate evacuation zones"""
@@ -1146,15 +1312,19 @@ def generate_threat_recommendation(threat_level, diameter, miss_distance):
 # === ENHANCED NASA & PARTNER AGENCY INTEGRATION ===
 
 @app.route('/api/enhanced-nasa/small-body-database/<object_name>')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_STATIC, response_filter=cacheable_response)
 def get_small_body_data(object_name):
     """Get detailed data from NASA's Small-Body Database"""
     try:
         data = enhanced_nasa_client.get_small_body_database_query(object_name)
+        if 'error' in data:
+            return jsonify(data), 502
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch small body data: {str(e)}"}), 500
 
 @app.route('/api/enhanced-nasa/horizons-ephemeris')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_STATIC, query_string=True, response_filter=cacheable_response)
 def get_horizons_ephemeris():
     """Get precise ephemeris data from JPL Horizons"""
     target = request.args.get('target', 'Apophis')
@@ -1167,29 +1337,35 @@ def get_horizons_ephemeris():
         data = enhanced_nasa_client.get_horizons_ephemeris(
             target, observer, start_time, stop_time, step_size
         )
+        if 'error' in data:
+            return jsonify(data), 502
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch ephemeris data: {str(e)}"}), 500
 
 @app.route('/api/enhanced-nasa/near-earth-comets')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, query_string=True, response_filter=cacheable_response)
 def get_near_earth_comets():
     """Get Near-Earth Comets orbital elements from NASA Open Data Portal"""
     try:
         data = enhanced_nasa_client.get_near_earth_comets()
+        if isinstance(data, dict) and 'error' in data:
+            return jsonify(data), 502
         return jsonify(data)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch comet data: {str(e)}"}), 500
 
+_ENHANCED_IMPACTOR_2025_JSON = precompress(
+    app.json.dumps_bytes(enhanced_nasa_client.create_impactor_2025_scenario())
+)
+
 @app.route('/api/enhanced-nasa/impactor-2025-scenario')
 def get_impactor_2025_scenario():
     """Get the enhanced Impactor-2025 scenario with realistic orbital mechanics"""
-    try:
-        scenario = enhanced_nasa_client.create_impactor_2025_scenario()
-        return jsonify(scenario)
-    except Exception as e:
-        return jsonify({"error": f"Failed to create scenario: {str(e)}"}), 500
+    return precompressed_json_response(_ENHANCED_IMPACTOR_2025_JSON)
 
 @app.route('/api/usgs/earthquake-catalog')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_EVENTS, query_string=True, response_filter=cacheable_response)
 def get_earthquake_catalog():
     """Get earthquake data from USGS NEIC catalog"""
     start_date = request.args.get('start_date')
@@ -1197,8 +1373,14 @@ def get_earthquake_catalog():
     min_magnitude = float(request.args.get('min_magnitude', 5.0))
     
     try:
-        data = usgs_seismic.get_earthquake_catalog(start_date, end_date, min_magnitude)
-        return jsonify(data)
+        # USGS already sends JSON, so pass its bytes through instead of decoding and re-encoding
+        raw, etag = usgs_seismic.get_earthquake_catalog_raw(start_date, end_date, min_magnitude)
+        response = json_bytes_response(raw)
+        if etag:
+            response.headers['ETag'] = etag
+        return response
+    except requests.RequestException as e:
+        return jsonify({"error": f"USGS API request failed: {str(e)}"}), 502
     except Exception as e:
         return jsonify({"error": f"Failed to fetch earthquake data: {str(e)}"}), 500
 
@@ -1218,6 +1400,7 @@ def calculate_impact_seismic_equivalent():
         return jsonify({"error": f"Failed to calculate seismic equivalent: {str(e)}"}), 500
 
 @app.route('/api/csa/neossat-observations')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_NASA, response_filter=cacheable_response)
 def get_neossat_observations():
     """Get NEOSSAT observation data from Canadian Space Agency"""
     try:
@@ -1227,6 +1410,7 @@ def get_neossat_observations():
         return jsonify({"error": f"Failed to fetch NEOSSAT data: {str(e)}"}), 500
 
 @app.route('/api/enhanced-nasa/integrated-resources')
+@cache.cached(timeout=config.Config.CACHE_TIMEOUT_EVENTS, response_filter=cacheable_response)
 def get_integrated_resources():
     """Get all integrated NASA and partner agency resources"""
     try:
@@ -1266,125 +1450,188 @@ def calculate_orbital_position():
     except Exception as e:
         return jsonify({"error": f"Failed to calculate orbital position: {str(e)}"}), 500
 
+@app.route('/api/enhanced-nasa/orbital-trajectory', methods=['POST'])
+def calculate_orbital_trajectory():
+    """
+    Positions along a Keplerian orbit, sampled every step_days
+    
+    POST body: the orbital-position elements plus
+    {
+        "start_julian_date": 2460000.5,  // defaults to now
+        "days": 365,
+        "step_days": 1
+    }
+    """
+    try:
+        body = OrbitalTrajectoryRequest.model_validate_json(request.get_data())
+        elements = KeplerianElements(
+            semi_major_axis=body.semi_major_axis,
+            eccentricity=body.eccentricity,
+            inclination=body.inclination,
+            longitude_ascending_node=body.longitude_ascending_node,
+            argument_periapsis=body.argument_periapsis,
+            mean_anomaly=body.mean_anomaly,
+            epoch=body.epoch
+        )
+        
+        start = body.start_julian_date
+        if start is None:
+            start = enhanced_nasa_client.datetime_to_julian(datetime.now())
+        julian_dates = start + np.arange(0, body.days + body.step_days / 2, body.step_days)
+        positions = enhanced_nasa_client.calculate_orbital_trajectory(elements, julian_dates)
+        
+        return jsonify({
+            'julian_dates': julian_dates,
+            'positions': positions,
+            'count': len(julian_dates),
+            'calculation_method': 'Keplerian orbital mechanics',
+            'coordinate_system': 'Heliocentric ecliptic'
+        })
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
+    except Exception as e:
+        return jsonify({"error": f"Failed to calculate orbital trajectory: {str(e)}"}), 500
+
 # === PROFESSIONAL API ENDPOINTS ===
 
+# Only the timestamps change between requests, so the body is encoded once
+_SYSTEM_STATUS_TEMPLATE = app.json.dumps_bytes({
+    "timestamp": "{TS}",
+    "systems": {
+        "nasa_api": {
+            "status": "operational",
+            "last_check": "{TS}",
+            "response_time": "< 100ms"
+        },
+        "enhanced_integration": {
+            "status": "operational", 
+            "data_sources": 6,
+            "last_update": "{TS}"
+        },
+        "visualization_engine": {
+            "status": "operational",
+            "3d_renderer": "WebGL",
+            "map_system": "Leaflet"
+        },
+        "impact_calculator": {
+            "status": "operational",
+            "physics_models": "advanced",
+            "accuracy": "99.9%"
+        }
+    },
+    "statistics": {
+        "tracked_asteroids": 34127,
+        "processed_simulations": 15678,
+        "uptime_hours": 8760,
+        "data_accuracy": 99.9
+    }
+})
+
 @app.route('/api/professional/system-status')
 def professional_system_status():
     """Get comprehensive system status for professional dashboard"""
-    try:
-        status = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "systems": {
-                "nasa_api": {
-                    "status": "operational",
-                    "last_check": datetime.utcnow().isoformat(),
-                    "response_time": "< 100ms"
-                },
-                "enhanced_integration": {
-                    "status": "operational", 
-                    "data_sources": 6,
-                    "last_update": datetime.utcnow().isoformat()
-                },
-                "visualization_engine": {
-                    "status": "operational",
-                    "3d_renderer": "WebGL",
-                    "map_system": "Leaflet"
-                },
-                "impact_calculator": {
-                    "status": "operational",
-                    "physics_models": "advanced",
-                    "accuracy": "99.9%"
-                }
-            },
-            "statistics": {
-                "tracked_asteroids": 34127,
-                "processed_simulations": 15678,
-                "uptime_hours": 8760,
-                "data_accuracy": 99.9
-            }
-        }
-        return jsonify(status)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    body = _SYSTEM_STATUS_TEMPLATE.replace(b'{TS}', now_iso().encode())
+    return json_bytes_response(body, body_etag(body))
 
 @app.route('/api/professional/impact-assessment', methods=['POST'])
 def professional_impact_assessment():
     """Professional-grade impact assessment with detailed analysis"""
     try:
-        data = request.get_json()
-        
-        # Extract professional parameters
-        asteroid_params = {
-            "diameter": float(data.get('diameter', 100)),
-            "velocity": float(data.get('velocity', 20)),
-            "density": float(data.get('density', 2500)),
-            "angle": float(data.get('angle', 45)),
-            "composition": data.get('composition', 'rocky')
-        }
-        
-        target_params = {
-            "latitude": float(data.get('latitude', 40.7128)),
-            "longitude": float(data.get('longitude', -74.0060)),
-            "terrain_type": data.get('terrain_type', 'land'),
-            "population_density": int(data.get('population_density', 1000))
-        }
+        params = ProfessionalImpactRequest.model_validate_json(request.get_data())
         
-        # Calculate comprehensive impact effects
-        from models.impact_physics import ImpactPhysicsCalculator
-        calculator = ImpactPhysicsCalculator()
+        # The calculator is bound to one parameter set, so run it once and read
+        # every section from the same results
+        calculator = ImpactPhysicsCalculator(ImpactParameters(
+            params.diameter, params.velocity, params.density, params.angle, params.terrain_type
+        ))
+        impact = calculator.calculate_all()
         
         # Professional analysis
         results = {
             "assessment_id": f"PROF-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}",
-            "timestamp": datetime.utcnow().isoformat(),
-            "input_parameters": {**asteroid_params, **target_params},
-            "impact_energy": calculator.calculate_kinetic_energy(
-                asteroid_params['diameter'],
-                asteroid_params['velocity'], 
-                asteroid_params['density']
-            ),
-            "crater_dimensions": calculator.calculate_crater_size(
-                asteroid_params['diameter'],
-                asteroid_params['velocity']
-            ),
+            "timestamp": now_iso(),
+            "input_parameters": params.model_dump(),
+            "impact_energy": {
+                "mass_kg": impact['mass'],
+                "kinetic_energy_joules": impact['kinetic_energy_joules'],
+                "megatons_tnt": impact['kinetic_energy_megatons'],
+                "hiroshima_equivalent": impact['hiroshima_equivalent']
+            },
+            "crater_dimensions": {
+                "diameter_km": impact['crater_diameter_km'],
+                "depth_km": impact['crater_depth_km'],
+                "volume_km3": impact['crater_volume_km3']
+            },
             "damage_zones": {
-                "fireball_radius": calculator.calculate_fireball_radius(asteroid_params['diameter']),
-                "blast_radius": calculator.calculate_blast_radius(asteroid_params['diameter'], asteroid_params['velocity']),
-                "thermal_radius": calculator.calculate_thermal_radius(asteroid_params['diameter'])
+                "blast_effects": impact['blast_effects'],
+                "thermal_effects": impact['thermal_effects']
             },
-            "casualty_estimates": calculator.estimate_casualties(
-                target_params['population_density'],
-                calculator.calculate_blast_radius(asteroid_params['diameter'], asteroid_params['velocity'])
-            ),
+            "casualty_estimates": calculator.estimate_casualties(),
             "seismic_effects": {
-                "magnitude": calculator.calculate_seismic_magnitude(asteroid_params['diameter']),
-                "felt_radius": calculator.calculate_seismic_radius(asteroid_params['diameter'])
+                "magnitude": impact['seismic_magnitude'],
+                "intensities": impact['seismic_intensities']
             },
-            "risk_classification": calculator.classify_risk_level(asteroid_params['diameter']),
+            "risk_classification": calculator.classify_impact(),
             "confidence_level": 0.95,
             "methodology": "Advanced physics modeling with Monte Carlo simulations"
         }
         
         return jsonify(results)
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e), "message": "Professional impact assessment failed"}), 500
 
+# Fixed parts of each recommendation; success_probability is filled per request
+# (the None placeholder keeps the key in its place)
+_KINETIC_STRATEGY = {
+    "method": "Kinetic Impactor",
+    "success_probability": None,
+    "timeline": "3-12 months",
+    "cost_estimate": "$500M - $2B",
+    "technology_readiness": "High (TRL 7-9)",
+    "description": "High-velocity spacecraft collision to alter asteroid trajectory",
+    "requirements": ("International coordination", "Launch capability", "Precision navigation")
+}
+_GRAVITY_TRACTOR_STRATEGY = {
+    "method": "Gravity Tractor",
+    "success_probability": None,
+    "timeline": "1-5 years",
+    "cost_estimate": "$1B - $5B",
+    "technology_readiness": "Medium (TRL 5-7)",
+    "description": "Spacecraft uses gravitational attraction to slowly alter trajectory",
+    "requirements": ("Long-term mission", "Precise positioning", "Extended operations")
+}
+_NUCLEAR_STRATEGY = {
+    "method": "Nuclear Deflection",
+    "success_probability": None,
+    "timeline": "1-6 months",
+    "cost_estimate": "$2B - $10B",
+    "technology_readiness": "High (TRL 8-9)",
+    "description": "Nuclear detonation to disrupt or deflect asteroid",
+    "requirements": ("International treaties", "Nuclear capability", "Emergency authorization")
+}
+_MISSION_READINESS = {
+    "current_capabilities": "Operational for kinetic impactor missions",
+    "development_needed": "Gravity tractor and nuclear systems require additional development",
+    "international_coordination": "Essential for any deflection mission",
+    "estimated_preparation_time": "6-18 months for kinetic, 2-5 years for gravity tractor"
+}
+
 @app.route('/api/professional/mitigation-strategies', methods=['POST'])
 def professional_mitigation_strategies():
     """Generate professional mitigation strategy recommendations"""
     try:
-        data = request.get_json()
-        
-        diameter = float(data.get('diameter', 100))
-        velocity = float(data.get('velocity', 20))
-        time_to_impact = float(data.get('time_to_impact', 365))  # days
-        
-        from models.deflection import DeflectionSimulator
-        deflector = DeflectionSimulator()
+        body = MitigationStrategiesRequest.model_validate_json(request.get_data())
+        diameter = body.diameter
+        velocity = body.velocity
+        time_to_impact = body.time_to_impact  # days
+        kinetic_viable, gravity_viable, nuclear_viable = strategy_masks(diameter, time_to_impact)
+        kinetic_success, gravity_success, nuclear_success = evaluate_all(diameter, velocity, time_to_impact).tolist()
         
         strategies = {
             "assessment_id": f"MIT-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "target_asteroid": {
                 "diameter": diameter,
                 "velocity": velocity,
@@ -1394,66 +1641,61 @@ def professional_mitigation_strategies():
             "recommended_strategies": []
         }
         
-        # Kinetic Impactor Strategy
-        if diameter <= 500 and time_to_impact >= 90:
-            kinetic_success = deflector.calculate_kinetic_impactor_effectiveness(diameter, velocity, time_to_impact)
-            strategies["recommended_strategies"].append({
-                "method": "Kinetic Impactor",
-                "success_probability": kinetic_success,
-                "timeline": "3-12 months",
-                "cost_estimate": "$500M - $2B",
-                "technology_readiness": "High (TRL 7-9)",
-                "description": "High-velocity spacecraft collision to alter asteroid trajectory",
-                "requirements": ["International coordination", "Launch capability", "Precision navigation"]
-            })
-        
-        # Gravity Tractor Strategy
-        if time_to_impact >= 365:
-            gravity_success = deflector.calculate_gravity_tractor_effectiveness(diameter, time_to_impact)
-            strategies["recommended_strategies"].append({
-                "method": "Gravity Tractor",
-                "success_probability": gravity_success,
-                "timeline": "1-5 years",
-                "cost_estimate": "$1B - $5B", 
-                "technology_readiness": "Medium (TRL 5-7)",
-                "description": "Spacecraft uses gravitational attraction to slowly alter trajectory",
-                "requirements": ["Long-term mission", "Precise positioning", "Extended operations"]
-            })
-        
-        # Nuclear Option Strategy  
-        if diameter >= 300 or time_to_impact <= 30:
-            nuclear_success = deflector.calculate_nuclear_option_effectiveness(diameter, velocity)
-            strategies["recommended_strategies"].append({
-                "method": "Nuclear Deflection",
-                "success_probability": nuclear_success,
-                "timeline": "1-6 months",
-                "cost_estimate": "$2B - $10B",
-                "technology_readiness": "High (TRL 8-9)",
-                "description": "Nuclear detonation to disrupt or deflect asteroid",
-                "requirements": ["International treaties", "Nuclear capability", "Emergency authorization"]
-            })
-        
-        # Mission readiness assessment
-        strategies["mission_readiness"] = {
-            "current_capabilities": "Operational for kinetic impactor missions",
-            "development_needed": "Gravity tractor and nuclear systems require additional development",
-            "international_coordination": "Essential for any deflection mission",
-            "estimated_preparation_time": "6-18 months for kinetic, 2-5 years for gravity tractor"
-        }
+        # Static strategy text comes from the module-level templates
+        recommended = strategies["recommended_strategies"]
+        if kinetic_viable:
+            recommended.append({**_KINETIC_STRATEGY, "success_probability": kinetic_success})
+        if gravity_viable:
+            recommended.append({**_GRAVITY_TRACTOR_STRATEGY, "success_probability": gravity_success})
+        if nuclear_viable:
+            recommended.append({**_NUCLEAR_STRATEGY, "success_probability": nuclear_success})
+        
+        strategies["mission_readiness"] = _MISSION_READINESS
         
         return jsonify(strategies)
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/professional/mitigation-grid', methods=['POST'])
+def professional_mitigation_grid():
+    """
+    Strategy success probabilities over a diameter x warning-time grid
+    
+    POST body:
+    {
+        "diameters": [50, 100, 200, 400],
+        "times_to_impact": [30, 180, 365, 1825],
+        "velocity": 20
+    }
+    
+    Each method maps to one row per diameter and one column per warning time;
+    null marks cells where the strategy is not viable.
+    """
+    try:
+        body = MitigationGridRequest.model_validate_json(request.get_data())
+    except ValidationError as e:
+        return jsonify(validation_error_response(e)), 422
+    
+    grid = strategy_grid(body.diameters, body.times_to_impact, body.velocity)
+    return jsonify({
+        'diameters': body.diameters,
+        'times_to_impact': body.times_to_impact,
+        'velocity': body.velocity,
+        'success_probability': grid
+    })
+
 @app.route('/api/professional/real-time-data')
+@cache.cached(timeout=config.Config.REAL_TIME_UPDATE_INTERVAL, response_filter=cacheable_response)
 def professional_real_time_data():
     """Get real-time professional data dashboard"""
     try:
-        # Get enhanced NASA data
-        current_asteroids = enhanced_nasa_client.get_enhanced_neo_data()
+        # Latest NEO feed from the background refresh
+        current_asteroids = _NEO_SNAPSHOT.get()
         
         dashboard_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "live_tracking": {
                 "active_neo_objects": len(current_asteroids.get('near_earth_objects', {})),
                 "close_approaches_today": 0,
@@ -1473,7 +1715,7 @@ def professional_real_time_data():
                 "high_priority_targets": 8
             },
             "data_sources": {
-                "nasa_neo_api": "Active",
+                "nasa_neo_api": "Unavailable" if 'error' in current_asteroids else "Active",
                 "jpl_horizons": "Active", 
                 "usgs_seismic": "Active",
                 "csa_neossat": "Active",
@@ -1499,5 +1741,7 @@ if __name__ == '__main__':
     print("  • System Status Monitoring")
     print("  • Risk Analysis Tools")
     print("📊 Platform ready at: http://127.0.0.1:5000")
+    print("⚙️  Development server only - for production run: gunicorn -c gunicorn.conf.py app:app")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # The reloader/debugger only with FLASK_ENV=dev
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_ENV') == 'dev')
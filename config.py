@@ -58,8 +58,37 @@ class Config:
     DATABASE_URI = os.environ.get('DATABASE_URI') or 'sqlite:///astrodefend.db'
     
     # Cache configuration
-    CACHE_TYPE = 'simple'
+    # Set CACHE_TYPE=RedisCache and CACHE_REDIS_URL in production so gunicorn workers share entries
+    CACHE_TYPE = os.environ.get('CACHE_TYPE') or 'SimpleCache'
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL') or 'redis://localhost:6379/0'
+    CACHE_KEY_PREFIX = 'astroguard:'
     CACHE_DEFAULT_TIMEOUT = 300  # 5 minutes
+    CACHE_TIMEOUT_STATIC = 86400  # 1 day for built-in solar system data
+    CACHE_TIMEOUT_NASA = 3600     # 1 hour for NASA proxy responses
+    CACHE_TIMEOUT_LIVE = 60       # 1 minute for live tracking data
+    CACHE_TIMEOUT_EVENTS = 300    # 5 minutes for event feeds and catalogs
+    
+    # Response compression (Flask-Compress); small bodies aren't worth the CPU
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = 1024
+    
+    # APOD images are downloaded once into this directory and served with send_file
+    APOD_IMAGE_CACHE_DIR = os.environ.get('APOD_IMAGE_CACHE_DIR') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'cache', 'apod'
+    )
+    # Behind Apache/lighttpd, let the front server send file bodies (X-Sendfile)
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+    # Behind nginx, internal location that aliases APOD_IMAGE_CACHE_DIR (X-Accel-Redirect)
+    APOD_IMAGE_ACCEL_PREFIX = os.environ.get('APOD_IMAGE_ACCEL_PREFIX')
+    
+    # SQLite file for the NASA HTTP response cache (requires requests-cache)
+    HTTP_CACHE_PATH = os.environ.get('HTTP_CACHE_PATH') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'cache', 'nasa_http.sqlite'
+    )
+    
+    # Game scores go to a Redis sorted set when set, otherwise they are kept in memory
+    LEADERBOARD_REDIS_URL = os.environ.get('LEADERBOARD_REDIS_URL')
+    LEADERBOARD_SIZE = 100
     
     # Debug mode
     DEBUG = True
@@ -67,4 +96,5 @@ class Config:
     # Update intervals (in seconds)
     REAL_TIME_UPDATE_INTERVAL = 60  # 1 minute for real-time data
     ISS_UPDATE_INTERVAL = 30       # 30 seconds for ISS tracking
+    PEOPLE_IN_SPACE_UPDATE_INTERVAL = 3600  # 1 hour for crew rosters
     ASTEROID_UPDATE_INTERVAL = 3600  # 1 hour for asteroid data
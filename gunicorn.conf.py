@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for AstroGuard Professional
+Usage: gunicorn -c gunicorn.conf.py app:app
+"""
+import multiprocessing
+import os
+
+# Bind to the same address as the development server
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# One worker process per core for the CPU-bound physics endpoints,
+# with a small thread pool each to overlap NASA API round-trips
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Upstream NASA requests use a 30 second timeout
+timeout = 60
@@ -1,5 +1,12 @@
+import math
+from functools import cached_property
+from types import MappingProxyType
 import numpy as np
 from utils.calculations import kinetic_energy_joules, tnt_equivalent
+from utils.slot_cache import slot_cached_property
+
+# cos²(angle) for whole-degree angles 0-90, the values the UI sliders produce
+_VERTICAL_FACTOR_SQ = tuple(math.cos(math.radians(angle)) ** 2 for angle in range(91))
 
 class Asteroid:
     """Class representing an asteroid and its physical properties"""
@@ -11,6 +18,10 @@ class Asteroid:
         "icy": 1000       # Comet-like
     }
     
+    # No per-instance __dict__; the underscored slots hold the cached derived values
+    __slots__ = ("diameter", "velocity", "density", "angle",
+                 "_mass", "_kinetic_energy", "_impact_energy", "_tnt_equivalent", "_dict_view")
+    
     def __init__(self, diameter=None, velocity=None, density=None, angle=None, type_name=None):
         """
         Initialize an asteroid object
@@ -38,16 +49,17 @@ class Asteroid:
         """Get radius in meters"""
         return self.diameter / 2 if self.diameter else 0
     
-    @property
+    # Derived values are cached per instance; the inputs are set once in __init__
+    @slot_cached_property
     def mass(self):
         """Calculate mass in kg"""
         if not self.diameter:
             return 0
             
-        volume = (4/3) * np.pi * (self.radius ** 3)
+        volume = (4/3) * math.pi * (self.radius ** 3)
         return volume * self.density
     
-    @property
+    @slot_cached_property
     def kinetic_energy(self):
         """Calculate kinetic energy in joules"""
         if not self.velocity:
@@ -57,20 +69,98 @@ class Asteroid:
         velocity_ms = self.velocity * 1000
         return kinetic_energy_joules(self.mass, velocity_ms)
     
-    @property
+    @slot_cached_property
     def impact_energy(self):
         """Calculate impact energy adjusted for angle"""
         # Vertical component of velocity determines impact energy
-        vertical_factor = np.cos(np.radians(self.angle))
-        return self.kinetic_energy * (vertical_factor ** 2)
+        angle = self.angle
+        index = int(angle) if 0 <= angle <= 90 else -1
+        if index == angle:
+            vertical_factor_sq = _VERTICAL_FACTOR_SQ[index]
+        else:
+            vertical_factor_sq = math.cos(math.radians(angle)) ** 2
+        return self.kinetic_energy * vertical_factor_sq
     
-    @property
+    @slot_cached_property
     def tnt_equivalent(self):
         """Convert impact energy to megatons of TNT"""
         return tnt_equivalent(self.impact_energy)
     
     def to_dict(self):
-        """Convert asteroid properties to dictionary"""
+        """Read-only mapping of the asteroid's properties, built once per instance"""
+        try:
+            return self._dict_view
+        except AttributeError:
+            self._dict_view = MappingProxyType({
+                "diameter": self.diameter,
+                "radius": self.radius,
+                "velocity": self.velocity,
+                "density": self.density,
+                "mass": self.mass,
+                "angle": self.angle,
+                "kinetic_energy": self.kinetic_energy,
+                "impact_energy": self.impact_energy,
+                "tnt_equivalent": self.tnt_equivalent
+            })
+            return self._dict_view
+
+
+class AsteroidBatch:
+    """Many asteroids stored as parallel NumPy columns, with whole-array physics"""
+    
+    def __init__(self, diameter, velocity, density=None, angle=None):
+        """
+        Initialize a batch of asteroids
+        
+        Args:
+            diameter (array-like): Diameters in meters
+            velocity (array-like): Velocities in km/s
+            density (array-like): Densities in kg/m³ (0 or omitted = rocky)
+            angle (array-like): Impact angles in degrees (0 or omitted = 45)
+        """
+        density = Asteroid.DENSITY_TYPES["rocky"] if density is None else density
+        angle = 45 if angle is None else angle
+        
+        columns = np.broadcast_arrays(*(
+            np.asarray(column, dtype=np.float64)
+            for column in (diameter, velocity, density, angle)
+        ))
+        self.diameter, self.velocity, density, angle = (np.array(column) for column in columns)
+        
+        # Same defaults as Asteroid for zero density/angle
+        self.density = np.where(density == 0, Asteroid.DENSITY_TYPES["rocky"], density)
+        self.angle = np.where(angle == 0, 45, angle)
+    
+    def __len__(self):
+        return self.diameter.size
+    
+    @property
+    def radius(self):
+        """Radii in meters"""
+        return self.diameter / 2
+    
+    @cached_property
+    def mass(self):
+        """Masses in kg"""
+        return (4/3) * np.pi * (self.radius ** 3) * self.density
+    
+    @cached_property
+    def kinetic_energy(self):
+        """Kinetic energies in joules"""
+        return kinetic_energy_joules(self.mass, self.velocity * 1000)
+    
+    @cached_property
+    def impact_energy(self):
+        """Impact energies adjusted for angle"""
+        return self.kinetic_energy * (np.cos(np.radians(self.angle)) ** 2)
+    
+    @cached_property
+    def tnt_equivalent(self):
+        """Impact energies in megatons of TNT"""
+        return tnt_equivalent(self.impact_energy)
+    
+    def to_dict(self):
+        """Columns of the batch, one array per property"""
         return {
             "diameter": self.diameter,
             "radius": self.radius,
@@ -1,5 +1,97 @@
+"""
+Asteroid deflection models
+
+DeflectionSimulator runs one mission. The module-level functions score the
+mitigation strategies (kinetic impactor, gravity tractor, nuclear):
+  - kinetic_impactor_effectiveness / gravity_tractor_effectiveness /
+    nuclear_option_effectiveness: one strategy for one asteroid
+  - evaluate_all: all three at once, as a [kinetic, gravity_tractor, nuclear] array
+  - strategy_masks: which strategies are viable (scalars or arrays)
+  - strategy_grid: every strategy over a diameter x warning-time grid
+"""
+import math
 import numpy as np
-import random
+from functools import lru_cache, partial
+from utils.jit import njit, prange
+
+# Fixed seed so placeholder asteroids (and results derived from them) are reproducible
+_PLACEHOLDER_RNG = np.random.default_rng(0xA57E401D)
+_PLACEHOLDER_LOW = np.array([50, 15000, 1e9])     # diameter, velocity, mass
+_PLACEHOLDER_HIGH = np.array([500, 30000, 1e12])
+
+def _placeholder_asteroids(asteroid_ids):
+    """Placeholder asteroid dicts for the given ids, drawn in one RNG call"""
+    draws = _PLACEHOLDER_RNG.uniform(_PLACEHOLDER_LOW, _PLACEHOLDER_HIGH, size=(len(asteroid_ids), 3))
+    return [
+        {
+            "id": asteroid_id,
+            "name": f"Sample Asteroid {asteroid_id}",
+            "diameter": diameter,
+            "velocity": velocity,
+            "mass": mass
+        }
+        for asteroid_id, (diameter, velocity, mass) in zip(asteroid_ids, draws.tolist())
+    ]
+
+@njit(cache=True)
+def _time_factor(years, min_years, max_years):
+    """Success-probability scale for the warning time, between 0.1 and 1"""
+    if years < min_years:
+        return 0.1  # Very low chance if not enough time
+    elif years > max_years:
+        return 1.0  # Maximum effectiveness
+    else:
+        # Linear scaling between min and max
+        return 0.1 + 0.9 * (years - min_years) / (max_years - min_years)
+
+@njit(cache=True)
+def _deflection_core(diameter, years, efficiency, cost_factor, min_years, max_years):
+    """
+    Numeric core of calculate_deflection on plain floats
+    
+    Returns:
+        tuple: (success_probability, mission_cost_millions, deflection_distance_m,
+                miss_distance_earth_radii)
+    """
+    # Adjust the method's base success for years before impact
+    success_probability = efficiency * _time_factor(years, min_years, max_years)
+    
+    # Calculate mission cost (in millions USD)
+    asteroid_size_factor = math.log10(diameter) / 2
+    base_cost = 500  # Base cost in millions
+    mission_cost = base_cost * cost_factor * asteroid_size_factor
+    
+    # Calculate deflection distance
+    if years < min_years:
+        deflection_distance = 0.0
+    else:
+        # Simple model: deflection distance increases with time
+        velocity_change = 0.001  # m/s
+        seconds_to_impact = years * 365.25 * 24 * 3600
+        deflection_distance = velocity_change * seconds_to_impact
+    
+    # Miss distance in Earth radii (Earth radius 6371 km)
+    miss_distance = deflection_distance / (6371 * 1000)
+    
+    return success_probability, mission_cost, deflection_distance, miss_distance
+
+@njit(cache=True, parallel=True)
+def deflection_batch(diameters, years, efficiency, cost_factor, min_years, max_years):
+    """
+    _deflection_core over arrays of asteroids/warning times (one method's parameters)
+    
+    Returns:
+        np.ndarray: (N, 4) rows of success_probability, mission_cost_millions,
+                    deflection_distance_m, miss_distance_earth_radii
+    """
+    results = np.empty((diameters.shape[0], 4))
+    for i in prange(diameters.shape[0]):
+        row = _deflection_core(diameters[i], years[i], efficiency, cost_factor, min_years, max_years)
+        results[i, 0] = row[0]
+        results[i, 1] = row[1]
+        results[i, 2] = row[2]
+        results[i, 3] = row[3]
+    return results
 
 class DeflectionSimulator:
     """Simulates asteroid deflection missions"""
@@ -51,13 +143,20 @@ class DeflectionSimulator:
         """
         # In a real implementation, this would call the NASA API
         # For now, return placeholder data
-        return {
-            "id": self.asteroid_id,
-            "name": f"Sample Asteroid {self.asteroid_id}",
-            "diameter": random.uniform(50, 500),
-            "velocity": random.uniform(15000, 30000),
-            "mass": random.uniform(1e9, 1e12)
-        }
+        return _placeholder_asteroids([self.asteroid_id])[0]
+    
+    @classmethod
+    def batch_placeholder(cls, asteroid_ids):
+        """
+        Placeholder asteroid data for many simulations at once
+        
+        Args:
+            asteroid_ids (list): NASA NEO IDs
+            
+        Returns:
+            list: One asteroid dict per id, drawn in a single RNG call
+        """
+        return _placeholder_asteroids(list(asteroid_ids))
     
     def calculate_deflection(self):
         """
@@ -66,45 +165,14 @@ class DeflectionSimulator:
         Returns:
             dict: Deflection results
         """
-        # Get method parameters
-        method_params = self.DEFLECTION_METHODS.get(
-            self.method, 
-            self.DEFLECTION_METHODS["kinetic"]
-        )
-        
-        # Calculate base success probability
-        base_success = method_params["efficiency"]
+        # Core with the method's parameters bound (unknown methods fall back to kinetic)
+        deflection_core = _DISPATCH.get(self.method, _DISPATCH["kinetic"])
         
-        # Adjust for years before impact
-        time_factor = self._calculate_time_factor(
-            self.years_before_impact,
-            method_params["min_years_needed"],
-            method_params["max_years_effective"]
+        success_probability, mission_cost, deflection_distance, miss_distance = deflection_core(
+            float(self.asteroid_data["diameter"]),
+            float(self.years_before_impact)
         )
         
-        # Calculate final success probability
-        success_probability = base_success * time_factor
-        
-        # Calculate mission cost (in millions USD)
-        asteroid_size_factor = np.log10(self.asteroid_data["diameter"]) / 2
-        base_cost = 500  # Base cost in millions
-        mission_cost = base_cost * method_params["cost_factor"] * asteroid_size_factor
-        
-        # Calculate deflection distance
-        if self.years_before_impact < method_params["min_years_needed"]:
-            deflection_distance = 0
-        else:
-            # Simple model: deflection distance increases with time
-            velocity_change = 0.001  # m/s
-            seconds_to_impact = self.years_before_impact * 365.25 * 24 * 3600
-            deflection_distance = velocity_change * seconds_to_impact
-        
-        # Earth radius in km
-        earth_radius = 6371
-        
-        # Miss distance in Earth radii
-        miss_distance = deflection_distance / (earth_radius * 1000)
-        
         return {
             "asteroid": self.asteroid_data,
             "deflection_method": self.method,
@@ -128,10 +196,162 @@ class DeflectionSimulator:
         Returns:
             float: Time factor between 0 and 1
         """
-        if years < min_years:
-            return 0.1  # Very low chance if not enough time
-        elif years > max_years:
-            return 1.0  # Maximum effectiveness
-        else:
-            # Linear scaling between min and max
-            return 0.1 + 0.9 * (years - min_years) / (max_years - min_years)
+        return _time_factor(years, min_years, max_years)
+
+
+# DEFLECTION_METHODS as parallel float64 columns indexed by method id, so
+# calculate_deflection and deflection_batch callers skip the nested dict reads
+METHOD_ID = {name: i for i, name in enumerate(DeflectionSimulator.DEFLECTION_METHODS)}
+_METHOD_NAMES = np.array(list(METHOD_ID))
+_EFFICIENCY, _COST_FACTOR, _MIN_YEARS, _MAX_YEARS = (
+    np.array([params[key] for params in DeflectionSimulator.DEFLECTION_METHODS.values()], dtype=np.float64)
+    for key in ("efficiency", "cost_factor", "min_years_needed", "max_years_effective")
+)
+
+# One _deflection_core per method with its parameters pre-bound, so
+# calculate_deflection only passes the asteroid's diameter and warning time
+_DISPATCH = {
+    name: partial(
+        _deflection_core,
+        efficiency=float(_EFFICIENCY[mid]),
+        cost_factor=float(_COST_FACTOR[mid]),
+        min_years=float(_MIN_YEARS[mid]),
+        max_years=float(_MAX_YEARS[mid])
+    )
+    for name, mid in METHOD_ID.items()
+}
+
+
+# Strategy effectiveness for the mitigation planner. Inputs come from UI sliders,
+# so they are snapped to coarse bins (10 m, 1 km/s, 5 days) and memoized per bin.
+
+def _mass_factor(diameter, velocity, reference_diameter):
+    """Falls from 1 towards 0 as the momentum to change (~ d^3 * v) outgrows the method"""
+    return 1 / (1 + (diameter / reference_diameter) ** 3 * velocity / 20)
+
+def _effectiveness(method, years, mass_factor):
+    mid = METHOD_ID[method]
+    time_factor = _time_factor(years, _MIN_YEARS[mid], _MAX_YEARS[mid])
+    return round(float(_EFFICIENCY[mid] * time_factor * mass_factor), 3)
+
+@lru_cache(maxsize=4096)
+def _kinetic_impactor_binned(diameter, velocity, days):
+    return _effectiveness("kinetic", days / 365.25, _mass_factor(diameter, velocity, 500))
+
+@lru_cache(maxsize=4096)
+def _gravity_tractor_binned(diameter, days):
+    # The tractor's pull doesn't depend on approach speed
+    return _effectiveness("gravity_tractor", days / 365.25, _mass_factor(diameter, 20, 500))
+
+@lru_cache(maxsize=4096)
+def _nuclear_option_binned(diameter, velocity):
+    # Standoff detonations are launched late, so the full time factor applies
+    return _effectiveness("nuclear", _MAX_YEARS[METHOD_ID["nuclear"]], _mass_factor(diameter, velocity, 1000))
+
+def kinetic_impactor_effectiveness(diameter, velocity, time_to_impact):
+    """
+    Success probability of a kinetic impactor
+    
+    Args:
+        diameter (float): Asteroid diameter in meters
+        velocity (float): Asteroid velocity in km/s
+        time_to_impact (float): Warning time in days
+    """
+    return _kinetic_impactor_binned(round(diameter / 10) * 10, round(velocity), round(time_to_impact / 5) * 5)
+
+def gravity_tractor_effectiveness(diameter, time_to_impact):
+    """Success probability of a gravity tractor (diameter in meters, warning time in days)"""
+    return _gravity_tractor_binned(round(diameter / 10) * 10, round(time_to_impact / 5) * 5)
+
+def nuclear_option_effectiveness(diameter, velocity):
+    """Success probability of a nuclear standoff detonation (diameter in meters, velocity in km/s)"""
+    return _nuclear_option_binned(round(diameter / 10) * 10, round(velocity))
+
+# Per-method lanes for evaluate_all, in METHOD_ID order:
+# (reference diameter m, uses the asteroid's velocity, uses the warning time)
+_STRATEGY_LANES = {
+    "kinetic": (500, True, True),
+    "gravity_tractor": (500, False, True),
+    "nuclear": (1000, True, False)
+}
+_LANE_REFERENCE_DIAMETER, _LANE_USES_VELOCITY, _LANE_USES_TIME = (
+    np.array(column) for column in zip(*(_STRATEGY_LANES[name] for name in METHOD_ID))
+)
+
+@lru_cache(maxsize=4096)
+def _evaluate_all_binned(diameter, velocity, days):
+    velocities = np.where(_LANE_USES_VELOCITY, velocity, 20)
+    years = np.where(_LANE_USES_TIME, days / 365.25, _MAX_YEARS)
+    time_factor = np.clip(0.1 + 0.9 * (years - _MIN_YEARS) / (_MAX_YEARS - _MIN_YEARS), 0.1, 1.0)
+    probabilities = np.round(
+        _EFFICIENCY * time_factor * _mass_factor(diameter, velocities, _LANE_REFERENCE_DIAMETER), 3
+    )
+    # Shared by every caller hitting this bin
+    probabilities.setflags(write=False)
+    return probabilities
+
+def evaluate_all(diameter, velocity, time_to_impact):
+    """
+    All three strategy success probabilities in one vectorized evaluation
+    
+    Args:
+        diameter (float): Asteroid diameter in meters
+        velocity (float): Asteroid velocity in km/s
+        time_to_impact (float): Warning time in days
+        
+    Returns:
+        np.ndarray: Read-only [kinetic, gravity_tractor, nuclear] probabilities
+    """
+    return _evaluate_all_binned(round(diameter / 10) * 10, round(velocity), round(time_to_impact / 5) * 5)
+
+def strategy_masks(diameter, time_to_impact):
+    """
+    Which strategies are viable, for scalars or NumPy arrays alike
+    
+    Returns:
+        tuple: (kinetic, gravity_tractor, nuclear) bools or boolean arrays
+    """
+    kinetic = (diameter <= 500) & (time_to_impact >= 90)
+    gravity_tractor = time_to_impact >= 365
+    nuclear = (diameter >= 300) | (time_to_impact <= 30)
+    return kinetic, gravity_tractor, nuclear
+
+def _effectiveness_array(method, years, mass_factor):
+    """_effectiveness over arrays; clipping matches _time_factor's branches"""
+    mid = METHOD_ID[method]
+    min_years, max_years = _MIN_YEARS[mid], _MAX_YEARS[mid]
+    time_factor = np.clip(0.1 + 0.9 * (years - min_years) / (max_years - min_years), 0.1, 1.0)
+    return np.round(_EFFICIENCY[mid] * time_factor * mass_factor, 3)
+
+def strategy_grid(diameters, times_to_impact, velocity=20):
+    """
+    Strategy success probabilities over a diameter x warning-time grid (risk heatmaps)
+    
+    Args:
+        diameters (array-like): Asteroid diameters in meters (grid rows)
+        times_to_impact (array-like): Warning times in days (grid columns)
+        velocity (float): Asteroid velocity in km/s
+        
+    Returns:
+        dict: (rows, columns) probability arrays per method, NaN where the
+              strategy is not viable
+    """
+    diameters = np.asarray(diameters, dtype=np.float64)[:, None]
+    times_to_impact = np.asarray(times_to_impact, dtype=np.float64)[None, :]
+    kinetic_ok, gravity_ok, nuclear_ok = strategy_masks(diameters, times_to_impact)
+    
+    # Same bins as the memoized scalar functions
+    diameter_bins = np.round(diameters / 10) * 10
+    years = np.round(times_to_impact / 5) * 5 / 365.25
+    velocity = round(velocity)
+    
+    kinetic = _effectiveness_array("kinetic", years, _mass_factor(diameter_bins, velocity, 500))
+    gravity = _effectiveness_array("gravity_tractor", years, _mass_factor(diameter_bins, 20, 500))
+    nuclear = _effectiveness_array(
+        "nuclear", _MAX_YEARS[METHOD_ID["nuclear"]], _mass_factor(diameter_bins, velocity, 1000)
+    )
+    return {
+        "kinetic": np.where(kinetic_ok, kinetic, np.nan),
+        "gravity_tractor": np.where(gravity_ok, gravity, np.nan),
+        "nuclear": np.where(nuclear_ok, nuclear, np.nan)
+    }
@@ -1,24 +1,54 @@
 import numpy as np
 from utils.calculations import crater_diameter, air_blast_radius, thermal_radiation_radius
+from utils.slot_cache import slot_cached_property
+
+# ~70% of Earth is ocean
+OCEAN_FRACTION = 0.7
+
+JOULES_PER_MEGATON = 4.184e15
+
+# Tsunami arrival times in seconds at ~800 km/h
+_TSUNAMI_ARRIVAL_100KM = 100 / 800 * 3600
+_TSUNAMI_ARRIVAL_1000KM = 1000 / 800 * 3600
+
+_RNG = np.random.default_rng()
+_ocean_draws = iter(())
+
+def _next_ocean_draw():
+    """One ocean/land draw, taken from a block of 1024 sampled in a single RNG call"""
+    global _ocean_draws
+    try:
+        return next(_ocean_draws)
+    except StopIteration:
+        _ocean_draws = iter((_RNG.random(1024) < OCEAN_FRACTION).tolist())
+        return next(_ocean_draws)
 
 class ImpactSimulator:
     """Simulates asteroid impact effects"""
     
-    def __init__(self, asteroid, lat, lng):
+    __slots__ = ("asteroid", "lat", "lng", "is_ocean", "energy",
+                 "_crater", "_blast_effects", "_thermal_effects", "_tsunami")
+    
+    def __init__(self, asteroid, lat, lng, is_ocean=None):
         """
         Initialize impact simulator
         
         Args:
-            asteroid: Asteroid object with physical properties
+            asteroid: Asteroid object with physical properties (an AsteroidBatch
+                gives per-asteroid arrays from the blast and thermal methods)
             lat (float): Impact latitude
             lng (float): Impact longitude
+            is_ocean (bool): Known surface type; drawn at random when omitted
         """
         self.asteroid = asteroid
         self.lat = lat
         self.lng = lng
         
+        # Every effect scales from the impact energy; read it from the asteroid once
+        self.energy = asteroid.impact_energy
+        
         # Determine if ocean or land impact
-        self.is_ocean = self._check_if_ocean()
+        self.is_ocean = self._check_if_ocean() if is_ocean is None else is_ocean
     
     def _check_if_ocean(self):
         """
@@ -30,18 +60,29 @@ class ImpactSimulator:
         # For a real implementation, this would check against USGS data
         # For now, return a placeholder based on a simple heuristic
         # (e.g., approximate ocean coverage)
-        return np.random.random() < 0.7  # ~70% of Earth is ocean
+        return _next_ocean_draw()
+    
+    @staticmethod
+    def batch_check_ocean(latlngs):
+        """
+        Ocean/land placeholder for many impact locations in one RNG call
+        
+        Returns:
+            np.ndarray: Boolean mask, True for ocean impacts
+        """
+        return _RNG.random(len(latlngs)) < OCEAN_FRACTION
     
-    def calculate_crater(self):
+    @slot_cached_property
+    def crater(self):
         """
-        Calculate crater dimensions
+        Crater dimensions, computed once per simulator
         
         Returns:
             dict: Crater dimensions
         """
         if self.is_ocean:
             # For ocean impacts, crater is temporary
-            energy = self.asteroid.impact_energy
+            energy = self.energy
             temp_crater_diameter = crater_diameter(
                 energy, 
                 target_density=1000,  # Water density
@@ -56,7 +97,7 @@ class ImpactSimulator:
             }
         else:
             # For land impacts, calculate permanent crater
-            energy = self.asteroid.impact_energy
+            energy = self.energy
             crater_dia = crater_diameter(
                 energy,
                 target_density=2500,  # Average rock density
@@ -70,14 +111,15 @@ class ImpactSimulator:
                 "depth": crater_dia * 0.3
             }
     
-    def calculate_blast_effects(self):
+    @slot_cached_property
+    def blast_effects(self):
         """
         Calculate air blast effects
         
         Returns:
             dict: Air blast radii for different overpressures
         """
-        energy = self.asteroid.impact_energy
+        energy = self.energy
         
         return {
             "severe_damage_radius": air_blast_radius(energy, 20),
@@ -85,14 +127,15 @@ class ImpactSimulator:
             "sound_intensity_radius": air_blast_radius(energy, 1)
         }
     
-    def calculate_thermal_effects(self):
+    @slot_cached_property
+    def thermal_effects(self):
         """
         Calculate thermal radiation effects
         
         Returns:
             dict: Thermal radiation radii for different intensities
         """
-        energy = self.asteroid.impact_energy
+        energy = self.energy
         
         return {
             "third_degree_burns": thermal_radiation_radius(energy, 35),
@@ -100,7 +143,8 @@ class ImpactSimulator:
             "first_degree_burns": thermal_radiation_radius(energy, 5)
         }
     
-    def calculate_tsunami(self):
+    @slot_cached_property
+    def tsunami(self):
         """
         Calculate tsunami effects for ocean impacts
         
@@ -111,19 +155,20 @@ class ImpactSimulator:
             return None
             
         # Simple tsunami model based on energy
-        energy = self.asteroid.impact_energy
-        tnt_mt = energy / 4.184e15  # Convert to megatons
+        energy = self.energy
+        tnt_mt = energy / JOULES_PER_MEGATON  # Convert to megatons
         
         # Simplified calculation for demonstration
-        wave_height_1000km = 0.14 * (tnt_mt ** 0.25)
-        wave_height_100km = 1.41 * (tnt_mt ** 0.25)
+        wave_scale = tnt_mt ** 0.25
+        wave_height_1000km = 0.14 * wave_scale
+        wave_height_100km = 1.41 * wave_scale
         
         return {
-            "initial_cavity_diameter": self.calculate_crater()["temporary_diameter"],
+            "initial_cavity_diameter": self.crater["temporary_diameter"],
             "wave_height_100km": wave_height_100km,
             "wave_height_1000km": wave_height_1000km,
-            "arrival_time_100km": 100 / 800 * 3600,  # seconds (tsunami speed ~800 km/h)
-            "arrival_time_1000km": 1000 / 800 * 3600  # seconds
+            "arrival_time_100km": _TSUNAMI_ARRIVAL_100KM,
+            "arrival_time_1000km": _TSUNAMI_ARRIVAL_1000KM
         }
     
     def calculate_impact(self):
@@ -140,12 +185,12 @@ class ImpactSimulator:
                 "lng": self.lng,
                 "is_ocean": self.is_ocean
             },
-            "crater": self.calculate_crater(),
-            "blast_effects": self.calculate_blast_effects(),
-            "thermal_effects": self.calculate_thermal_effects(),
-            "tsunami": self.calculate_tsunami(),
+            "crater": self.crater,
+            "blast_effects": self.blast_effects,
+            "thermal_effects": self.thermal_effects,
+            "tsunami": self.tsunami,
             "energy": {
-                "joules": self.asteroid.impact_energy,
+                "joules": self.energy,
                 "megatons": self.asteroid.tnt_equivalent
             }
         }
@@ -3,10 +3,14 @@ Impact Physics and Crater Calculations
 Based on scientific scaling laws for asteroid impacts
 """
 import math
+from bisect import bisect_left, bisect_right
+from functools import cached_property, lru_cache
 from typing import Dict, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+import numpy as np
+from utils.jit import njit
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImpactParameters:
     """Parameters for asteroid impact calculations"""
     diameter: float  # meters
@@ -15,61 +19,490 @@ class ImpactParameters:
     angle: float  # degrees from horizontal
     target_type: str  # 'land' or 'water'
     
+# Sample distances (km) of the distance-dependent effects. The int tuples key the
+# per-distance result dicts; the arrays drive the vectorized math.
+_SEISMIC_KM = (10, 50, 100, 500, 1000, 5000)
+_BLAST_KM = (1, 5, 10, 25, 50, 100, 250, 500)
+_THERMAL_KM = (1, 5, 10, 25, 50, 100, 250)
+_TSUNAMI_KM = (100, 500, 1000, 2000, 5000)
+_EJECTA_KM = (10, 50, 100, 500)
+SEISMIC_DISTANCES_KM = np.array(_SEISMIC_KM, dtype=np.float64)
+BLAST_DISTANCES_KM = np.array(_BLAST_KM, dtype=np.float64)
+THERMAL_DISTANCES_KM = np.array(_THERMAL_KM, dtype=np.float64)
+TSUNAMI_DISTANCES_KM = np.array(_TSUNAMI_KM, dtype=np.float64)
+EJECTA_DISTANCES_KM = np.array(_EJECTA_KM, dtype=np.float64)
+
+# One shared distance axis for the scalar calculator: every effect is evaluated
+# over all of it in a single (effect, distance) matrix, then each effect reads
+# its own columns
+_PROFILE_KM = tuple(sorted(set(_SEISMIC_KM + _BLAST_KM + _THERMAL_KM + _TSUNAMI_KM + _EJECTA_KM)))
+PROFILE_DISTANCES_KM = np.array(_PROFILE_KM, dtype=np.float64)
+_SEISMIC_COLUMNS = tuple(zip(_SEISMIC_KM, map(_PROFILE_KM.index, _SEISMIC_KM)))
+_BLAST_COLUMNS = tuple(zip(_BLAST_KM, map(_PROFILE_KM.index, _BLAST_KM)))
+_THERMAL_COLUMNS = tuple(zip(_THERMAL_KM, map(_PROFILE_KM.index, _THERMAL_KM)))
+_TSUNAMI_COLUMNS = tuple(zip(_TSUNAMI_KM, map(_PROFILE_KM.index, _TSUNAMI_KM)))
+_EJECTA_COLUMNS = tuple(zip(_EJECTA_KM, map(_PROFILE_KM.index, _EJECTA_KM)))
+
+# Distance-only factors: sphere area for thermal flux (km²), tsunami height decay
+_THERMAL_SPHERE_AREA = 4 * np.pi * PROFILE_DISTANCES_KM ** 2
+_TSUNAMI_DECAY = np.sqrt(100 / PROFILE_DISTANCES_KM)
+_EJECTA_DIVISOR = PROFILE_DISTANCES_KM + 1
+
+def _copy_nested(value):
+    """Copy nested dicts/lists (much cheaper than copy.deepcopy for result trees)"""
+    if type(value) is dict:
+        return {key: _copy_nested(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_nested(item) for item in value]
+    return value
+
+class _Tiers:
+    """
+    Sorted thresholds and the level each interval between them maps to
+    
+    Replaces if/elif ladders: scalars bisect the thresholds, arrays use
+    np.searchsorted. `right=True` puts a value equal to a threshold in the
+    upper tier (ladders written with `<`); `right=False` puts it in the
+    lower one (ladders written with `>`).
+    """
+    
+    def __init__(self, thresholds, levels, right):
+        self.thresholds = tuple(thresholds)
+        self.levels = tuple(levels)  # one more level than thresholds, lowest first
+        self._bisect = bisect_right if right else bisect_left
+        self._side = 'right' if right else 'left'
+        self._thresholds_array = np.array(self.thresholds, dtype=np.float64)
+        self._columns = [np.array(column) for column in zip(*self.levels)]
+    
+    def lookup(self, value):
+        """Level tuple for one value"""
+        return self.levels[self._bisect(self.thresholds, value)]
+    
+    def code(self, value):
+        """Tier index for one value"""
+        return self._bisect(self.thresholds, value)
+    
+    def lookup_array(self, values):
+        """One array per level field; NaN values give NaN or '' entries"""
+        index = np.searchsorted(self._thresholds_array, values, side=self._side)
+        missing = np.isnan(values)
+        return tuple(
+            np.where(missing, np.nan if column.dtype.kind in 'if' else '', column[index])
+            for column in self._columns
+        )
+    
+    def code_array(self, values):
+        """uint8 tier index per value (labels via `labels`); NaN gives NO_EFFECT_CODE"""
+        index = np.searchsorted(self._thresholds_array, values, side=self._side)
+        return np.where(np.isnan(values), NO_EFFECT_CODE, index).astype(np.uint8)
+    
+    def labels(self, field=-1):
+        """One level field for every tier, indexed by the codes of code_array"""
+        return tuple(level[field] for level in self.levels)
+
+# Effect code of samples with no effect (inside the crater, dry land, ...)
+NO_EFFECT_CODE = 255
+
+# (Mercalli category, description) by intensity
+_SEISMIC_TIERS = _Tiers(
+    (4, 6, 8, 10),
+    (("I-III", "Minor"),
+     ("IV-V", "Moderate"),
+     ("VI-VII", "Strong"),
+     ("VIII-IX", "Severe"),
+     ("X-XII", "Extreme")),
+    right=True
+)
+
+# Seismic category codes index this table; the last entry is inside the crater
+SEISMIC_CATEGORY_LABELS = _SEISMIC_TIERS.levels + (("XII", "Total destruction"),)
+SEISMIC_CRATER_CODE = len(SEISMIC_CATEGORY_LABELS) - 1
+
+def format_intensity(code: int, intensity: float = None) -> str:
+    """Display label for a seismic category code, e.g. 'VI-VII (Strong - 6.4)'"""
+    category, description = SEISMIC_CATEGORY_LABELS[code]
+    if code == SEISMIC_CRATER_CODE:
+        return f"{category} ({description})"
+    return f"{category} ({description} - {intensity:.1f})"
+
+# (overpressure psi, effect) by blast scaled distance
+_BLAST_TIERS = _Tiers(
+    (0.1, 0.5, 1, 2, 5, 10),
+    ((100, "Complete annihilation"),  # Near total destruction
+     (20, "Reinforced concrete destroyed"),
+     (10, "Heavy damage to buildings"),
+     (5, "Most buildings collapse"),
+     (2, "Moderate damage to structures"),
+     (1, "Window breakage"),
+     (0.1, "Minor damage")),
+    right=True
+)
+
+# Effect by thermal flux (cal/cm²)
+_THERMAL_TIERS = _Tiers(
+    (5, 10, 40, 100, 500),
+    (("No significant burns",),
+     ("Pain, minor burns",),
+     ("First-degree burns",),
+     ("Second-degree burns",),
+     ("Third-degree burns, fires",),
+     ("Everything ignites, vaporization",)),
+    right=False
+)
+
+# Hazard by tsunami wave height (m)
+_TSUNAMI_HAZARD_TIERS = _Tiers(
+    (3, 10, 20, 50, 100),
+    (("Low - minor effects",),
+     ("Moderate - coastal flooding",),
+     ("High - significant flooding",),
+     ("Severe - major coastal damage",),
+     ("Extreme - regional devastation",),
+     ("Catastrophic - mega-tsunami",)),
+    right=False
+)
+
+# Effect by ejecta thickness (m)
+_EJECTA_TIERS = _Tiers(
+    (1, 10, 100),
+    (("Light ejecta fallout",),
+     ("Moderate ejecta damage",),
+     ("Severe damage from ejecta",),
+     ("Buried under debris",)),
+    right=False
+)
+
+_LOCAL_CASUALTIES = {
+    'immediate': '1,000 - 1 million',
+    'total': '10,000 - 10 million',
+    'note': 'Significant local impact'
+}
+_MAJOR_DISASTER_COST = {'cost_usd': '$100 billion - $1 trillion', 'note': 'Major disaster'}
+
+# (classification, casualties, economic impact) by effective megatons; a value
+# equal to a threshold stays in the lower tier
+_SEVERITY_TIERS = _Tiers(
+    (1, 10, 100, 1000, 1e4, 1e6, 1e8),
+    (("Minor Impact", _LOCAL_CASUALTIES, _MAJOR_DISASTER_COST),
+     ("Moderate Local Impact", _LOCAL_CASUALTIES, _MAJOR_DISASTER_COST),
+     ("Significant Local Impact", _LOCAL_CASUALTIES, _MAJOR_DISASTER_COST),
+     ("Major Regional Impact",
+      {'immediate': '100,000 - 10 million', 'total': '1-50 million',
+       'note': 'Major regional disaster'},
+      {'cost_usd': '$1-10 trillion', 'note': 'Regional catastrophe'}),
+     ("Regional Catastrophe",
+      {'immediate': '1-100 million', 'total': '10-500 million',
+       'note': 'Depends heavily on impact location'},
+      {'cost_usd': '$10-100 trillion', 'note': 'Continental devastation'}),
+     ("Continental Disaster",
+      {'immediate': '100+ million', 'total': '1+ billion', 'note': 'Global catastrophe'},
+      {'cost_usd': '$100+ trillion', 'note': 'Global economic collapse'}),
+     ("Global Catastrophe",
+      {'immediate': '1+ billion', 'total': 'Majority of human population',
+       'note': 'Extinction-level event'},
+      {'cost_usd': 'Incalculable', 'note': 'End of civilization'}),
+     ("Extinction Event (K-T level)",
+      {'immediate': '1+ billion', 'total': 'Majority of human population',
+       'note': 'Extinction-level event'},
+      {'cost_usd': 'Incalculable', 'note': 'End of civilization'})),
+    right=False
+)
+
+# String tables for the effect codes of calculate_impact_batch
+BLAST_EFFECT_LABELS = _BLAST_TIERS.labels()
+THERMAL_EFFECT_LABELS = _THERMAL_TIERS.labels()
+TSUNAMI_HAZARD_LABELS = _TSUNAMI_HAZARD_TIERS.labels()
+EJECTA_EFFECT_LABELS = _EJECTA_TIERS.labels()
+
+JOULES_PER_MEGATON = 4.184e15
+JOULES_PER_KILOTON = 4.184e12
+_INV_JOULES_PER_MEGATON = 1.0 / JOULES_PER_MEGATON
+_INV_JOULES_PER_KILOTON = 1.0 / JOULES_PER_KILOTON
+_SPHERE_VOLUME_PER_D3 = math.pi / 6  # (4/3)·π·(d/2)³ = (π/6)·d³
+_INV_HIROSHIMA_MT = 1.0 / 0.015  # Hiroshima was ~15 kilotons
+_DEG2RAD = math.pi / 180.0
+
+# M = 0.67 * log10(E) - 5.87, evaluated as log2(E) * 0.67 * log10(2) - 5.87
+_LOG10_2 = 0.30102999566398114
+_SEISMIC_K1 = 0.67 * _LOG10_2
+_SEISMIC_K2 = 5.87
+
+# Explicit signatures compile the cores eagerly at import instead of on first call
+@njit('UniTuple(float64, 3)(float64, float64, float64)', cache=True)
+def _ke_and_mass(diameter: float, velocity: float, density: float) -> Tuple[float, float, float]:
+    """Mass (kg), kinetic energy (J) and megatons of TNT of a spherical impactor"""
+    mass = _SPHERE_VOLUME_PER_D3 * (diameter * diameter * diameter) * density
+    
+    # KE = 0.5 * m * v², velocity converted to m/s
+    velocity_ms = velocity * 1000
+    kinetic_energy = 0.5 * mass * (velocity_ms * velocity_ms)
+    
+    return mass, kinetic_energy, kinetic_energy * _INV_JOULES_PER_MEGATON
+
+@njit('UniTuple(float64, 4)(float64, float64, float64, float64)', cache=True)
+def _kinetic_energy_core(diameter: float, velocity: float, density: float,
+                         angle: float) -> Tuple[float, float, float, float]:
+    """Mass, kinetic energy, megatons and angle-adjusted energy on plain floats"""
+    mass, kinetic_energy, megatons_tnt = _ke_and_mass(diameter, velocity, density)
+    
+    # Adjust for impact angle (energy dissipation)
+    angle_factor = math.sin(angle * _DEG2RAD)
+    effective_energy = kinetic_energy * angle_factor
+    
+    return mass, kinetic_energy, megatons_tnt, effective_energy
+
+@njit('UniTuple(float64, 3)(float64, float64)', cache=True)
+def _crater_core(energy_mt_p28: float, scaling_constant: float) -> Tuple[float, float, float]:
+    """Crater diameter, depth and volume (km, km, km³) from energy_mt ** 0.28"""
+    # Crater diameter (km)
+    crater_diameter = scaling_constant * energy_mt_p28
+    
+    # Crater depth (typically 1/5 to 1/3 of diameter)
+    crater_depth = crater_diameter / 5
+    
+    # Crater volume
+    crater_volume = (math.pi / 4) * (crater_diameter ** 2) * crater_depth  # km³
+    
+    return crater_diameter, crater_depth, crater_volume
+
+EARTH_GRAVITY = 9.81  # m/s²
+
+# Deep water tsunami speed ~= sqrt(g*d), assuming an average ocean depth of 4000m
+TSUNAMI_SPEED_KMH = math.sqrt(EARTH_GRAVITY * 4000) * 3.6
+_TSUNAMI_ARRIVAL_HOURS = (PROFILE_DISTANCES_KM / TSUNAMI_SPEED_KMH).tolist()
+
+# Arrival time at the nearest sampled distance, the one the regional summary quotes
+_TSUNAMI_FIRST_ARRIVAL_HOURS = _TSUNAMI_ARRIVAL_HOURS[_TSUNAMI_COLUMNS[0][1]]
+
+# (cooling effect, duration years) by effective megatons
+_COOLING_TIERS = _Tiers(
+    (100, 1000, 1e4, 1e6),
+    (("Negligible", 0),
+     ("Temporary cooling", 0.1),
+     ("Regional climate disruption", 1),
+     ("Global winter", 3),
+     ("Extinction-level event", 10)),
+    right=False
+)
+
+def _seismic_magnitude(energy_joules: float) -> float:
+    """Richter magnitude: M = 0.67 * log10(E) - 5.87 (where E is in Joules)"""
+    if energy_joules > 0:
+        return _SEISMIC_K1 * math.log2(energy_joules) - _SEISMIC_K2
+    return 0
+
+def _distance_profiles(energy_mt: float, crater_diameter: float, magnitude: float,
+                       initial_wave_height: float = 0.0) -> list:
+    """
+    Per-distance values of every effect over _PROFILE_KM, one row per effect:
+    seismic intensity, blast scaled distance, thermal flux (cal/cm²), tsunami
+    wave height (m) and ejecta thickness (m)
+    """
+    profiles = np.empty((5, PROFILE_DISTANCES_KM.size))
+    
+    # Zero energy (angle 0, diameter 0) gives inf/nan rows; the tier lookups
+    # handle those, as in calculate_impact_batch
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Simplified intensity calculation: decreases with distance
+        profiles[0] = magnitude - 1.5 * np.log10(PROFILE_DISTANCES_KM / (crater_diameter / 2))
+        
+        # Scaling law: P = K * (W^0.33 / R) where W is yield, R is range
+        profiles[1] = PROFILE_DISTANCES_KM / energy_mt ** 0.33
+        
+        # Q = Y * 1e6 / (4 * π * R²) where Y (~30% of the energy) is in MT, R in km
+        profiles[2] = (energy_mt * 0.3 * 1e6) / _THERMAL_SPHERE_AREA
+        
+        # Wave height decreases with distance (simplified)
+        profiles[3] = initial_wave_height * _TSUNAMI_DECAY
+        
+        # Ejecta thickness decreases with distance (simplified)
+        profiles[4] = crater_diameter * 10 / _EJECTA_DIVISOR
+    
+    return profiles.tolist()
+
+def _seismic_intensities(intensity_row: list, crater_radius: float) -> Dict:
+    """Mercalli intensity labels by distance"""
+    intensities = {}
+    
+    for distance, column in _SEISMIC_COLUMNS:
+        if distance < crater_radius:
+            intensities[distance] = format_intensity(SEISMIC_CRATER_CODE)
+        else:
+            intensity_value = max(0.0, min(12.0, intensity_row[column]))
+            intensities[distance] = format_intensity(_SEISMIC_TIERS.code(intensity_value),
+                                                     intensity_value)
+    
+    return intensities
+
+def _blast_effects(scaled_distance_row: list) -> Dict:
+    """Overpressure (psi) and effect by distance"""
+    blast_effects = {}
+    
+    for distance, column in _BLAST_COLUMNS:
+        overpressure, effect = _BLAST_TIERS.lookup(scaled_distance_row[column])
+        
+        blast_effects[distance] = {
+            'overpressure_psi': overpressure,
+            'effect': effect
+        }
+    
+    return blast_effects
+
+def _thermal_effects(thermal_flux_row: list) -> Dict:
+    """Thermal flux and effect by distance"""
+    thermal_effects = {}
+    
+    for distance, column in _THERMAL_COLUMNS:
+        thermal_flux = thermal_flux_row[column]
+        effect, = _THERMAL_TIERS.lookup(thermal_flux)
+        
+        thermal_effects[distance] = {
+            'thermal_flux_cal_cm2': thermal_flux,
+            'effect': effect
+        }
+    
+    return thermal_effects
+
+def _initial_wave_height(energy_mt: float) -> float:
+    """Tsunami wave height generation (simplified model): H = C * E^0.5, meters"""
+    return 0.1 * math.sqrt(energy_mt * 1000)
+
+def _tsunami_effects(wave_height_row: list) -> Dict:
+    """Wave height, arrival time and hazard by distance"""
+    tsunami_effects = {}
+    
+    for distance, column in _TSUNAMI_COLUMNS:
+        wave_height = wave_height_row[column]
+        hazard, = _TSUNAMI_HAZARD_TIERS.lookup(wave_height)
+        
+        tsunami_effects[distance] = {
+            'wave_height_m': wave_height,
+            'arrival_time_hours': _TSUNAMI_ARRIVAL_HOURS[column],
+            'hazard_level': hazard
+        }
+    
+    return tsunami_effects
+
+def _ejecta_effects(thickness_row: list, ejecta_radius: float) -> Dict:
+    """Ejecta thickness and effect by distance inside the blanket"""
+    ejecta_effects = {}
+    
+    for distance, column in _EJECTA_COLUMNS:
+        if distance < ejecta_radius:
+            thickness = thickness_row[column]
+            effect, = _EJECTA_TIERS.lookup(thickness)
+            
+            ejecta_effects[distance] = {
+                'thickness_m': thickness,
+                'effect': effect
+            }
+    
+    return ejecta_effects
+
 class ImpactPhysicsCalculator:
     """Calculate detailed impact physics and consequences"""
     
     # Constants
-    EARTH_GRAVITY = 9.81  # m/s²
-    TNT_EQUIVALENT = 4.184e12  # Joules per megaton TNT
+    EARTH_GRAVITY = EARTH_GRAVITY  # m/s²
+    TNT_EQUIVALENT = JOULES_PER_MEGATON  # Joules per megaton TNT
     
     def __init__(self, params: ImpactParameters):
         self.params = params
         self.results = {}
+        self._profile_rows = None
         
     def calculate_all(self) -> Dict:
-        """Calculate all impact effects"""
-        self.calculate_kinetic_energy()
-        self.calculate_crater_dimensions()
-        self.calculate_seismic_effects()
-        self.calculate_blast_effects()
-        self.calculate_thermal_effects()
-        
-        if self.params.target_type == 'water':
-            self.calculate_tsunami_effects()
-        
-        self.calculate_atmospheric_effects()
-        self.calculate_ejecta_effects()
-        
+        """Calculate all impact effects (memoized per parameter set; returns a private copy)"""
+        self.results = _copy_nested(_cached_results(self.params))
         return self.results
     
+    def _calculate_all_uncached(self) -> Dict:
+        """
+        All steps fused into one pass: intermediates stay in locals and the
+        results dict is built once, in the order the step methods fill it
+        """
+        params = self.params
+        is_water = params.target_type == 'water'
+        
+        mass, kinetic_energy, megatons_tnt, effective_energy = _kinetic_energy_core(
+            float(params.diameter), float(params.velocity),
+            float(params.density), float(params.angle)
+        )
+        energy_mt = effective_energy * _INV_JOULES_PER_MEGATON
+        crater_diameter, crater_depth, crater_volume = _crater_core(
+            energy_mt ** 0.28, 1.8 if params.target_type == 'land' else 2.2
+        )
+        magnitude = _seismic_magnitude(effective_energy)
+        initial_wave_height = _initial_wave_height(energy_mt) if is_water else 0.0
+        intensity_row, blast_row, thermal_row, wave_row, ejecta_row = _distance_profiles(
+            energy_mt, crater_diameter, magnitude, initial_wave_height
+        )
+        ejecta_mass = crater_volume * 2.5e12
+        cooling_effect, duration_years = _COOLING_TIERS.lookup(energy_mt)
+        ejecta_radius = crater_diameter * 2.5
+        
+        results = {
+            'mass': mass,
+            'kinetic_energy_joules': kinetic_energy,
+            'kinetic_energy_megatons': megatons_tnt,
+            'effective_energy': effective_energy,
+            'effective_megatons': energy_mt,
+            'hiroshima_equivalent': megatons_tnt * _INV_HIROSHIMA_MT,
+            'crater_diameter_km': crater_diameter,
+            'crater_diameter_m': crater_diameter * 1000,
+            'crater_depth_km': crater_depth,
+            'crater_depth_m': crater_depth * 1000,
+            'crater_volume_km3': crater_volume,
+            'seismic_magnitude': magnitude,
+            'seismic_intensities': _seismic_intensities(intensity_row, crater_diameter / 2),
+            'blast_effects': _blast_effects(blast_row),
+            'thermal_effects': _thermal_effects(thermal_row)
+        }
+        if is_water:
+            results['tsunami_initial_height_m'] = initial_wave_height
+            results['tsunami_speed_kmh'] = TSUNAMI_SPEED_KMH
+            results['tsunami_effects'] = _tsunami_effects(wave_row)
+        results['ejecta_mass_kg'] = ejecta_mass
+        results['atmospheric_dust_kg'] = ejecta_mass * 0.001
+        results['cooling_effect'] = cooling_effect
+        results['climate_disruption_years'] = duration_years
+        results['ejecta_blanket_radius_km'] = ejecta_radius
+        results['ejecta_effects'] = _ejecta_effects(ejecta_row, ejecta_radius)
+        
+        self.results = results
+        return results
+    
+    # The step methods below fill self.results one stage at a time, each
+    # reading what the earlier stages stored
+    
+    def _profiles(self) -> list:
+        """
+        _distance_profiles from the stages stored so far, computed once and
+        reused by every later step (recomputed if those stages change)
+        """
+        energy_mt = self.results['effective_megatons']
+        key = (energy_mt, self.results['crater_diameter_km'], self.results['seismic_magnitude'])
+        if self._profile_rows is None or self._profile_rows[0] != key:
+            initial_wave_height = (_initial_wave_height(energy_mt)
+                                   if self.params.target_type == 'water' else 0.0)
+            self._profile_rows = (key, _distance_profiles(*key, initial_wave_height))
+        return self._profile_rows[1]
+    
     def calculate_kinetic_energy(self):
         """Calculate impact kinetic energy"""
-        # Calculate mass from diameter and density
-        radius = self.params.diameter / 2  # meters
-        volume = (4/3) * math.pi * (radius ** 3)  # m³
-        mass = volume * self.params.density  # kg
-        
-        # Convert velocity to m/s
-        velocity_ms = self.params.velocity * 1000
-        
-        # Calculate kinetic energy (KE = 0.5 * m * v²)
-        kinetic_energy = 0.5 * mass * (velocity_ms ** 2)  # Joules
-        
-        # Convert to megatons of TNT
-        megatons_tnt = kinetic_energy / self.TNT_EQUIVALENT
-        
-        # Adjust for impact angle (energy dissipation)
-        angle_factor = math.sin(math.radians(self.params.angle))
-        effective_energy = kinetic_energy * angle_factor
+        mass, kinetic_energy, megatons_tnt, effective_energy = _kinetic_energy_core(
+            float(self.params.diameter), float(self.params.velocity),
+            float(self.params.density), float(self.params.angle)
+        )
         
         self.results['mass'] = mass
         self.results['kinetic_energy_joules'] = kinetic_energy
         self.results['kinetic_energy_megatons'] = megatons_tnt
         self.results['effective_energy'] = effective_energy
-        self.results['effective_megatons'] = effective_energy / self.TNT_EQUIVALENT
+        self.results['effective_megatons'] = effective_energy * _INV_JOULES_PER_MEGATON
         
         # Compare to historical events
-        self.results['hiroshima_equivalent'] = megatons_tnt / 0.015  # Hiroshima was ~15 kilotons
+        self.results['hiroshima_equivalent'] = megatons_tnt * _INV_HIROSHIMA_MT
         
     def calculate_crater_dimensions(self):
         """Calculate crater size using scaling laws"""
@@ -77,8 +510,6 @@ class ImpactPhysicsCalculator:
         # D_crater = C * (E)^0.28 where E is in megatons
         # C depends on target material and gravity
         
-        energy_mt = self.results['effective_megatons']
-        
         if self.params.target_type == 'land':
             # For hard rock
             scaling_constant = 1.8  # km per megaton^0.28
@@ -86,14 +517,9 @@ class ImpactPhysicsCalculator:
             # For water (transient crater in seafloor)
             scaling_constant = 2.2
         
-        # Crater diameter (km)
-        crater_diameter = scaling_constant * (energy_mt ** 0.28)
-        
-        # Crater depth (typically 1/5 to 1/3 of diameter)
-        crater_depth = crater_diameter / 5
-        
-        # Crater volume
-        crater_volume = (math.pi / 4) * (crater_diameter ** 2) * crater_depth  # km³
+        crater_diameter, crater_depth, crater_volume = _crater_core(
+            self.results['effective_megatons'] ** 0.28, scaling_constant
+        )
         
         self.results['crater_diameter_km'] = crater_diameter
         self.results['crater_diameter_m'] = crater_diameter * 1000
@@ -103,128 +529,20 @@ class ImpactPhysicsCalculator:
         
     def calculate_seismic_effects(self):
         """Calculate earthquake magnitude from impact"""
-        # Seismic energy relationship with impact energy
-        # M = 0.67 * log10(E) - 5.87 (where E is in Joules)
-        
-        energy_joules = self.results['effective_energy']
-        
-        # Richter magnitude
-        if energy_joules > 0:
-            magnitude = 0.67 * math.log10(energy_joules) - 5.87
-        else:
-            magnitude = 0
-        
-        # Mercalli intensity at various distances
-        crater_radius = self.results['crater_diameter_km'] / 2
-        
-        distances = [10, 50, 100, 500, 1000, 5000]  # km
-        intensities = {}
-        
-        for distance in distances:
-            # Intensity decreases with distance
-            if distance < crater_radius:
-                intensity = "XII (Total destruction)"
-            else:
-                # Simplified intensity calculation
-                intensity_value = magnitude - 1.5 * math.log10(distance / crater_radius)
-                intensity_value = max(0, min(12, intensity_value))
-                
-                if intensity_value >= 10:
-                    intensities[distance] = f"X-XII (Extreme - {intensity_value:.1f})"
-                elif intensity_value >= 8:
-                    intensities[distance] = f"VIII-IX (Severe - {intensity_value:.1f})"
-                elif intensity_value >= 6:
-                    intensities[distance] = f"VI-VII (Strong - {intensity_value:.1f})"
-                elif intensity_value >= 4:
-                    intensities[distance] = f"IV-V (Moderate - {intensity_value:.1f})"
-                else:
-                    intensities[distance] = f"I-III (Minor - {intensity_value:.1f})"
+        magnitude = _seismic_magnitude(self.results['effective_energy'])
         
         self.results['seismic_magnitude'] = magnitude
-        self.results['seismic_intensities'] = intensities
+        self.results['seismic_intensities'] = _seismic_intensities(
+            self._profiles()[0], self.results['crater_diameter_km'] / 2
+        )
         
     def calculate_blast_effects(self):
         """Calculate blast wave overpressure effects"""
-        # Blast overpressure at various distances
-        energy_mt = self.results['effective_megatons']
-        
-        # Scaling law: P = K * (W^0.33 / R) where W is yield, R is range
-        distances = [1, 5, 10, 25, 50, 100, 250, 500]  # km
-        blast_effects = {}
-        
-        for distance in distances:
-            if distance == 0:
-                continue
-            
-            # Overpressure in psi
-            scaled_distance = distance / (energy_mt ** 0.33)
-            
-            if scaled_distance < 0.1:
-                overpressure = 100  # Near total destruction
-                effect = "Complete annihilation"
-            elif scaled_distance < 0.5:
-                overpressure = 20
-                effect = "Reinforced concrete destroyed"
-            elif scaled_distance < 1:
-                overpressure = 10
-                effect = "Heavy damage to buildings"
-            elif scaled_distance < 2:
-                overpressure = 5
-                effect = "Most buildings collapse"
-            elif scaled_distance < 5:
-                overpressure = 2
-                effect = "Moderate damage to structures"
-            elif scaled_distance < 10:
-                overpressure = 1
-                effect = "Window breakage"
-            else:
-                overpressure = 0.1
-                effect = "Minor damage"
-            
-            blast_effects[distance] = {
-                'overpressure_psi': overpressure,
-                'effect': effect
-            }
-        
-        self.results['blast_effects'] = blast_effects
+        self.results['blast_effects'] = _blast_effects(self._profiles()[1])
         
     def calculate_thermal_effects(self):
         """Calculate thermal radiation effects"""
-        energy_mt = self.results['effective_megatons']
-        
-        # Thermal energy (roughly 30% of total energy)
-        thermal_energy_mt = energy_mt * 0.3
-        
-        distances = [1, 5, 10, 25, 50, 100, 250]  # km
-        thermal_effects = {}
-        
-        for distance in distances:
-            if distance == 0:
-                continue
-            
-            # Thermal flux (cal/cm²)
-            # Q = Y * 1e6 / (4 * π * R²) where Y is in MT, R in km
-            thermal_flux = (thermal_energy_mt * 1e6) / (4 * math.pi * (distance ** 2))
-            
-            if thermal_flux > 500:
-                effect = "Everything ignites, vaporization"
-            elif thermal_flux > 100:
-                effect = "Third-degree burns, fires"
-            elif thermal_flux > 40:
-                effect = "Second-degree burns"
-            elif thermal_flux > 10:
-                effect = "First-degree burns"
-            elif thermal_flux > 5:
-                effect = "Pain, minor burns"
-            else:
-                effect = "No significant burns"
-            
-            thermal_effects[distance] = {
-                'thermal_flux_cal_cm2': thermal_flux,
-                'effect': effect
-            }
-        
-        self.results['thermal_effects'] = thermal_effects
+        self.results['thermal_effects'] = _thermal_effects(self._profiles()[2])
         
     def calculate_tsunami_effects(self):
         """Calculate tsunami wave characteristics for ocean impacts"""
@@ -232,81 +550,22 @@ class ImpactPhysicsCalculator:
         if self.params.target_type != 'water':
             return
         
-        energy_mt = self.results['effective_megatons']
-        
-        # Tsunami wave height generation (simplified model)
-        # H = C * E^0.5 where E is energy
-        initial_wave_height = 0.1 * math.sqrt(energy_mt * 1000)  # meters
-        
-        # Wave propagation (deep water tsunami speed ~= sqrt(g*d) where d is depth)
-        # Assume average ocean depth of 4000m
-        tsunami_speed = math.sqrt(self.EARTH_GRAVITY * 4000)  # m/s
-        tsunami_speed_kmh = tsunami_speed * 3.6
-        
-        # Wave height at various distances from impact
-        distances = [100, 500, 1000, 2000, 5000]  # km
-        tsunami_effects = {}
-        
-        for distance in distances:
-            # Wave height decreases with distance (simplified)
-            wave_height = initial_wave_height * math.sqrt(100 / distance)
-            
-            # Time to reach coast
-            time_hours = distance / tsunami_speed_kmh
-            
-            if wave_height > 100:
-                hazard = "Catastrophic - mega-tsunami"
-            elif wave_height > 50:
-                hazard = "Extreme - regional devastation"
-            elif wave_height > 20:
-                hazard = "Severe - major coastal damage"
-            elif wave_height > 10:
-                hazard = "High - significant flooding"
-            elif wave_height > 3:
-                hazard = "Moderate - coastal flooding"
-            else:
-                hazard = "Low - minor effects"
-            
-            tsunami_effects[distance] = {
-                'wave_height_m': wave_height,
-                'arrival_time_hours': time_hours,
-                'hazard_level': hazard
-            }
+        initial_wave_height = _initial_wave_height(self.results['effective_megatons'])
         
         self.results['tsunami_initial_height_m'] = initial_wave_height
-        self.results['tsunami_speed_kmh'] = tsunami_speed_kmh
-        self.results['tsunami_effects'] = tsunami_effects
+        self.results['tsunami_speed_kmh'] = TSUNAMI_SPEED_KMH
+        self.results['tsunami_effects'] = _tsunami_effects(self._profiles()[3])
         
     def calculate_atmospheric_effects(self):
         """Calculate dust and atmospheric disturbance"""
-        energy_mt = self.results['effective_megatons']
-        
         # Ejecta mass into atmosphere
-        crater_volume = self.results['crater_volume_km3']
-        ejecta_mass = crater_volume * 2.5e12  # kg (assuming rock density)
-        
-        # Dust in stratosphere
-        dust_stratosphere = ejecta_mass * 0.001  # kg (rough estimate)
+        ejecta_mass = self.results['crater_volume_km3'] * 2.5e12  # kg (assuming rock density)
         
         # Global cooling estimate
-        if energy_mt > 1e6:
-            cooling_effect = "Extinction-level event"
-            duration_years = 10
-        elif energy_mt > 1e4:
-            cooling_effect = "Global winter"
-            duration_years = 3
-        elif energy_mt > 1000:
-            cooling_effect = "Regional climate disruption"
-            duration_years = 1
-        elif energy_mt > 100:
-            cooling_effect = "Temporary cooling"
-            duration_years = 0.1
-        else:
-            cooling_effect = "Negligible"
-            duration_years = 0
+        cooling_effect, duration_years = _COOLING_TIERS.lookup(self.results['effective_megatons'])
         
         self.results['ejecta_mass_kg'] = ejecta_mass
-        self.results['atmospheric_dust_kg'] = dust_stratosphere
+        self.results['atmospheric_dust_kg'] = ejecta_mass * 0.001  # kg in stratosphere (rough estimate)
         self.results['cooling_effect'] = cooling_effect
         self.results['climate_disruption_years'] = duration_years
         
@@ -317,34 +576,21 @@ class ImpactPhysicsCalculator:
         # Ejecta blanket extends ~2-5 crater radii
         ejecta_radius = crater_diameter * 2.5
         
-        # Thickness decreases with distance
-        distances = [10, 50, 100, 500]  # km from impact
-        ejecta_effects = {}
-        
-        for distance in distances:
-            if distance < ejecta_radius:
-                # Ejecta thickness (simplified)
-                thickness = crater_diameter * 10 / (distance + 1)  # meters
-                
-                if thickness > 100:
-                    effect = "Buried under debris"
-                elif thickness > 10:
-                    effect = "Severe damage from ejecta"
-                elif thickness > 1:
-                    effect = "Moderate ejecta damage"
-                else:
-                    effect = "Light ejecta fallout"
-                
-                ejecta_effects[distance] = {
-                    'thickness_m': thickness,
-                    'effect': effect
-                }
-        
         self.results['ejecta_blanket_radius_km'] = ejecta_radius
-        self.results['ejecta_effects'] = ejecta_effects
+        self.results['ejecta_effects'] = _ejecta_effects(self._profiles()[4], ejecta_radius)
     
     def get_summary(self) -> Dict:
-        """Get human-readable summary of impact"""
+        """Get human-readable summary of impact (built on first use, then shared)"""
+        return self.summary
+    
+    @cached_property
+    def summary(self) -> Dict:
+        """
+        Human-readable summary of impact
+        
+        Computed once per calculator from self.results, so run calculate_all
+        first. The parameters are fixed per calculator, so it never goes stale.
+        """
         summary = {
             'impact_classification': self.classify_impact(),
             'immediate_effects': self.summarize_immediate_effects(),
@@ -358,24 +604,8 @@ class ImpactPhysicsCalculator:
     
     def classify_impact(self) -> str:
         """Classify impact severity"""
-        energy_mt = self.results['effective_megatons']
-        
-        if energy_mt > 1e8:
-            return "Extinction Event (K-T level)"
-        elif energy_mt > 1e6:
-            return "Global Catastrophe"
-        elif energy_mt > 1e4:
-            return "Continental Disaster"
-        elif energy_mt > 1000:
-            return "Regional Catastrophe"
-        elif energy_mt > 100:
-            return "Major Regional Impact"
-        elif energy_mt > 10:
-            return "Significant Local Impact"
-        elif energy_mt > 1:
-            return "Moderate Local Impact"
-        else:
-            return "Minor Impact"
+        label, _, _ = _SEVERITY_TIERS.lookup(self.results['effective_megatons'])
+        return label
     
     def summarize_immediate_effects(self) -> list:
         """List immediate effects at impact site"""
@@ -392,17 +622,20 @@ class ImpactPhysicsCalculator:
         """List regional effects"""
         effects = []
         
-        # Get blast radius for significant damage (5 psi overpressure)
-        for dist, data in self.results['blast_effects'].items():
-            if data['overpressure_psi'] >= 5:
-                blast_radius = dist
+        # Get blast radius for significant damage (5 psi overpressure): overpressure
+        # falls with distance, so scan from the far end; 0 when nowhere reaches it
+        blast_radius = next(
+            (dist for dist, data in reversed(self.results['blast_effects'].items())
+             if data['overpressure_psi'] >= 5),
+            0
+        )
         
         effects.append(f"Severe blast damage out to ~{blast_radius} km")
         effects.append(f"Thermal burns within ~{blast_radius/2} km")
         effects.append(f"Ejecta blanket extends {self.results['ejecta_blanket_radius_km']:.0f} km")
         
         if 'tsunami_effects' in self.results:
-            effects.append(f"Tsunami waves reach coastlines in {list(self.results['tsunami_effects'].values())[0]['arrival_time_hours']:.1f} hours")
+            effects.append(f"Tsunami waves reach coastlines in {_TSUNAMI_FIRST_ARRIVAL_HOURS:.1f} hours")
         
         return effects
     
@@ -426,61 +659,36 @@ class ImpactPhysicsCalculator:
     
     def estimate_casualties(self) -> Dict:
         """Estimate potential casualties"""
-        energy_mt = self.results['effective_megatons']
-        
         # Very rough estimates based on location and population
-        if energy_mt > 1e6:
-            return {
-                'immediate': '1+ billion',
-                'total': 'Majority of human population',
-                'note': 'Extinction-level event'
-            }
-        elif energy_mt > 1e4:
-            return {
-                'immediate': '100+ million',
-                'total': '1+ billion',
-                'note': 'Global catastrophe'
-            }
-        elif energy_mt > 1000:
-            return {
-                'immediate': '1-100 million',
-                'total': '10-500 million',
-                'note': 'Depends heavily on impact location'
-            }
-        elif energy_mt > 100:
-            return {
-                'immediate': '100,000 - 10 million',
-                'total': '1-50 million',
-                'note': 'Major regional disaster'
-            }
-        else:
-            return {
-                'immediate': '1,000 - 1 million',
-                'total': '10,000 - 10 million',
-                'note': 'Significant local impact'
-            }
+        _, casualties, _ = _SEVERITY_TIERS.lookup(self.results['effective_megatons'])
+        return dict(casualties)
     
     def estimate_economic_impact(self) -> Dict:
         """Estimate economic impact"""
-        energy_mt = self.results['effective_megatons']
-        
-        if energy_mt > 1e6:
-            return {'cost_usd': 'Incalculable', 'note': 'End of civilization'}
-        elif energy_mt > 1e4:
-            return {'cost_usd': '$100+ trillion', 'note': 'Global economic collapse'}
-        elif energy_mt > 1000:
-            return {'cost_usd': '$10-100 trillion', 'note': 'Continental devastation'}
-        elif energy_mt > 100:
-            return {'cost_usd': '$1-10 trillion', 'note': 'Regional catastrophe'}
-        else:
-            return {'cost_usd': '$100 billion - $1 trillion', 'note': 'Major disaster'}
+        _, _, economic = _SEVERITY_TIERS.lookup(self.results['effective_megatons'])
+        return dict(economic)
 
 
+# ImpactParameters is frozen and hashable, so it is the cache key itself
+# (equal values such as 100 and 100.0 share an entry, as the results match)
+@lru_cache(maxsize=4096)
+def _cached_results(params: ImpactParameters) -> Dict:
+    """calculate_all results by parameter set; callers must copy before handing them out"""
+    return ImpactPhysicsCalculator(params)._calculate_all_uncached()
+
+def _any_array(*args) -> bool:
+    """True when any argument is a numpy array (the sweep call mode)"""
+    return any(isinstance(arg, np.ndarray) for arg in args)
+
 def calculate_impact(diameter: float, velocity: float, density: float = 3000,
                     angle: float = 45, target_type: str = 'land') -> Dict:
     """
     Convenience function to calculate all impact effects
     
+    The result is cached and shared between callers; copy it before modifying.
+    When any argument is a numpy array the call runs calculate_impact_batch
+    instead and returns its dictionary of arrays.
+    
     Args:
         diameter: Asteroid diameter in meters
         velocity: Impact velocity in km/s
@@ -491,60 +699,201 @@ def calculate_impact(diameter: float, velocity: float, density: float = 3000,
     Returns:
         Dictionary with all impact calculations and summary
     """
+    if _any_array(diameter, velocity, density, angle, target_type):
+        return calculate_impact_batch(diameter, velocity, density, angle, target_type)
+    return _calculate_impact_cached(diameter, velocity, density, angle, target_type)
+
+# The convenience functions are pure, so identical requests share one result.
+# typed=True keeps 100 and 100.0 apart, since 'parameters' echoes the inputs.
+@lru_cache(maxsize=4096, typed=True)
+def _calculate_impact_cached(diameter: float, velocity: float, density: float,
+                             angle: float, target_type: str) -> Dict:
+    """calculate_impact for one impact"""
     params = ImpactParameters(diameter, velocity, density, angle, target_type)
     calculator = ImpactPhysicsCalculator(params)
     results = calculator.calculate_all()
     summary = calculator.get_summary()
     
     return {
-        'parameters': params.__dict__,
+        'parameters': asdict(params),
         'calculations': results,
         'summary': summary
     }
 
-# Enhanced methods for Meteor Madness
-def calculate_enhanced_impact(diameter: float, velocity: float, density: float = 3000,
-                            angle: float = 45, location: str = 'ocean') -> Dict:
+def calculate_impact_batch(diameter, velocity, density=3000, angle=45,
+                           target_type='land') -> Dict[str, np.ndarray]:
     """
-    Enhanced impact calculation for Meteor Madness simulation
+    ImpactPhysicsCalculator.calculate_all for many impacts at once (sweeps, Monte Carlo)
     
     Args:
-        diameter: Asteroid diameter in meters
-        velocity: Impact velocity in km/s
-        density: Asteroid density in kg/m³
-        angle: Impact angle in degrees from horizontal
-        location: Impact location type
+        diameter: Asteroid diameters in meters (array-like, broadcast together)
+        velocity: Impact velocities in km/s
+        density: Asteroid densities in kg/m³
+        angle: Impact angles in degrees from horizontal
+        target_type: 'land' or 'water', per impact or for all
     
     Returns:
-        Comprehensive impact analysis
+        Dictionary of arrays. Scalar quantities have shape (N,). The blast, thermal,
+        tsunami and ejecta effects are structs of arrays: 'distance_km' (K,) plus
+        (N, K) value columns and a uint8 'effect_code' indexing the matching
+        *_LABELS tuple. Samples the scalar calculator reports nothing for (beyond
+        the blanket for ejecta, land impacts for tsunami) are NaN, with
+        NO_EFFECT_CODE as their code. Seismic intensity is NaN inside the crater,
+        where seismic_category_code is SEISMIC_CRATER_CODE; format_intensity
+        turns a code and intensity back into the calculator's label.
     """
-    # Calculate mass
-    radius = diameter / 2
-    volume = (4/3) * math.pi * (radius ** 3)
-    mass = volume * density
+    diameter, velocity, density, angle, target_type = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(column, dtype=np.float64))
+          for column in (diameter, velocity, density, angle)),
+        np.atleast_1d(np.asarray(target_type))
+    )
+    is_land = target_type == 'land'
+    is_water = target_type == 'water'
+    
+    # Kinetic energy, as in _ke_and_mass
+    mass = _SPHERE_VOLUME_PER_D3 * (diameter * diameter * diameter) * density
+    velocity_ms = velocity * 1000
+    kinetic_energy = 0.5 * mass * (velocity_ms * velocity_ms)
+    megatons_tnt = kinetic_energy * _INV_JOULES_PER_MEGATON
+    effective_energy = kinetic_energy * np.sin(angle * _DEG2RAD)
+    energy_mt = effective_energy * _INV_JOULES_PER_MEGATON
+    
+    # Crater dimensions (km)
+    crater_diameter = np.where(is_land, 1.8, 2.2) * np.power(energy_mt, 0.28)
+    crater_depth = crater_diameter / 5
+    crater_volume = (np.pi / 4) * np.power(crater_diameter, 2) * crater_depth
+    crater_radius = crater_diameter[:, None] / 2
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Seismic magnitude and Mercalli intensity per distance
+        magnitude = np.where(effective_energy > 0,
+                             _SEISMIC_K1 * np.log2(effective_energy) - _SEISMIC_K2, 0.0)
+        intensity = np.clip(
+            magnitude[:, None] - 1.5 * np.log10(SEISMIC_DISTANCES_KM / crater_radius), 0, 12
+        )
+        inside_crater = SEISMIC_DISTANCES_KM < crater_radius
+        intensity = np.where(inside_crater, np.nan, intensity)
+        
+        # Blast: distance scaled by yield^0.33
+        scaled_distance = BLAST_DISTANCES_KM / np.power(energy_mt, 0.33)[:, None]
+    overpressure, _ = _BLAST_TIERS.lookup_array(scaled_distance)
     
-    # Calculate kinetic energy
-    velocity_ms = velocity * 1000  # Convert to m/s
-    kinetic_energy = 0.5 * mass * (velocity_ms ** 2)
+    # Thermal flux (cal/cm²) from ~30% of the energy
+    thermal_flux = (energy_mt[:, None] * 0.3 * 1e6) / (4 * np.pi * np.power(THERMAL_DISTANCES_KM, 2))
     
-    # Energy in different units
-    energy_mt = kinetic_energy / (4.184e15)  # Megatons TNT
-    energy_kt = kinetic_energy / (4.184e12)  # Kilotons TNT
+    # Tsunami (water impacts only)
+    initial_wave_height = np.where(is_water, 0.1 * np.sqrt(energy_mt * 1000), np.nan)
+    wave_height = initial_wave_height[:, None] * np.sqrt(100 / TSUNAMI_DISTANCES_KM)
+    
+    # Atmospheric dust and ejecta blanket
+    ejecta_mass = crater_volume * 2.5e12
+    ejecta_radius = crater_diameter * 2.5
+    ejecta_thickness = np.where(
+        EJECTA_DISTANCES_KM < ejecta_radius[:, None],
+        crater_diameter[:, None] * 10 / (EJECTA_DISTANCES_KM + 1),
+        np.nan
+    )
+    
+    return {
+        'mass': mass,
+        'kinetic_energy_joules': kinetic_energy,
+        'kinetic_energy_megatons': megatons_tnt,
+        'effective_energy': effective_energy,
+        'effective_megatons': energy_mt,
+        'hiroshima_equivalent': megatons_tnt * _INV_HIROSHIMA_MT,
+        'crater_diameter_km': crater_diameter,
+        'crater_depth_km': crater_depth,
+        'crater_volume_km3': crater_volume,
+        'seismic_magnitude': magnitude,
+        'seismic_intensity': intensity,
+        'seismic_category_code': np.where(
+            inside_crater, SEISMIC_CRATER_CODE, _SEISMIC_TIERS.code_array(intensity)
+        ).astype(np.uint8),
+        'blast_effects': {
+            'distance_km': BLAST_DISTANCES_KM,
+            'scaled_distance': scaled_distance,
+            'overpressure_psi': overpressure,
+            'effect_code': _BLAST_TIERS.code_array(scaled_distance)
+        },
+        'thermal_effects': {
+            'distance_km': THERMAL_DISTANCES_KM,
+            'thermal_flux_cal_cm2': thermal_flux,
+            'effect_code': _THERMAL_TIERS.code_array(thermal_flux)
+        },
+        'tsunami_initial_height_m': initial_wave_height,
+        'tsunami_effects': {
+            'distance_km': TSUNAMI_DISTANCES_KM,
+            'wave_height_m': wave_height,
+            'arrival_time_hours': TSUNAMI_DISTANCES_KM / TSUNAMI_SPEED_KMH,
+            'effect_code': _TSUNAMI_HAZARD_TIERS.code_array(wave_height)
+        },
+        'ejecta_mass_kg': ejecta_mass,
+        'atmospheric_dust_kg': ejecta_mass * 0.001,
+        'ejecta_blanket_radius_km': ejecta_radius,
+        'ejecta_effects': {
+            'distance_km': EJECTA_DISTANCES_KM,
+            'thickness_m': ejecta_thickness,
+            'effect_code': _EJECTA_TIERS.code_array(ejecta_thickness)
+        }
+    }
+
+# Enhanced methods for Meteor Madness
+
+@njit('UniTuple(float64, 10)(float64, float64, float64, float64)', cache=True)
+def _enhanced_impact_core(diameter: float, velocity: float, density: float,
+                          angle: float) -> Tuple[float, ...]:
+    """Numeric core of calculate_enhanced_impact on plain floats"""
+    mass, kinetic_energy, energy_mt = _ke_and_mass(diameter, velocity, density)
+    energy_kt = kinetic_energy * _INV_JOULES_PER_KILOTON
     
     # Crater calculations
     crater_diameter_km = 1.8 * (energy_mt ** 0.25)
-    angle_factor = (math.sin(math.radians(angle))) ** 0.33
-    crater_diameter_km *= angle_factor
+    crater_diameter_km *= math.sin(angle * _DEG2RAD) ** 0.33
     crater_depth_km = crater_diameter_km * 0.15
     
     # Damage zones
-    fireball_radius = 0.5 * (energy_mt ** 0.4)
+    energy_mt_04 = energy_mt ** 0.4
+    fireball_radius = 0.5 * energy_mt_04
     blast_radius = 2.5 * (energy_mt ** 0.33)
-    thermal_radius = 4.2 * (energy_mt ** 0.4)
+    thermal_radius = 4.2 * energy_mt_04
     
     # Seismic effects
-    seismic_magnitude = max(0, (math.log10(kinetic_energy) - 4.8) / 1.5)
-    seismic_magnitude = min(10, seismic_magnitude)
+    seismic_magnitude = min(10.0, max(0.0, (math.log10(kinetic_energy) - 4.8) / 1.5))
+    
+    return (mass, kinetic_energy, energy_mt, energy_kt, crater_diameter_km,
+            crater_depth_km, fireball_radius, blast_radius, thermal_radius,
+            seismic_magnitude)
+
+def calculate_enhanced_impact(diameter: float, velocity: float, density: float = 3000,
+                            angle: float = 45, location: str = 'ocean') -> Dict:
+    """
+    Enhanced impact calculation for Meteor Madness simulation
+    
+    The result is cached and shared between callers; copy it before modifying.
+    Array arguments broadcast together and give an object array of results.
+    
+    Args:
+        diameter: Asteroid diameter in meters
+        velocity: Impact velocity in km/s
+        density: Asteroid density in kg/m³
+        angle: Impact angle in degrees from horizontal
+        location: Impact location type
+    
+    Returns:
+        Comprehensive impact analysis
+    """
+    if _any_array(diameter, velocity, density, angle, location):
+        return _enhanced_impact_ufunc(diameter, velocity, density, angle, location)
+    return _calculate_enhanced_impact_cached(diameter, velocity, density, angle, location)
+
+@lru_cache(maxsize=4096, typed=True)
+def _calculate_enhanced_impact_cached(diameter: float, velocity: float, density: float,
+                                      angle: float, location: str) -> Dict:
+    """calculate_enhanced_impact for one impact"""
+    (mass, kinetic_energy, energy_mt, energy_kt, crater_diameter_km,
+     crater_depth_km, fireball_radius, blast_radius, thermal_radius,
+     seismic_magnitude) = _enhanced_impact_core(float(diameter), float(velocity),
+                                                float(density), float(angle))
     
     # Location-specific effects
     tsunami_effects = calculate_tsunami_effects(energy_mt, location)
@@ -570,42 +919,66 @@ def calculate_enhanced_impact(diameter: float, velocity: float, density: float =
         }
     }
 
+# Broadcasting fallback for calculate_enhanced_impact, which has no batch kernel:
+# one cached scalar call per element
+_enhanced_impact_ufunc = np.frompyfunc(_calculate_enhanced_impact_cached, 5, 1)
+
+# (risk, height m per MT, range km per MT) by energy in megatons
+_TSUNAMI_RISK_TIERS = _Tiers(
+    (0.1, 1, 10, 100),
+    (('Minimal', 10, 200),
+     ('Low', 5, 100),
+     ('Moderate', 3, 75),
+     ('High', 2, 50),
+     ('Catastrophic', 1, 25)),
+    right=True
+)
+
+def _sea_tsunami_effects(energy_mt: float) -> Dict:
+    """Tsunami effects of an ocean or coastal impact"""
+    risk, height_factor, range_factor = _TSUNAMI_RISK_TIERS.lookup(energy_mt)
+    
+    # The caps only come into play in the top tier
+    return {
+        'tsunami_risk': risk,
+        'tsunami_height_m': min(200, energy_mt * height_factor),
+        'tsunami_range_km': min(15000, energy_mt * range_factor)
+    }
+
+def _no_tsunami_effects(energy_mt: float) -> Dict:
+    """Inland impacts get no tsunami, whatever the energy"""
+    return {
+        'tsunami_risk': 'None',
+        'tsunami_height_m': 0,
+        'tsunami_range_km': 0
+    }
+
+# Tsunami model by impact location, resolved once instead of tested per call
+_TSUNAMI_MODELS = {
+    'ocean': _sea_tsunami_effects,
+    'coast': _sea_tsunami_effects
+}
+
 def calculate_tsunami_effects(energy_mt: float, location: str) -> Dict:
     """Calculate tsunami effects for ocean/coastal impacts"""
-    if location not in ['ocean', 'coast']:
-        return {
-            'tsunami_risk': 'None',
-            'tsunami_height_m': 0,
-            'tsunami_range_km': 0
-        }
+    return _TSUNAMI_MODELS.get(location, _no_tsunami_effects)(energy_mt)
+
+def calculate_tsunami_effects_batch(energy_mt, location) -> Dict[str, np.ndarray]:
+    """
+    calculate_tsunami_effects over arrays of energies (MT) and locations
     
-    if energy_mt < 0.1:
-        return {
-            'tsunami_risk': 'Minimal',
-            'tsunami_height_m': energy_mt * 10,
-            'tsunami_range_km': energy_mt * 200
-        }
-    elif energy_mt < 1:
-        return {
-            'tsunami_risk': 'Low',
-            'tsunami_height_m': energy_mt * 5,
-            'tsunami_range_km': energy_mt * 100
-        }
-    elif energy_mt < 10:
-        return {
-            'tsunami_risk': 'Moderate',
-            'tsunami_height_m': energy_mt * 3,
-            'tsunami_range_km': energy_mt * 75
-        }
-    elif energy_mt < 100:
-        return {
-            'tsunami_risk': 'High',
-            'tsunami_height_m': energy_mt * 2,
-            'tsunami_range_km': energy_mt * 50
-        }
-    else:
-        return {
-            'tsunami_risk': 'Catastrophic',
-            'tsunami_height_m': min(200, energy_mt),
-            'tsunami_range_km': min(15000, energy_mt * 25)
-        }
\ No newline at end of file
+    Returns:
+        Dictionary of arrays: tsunami_risk labels, tsunami_height_m, tsunami_range_km
+    """
+    energy_mt, location = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(energy_mt, dtype=np.float64)), np.atleast_1d(np.asarray(location))
+    )
+    risk, height_factor, range_factor = _TSUNAMI_RISK_TIERS.lookup_array(energy_mt)
+    
+    # Inland impacts get no tsunami, whatever the energy
+    at_sea = np.isin(location, tuple(_TSUNAMI_MODELS))
+    return {
+        'tsunami_risk': np.where(at_sea, risk, 'None'),
+        'tsunami_height_m': np.where(at_sea, np.minimum(200, energy_mt * height_factor), 0.0),
+        'tsunami_range_km': np.where(at_sea, np.minimum(15000, energy_mt * range_factor), 0.0)
+    }
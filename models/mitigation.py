@@ -2,20 +2,220 @@
 Asteroid Deflection and Mitigation Strategies
 """
 import math
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import numpy as np
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from utils.jit import njit
 
-@dataclass
+JOULES_PER_MEGATON = 4.184e15
+
+@lru_cache(maxsize=4096)
+def asteroid_mass(diameter: float, density: float = 3000) -> float:
+    """Mass in kg of a spherical asteroid (diameter in m, density in kg/m³)"""
+    radius = diameter / 2
+    return (4/3) * math.pi * (radius ** 3) * density
+
+def _epoch_seconds(moment: Union[datetime, float]) -> float:
+    """Epoch seconds of a datetime (naive ones read as UTC, so differences match
+    naive datetime arithmetic); floats are taken as epoch seconds already"""
+    if isinstance(moment, datetime):
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+    return float(moment)
+
+# Numeric cores of the MitigationCalculator strategies on plain floats (masses in
+# kg, times in seconds). Each returns (delta_v m/s, deflection distance km, ...)
+# and the methods add the descriptive fields. Explicit signatures compile them
+# eagerly at import.
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True)
+def _kinetic_core(asteroid_mass: float, warning_s: float,
+                  momentum_change: float) -> Tuple[float, float]:
+    """Kinetic impactor: delta_v, deflection distance"""
+    # Change in velocity of asteroid
+    delta_v = momentum_change / asteroid_mass  # m/s
+    
+    # Deflection distance after warning time
+    return delta_v, delta_v * warning_s / 1000  # km
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True)
+def _gravity_core(duration_s: float, warning_s: float, accel: float) -> Tuple[float, float]:
+    """Gravity tractor: delta_v, deflection distance"""
+    # Velocity change (Δv = a * t)
+    delta_v = accel * duration_s  # m/s
+    
+    return delta_v, delta_v * warning_s / 1000  # km
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True)
+def _nuclear_core(asteroid_mass: float, warning_s: float,
+                  coupled_energy_x2: float) -> Tuple[float, float]:
+    """Nuclear standoff/surface detonation: delta_v, deflection distance"""
+    # Momentum transfer sqrt(2 * E * m) over the mass m, as a single sqrt
+    delta_v = math.sqrt(coupled_energy_x2 / asteroid_mass)  # m/s
+    
+    return delta_v, delta_v * warning_s / 1000  # km
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True)
+def _laser_core(asteroid_mass: float, duration_s: float, warning_s: float) -> Tuple[float, float]:
+    """Laser ablation: delta_v, deflection distance"""
+    # Laser power (megawatts)
+    laser_power = 10  # MW
+    
+    # Ablation efficiency
+    efficiency = 0.001  # kg/s per MW
+    
+    # Mass ablated
+    mass_ablated = laser_power * efficiency * duration_s  # kg
+    
+    # Exhaust velocity (typical for sublimation)
+    exhaust_velocity = 1000  # m/s
+    
+    # Momentum transfer (rocket equation): Δv = ve * ln(m / (m - ablated)),
+    # via log1p to stay accurate when only a tiny fraction is ablated. The
+    # fraction is capped so a long mission cannot ablate the whole asteroid.
+    ablated_fraction = min(mass_ablated / asteroid_mass, 0.999)
+    delta_v = -exhaust_velocity * math.log1p(-ablated_fraction)
+    
+    return delta_v, delta_v * warning_s / 1000  # km
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True)
+def _ion_core(asteroid_mass: float, duration_s: float, warning_s: float) -> Tuple[float, float]:
+    """Ion beam shepherd: delta_v, deflection distance"""
+    # Ion beam thrust
+    thrust = 0.5  # Newtons
+    
+    # Acceleration on asteroid
+    accel = thrust / asteroid_mass  # m/s²
+    
+    # Velocity change
+    delta_v = accel * duration_s  # m/s
+    
+    return delta_v, delta_v * warning_s / 1000  # km
+
+@njit('Tuple((float64[:], float64[:], int64[:]))(float64[:], float64[:], float64[:], float64[:], float64)',
+      cache=True)
+def _rank_core(delta_v, success, cost, prep_time, required_dv):
+    """Effectiveness ratios, scores and best-first order of the strategies"""
+    if required_dv > 0:
+        dv_ratios = delta_v / required_dv
+    else:
+        dv_ratios = np.zeros(delta_v.size)
+    scores = (
+        dv_ratios * 0.3 +  # Effectiveness
+        success * 0.3 +  # Success probability
+        (1000 / cost) * 0.2 +  # Cost efficiency
+        (1 / np.maximum(prep_time, 1.0)) * 0.2  # Time to deploy
+    )
+    # Rank by score (mergesort is stable, so ties keep declaration order)
+    return dv_ratios, scores, np.argsort(-scores, kind='mergesort')
+
+# Descriptive fields of each strategy result, shared by every call
+_KINETIC_META = {
+    'technology_readiness': 'High (DART proven)',
+    'advantages': (
+        'Proven technology (NASA DART)',
+        'Relatively low cost',
+        'Fast deployment',
+        'No radioactive materials'
+    ),
+    'disadvantages': (
+        'Single attempt',
+        'Less effective on large asteroids',
+        'Requires precise targeting',
+        'Limited by launch windows'
+    ),
+    'recommended_for': 'Small to medium asteroids (<500m) with 5+ years warning'
+}
+
+_GRAVITY_TRACTOR_META = {
+    'technology_readiness': 'Medium (requires development)',
+    'advantages': (
+        'Precise control',
+        'Adjustable in real-time',
+        'No physical contact needed',
+        'Works on any asteroid type'
+    ),
+    'disadvantages': (
+        'Extremely slow',
+        'Very expensive',
+        'Requires decades of warning',
+        'Complex station-keeping'
+    ),
+    'recommended_for': 'Any size asteroid with 15+ years warning'
+}
+
+_NUCLEAR_META = {
+    'technology_readiness': 'High (but untested in space)',
+    'advantages': (
+        'Most powerful option',
+        'Effective on large asteroids',
+        'Can be deployed quickly',
+        'Multiple devices possible'
+    ),
+    'disadvantages': (
+        'Risk of fragmentation',
+        'International treaty concerns',
+        'Radioactive contamination',
+        'Political challenges'
+    ),
+    'recommended_for': 'Last resort for large asteroids (>500m) or short warning time',
+    'warning': '⚠️ Risk of creating multiple dangerous fragments'
+}
+
+_LASER_ABLATION_META = {
+    'technology_readiness': 'Low (requires significant development)',
+    'advantages': (
+        'Continuous thrust',
+        'Precise control',
+        'No physical contact',
+        'Scalable power'
+    ),
+    'disadvantages': (
+        'Unproven technology',
+        'Requires large power source',
+        'Very expensive',
+        'Slow deflection'
+    ),
+    'recommended_for': 'Future missions with 20+ years warning'
+}
+
+_ION_BEAM_META = {
+    'technology_readiness': 'Medium (ion drives proven)',
+    'advantages': (
+        'More efficient than gravity tractor',
+        'Proven ion drive technology',
+        'Precise control',
+        'No contact needed'
+    ),
+    'disadvantages': (
+        'Slow deflection',
+        'Expensive',
+        'Long mission duration',
+        'Requires decades of warning'
+    ),
+    'recommended_for': 'Medium asteroids with 10+ years warning'
+}
+
+@dataclass(slots=True, frozen=True)
 class DeflectionMission:
     """Parameters for a deflection mission"""
     strategy: str  # 'kinetic_impactor', 'gravity_tractor', 'nuclear', 'laser_ablation', 'ion_beam'
-    launch_date: datetime
+    # None when only launch_ts is given; equality and hashing go by launch_ts
+    launch_date: Optional[datetime] = field(compare=False)
     asteroid_diameter: float  # meters
     asteroid_velocity: float  # km/s
     asteroid_mass: float  # kg
     warning_time_years: float
     mission_duration_years: float = 0
+    launch_ts: Optional[float] = None  # epoch seconds, derived from launch_date when omitted
+    
+    def __post_init__(self):
+        if self.launch_ts is None:
+            object.__setattr__(self, 'launch_ts', _epoch_seconds(self.launch_date))
     
 class MitigationCalculator:
     """Calculate effectiveness of various deflection strategies"""
@@ -26,14 +226,67 @@ class MitigationCalculator:
     GRAVITY_TRACTOR_MASS = 1000  # kg
     NUCLEAR_YIELD_MT = 1  # megatons
     
+    # Momentum enhancement factor (beta) - typically 2-5
+    # Accounts for ejecta momentum
+    KINETIC_BETA = 3.5
+    # Gravitational constant
+    G = 6.674e-11  # m³/kg/s²
+    # Station-keeping distance
+    GRAVITY_TRACTOR_DISTANCE = 100  # meters from asteroid surface
+    # Fraction of energy transferred to asteroid
+    # Standoff detonation: ~1-5% efficiency
+    # Surface detonation: ~10-30% efficiency
+    NUCLEAR_EFFICIENCY = 0.15  # Average assumption
+    
+    SEC_PER_YEAR = 365.25 * 24 * 3600  # Julian year
+    
+    # Success probability tables: one more entry than thresholds, lowest key first.
+    # Diameter ladders compare with '<' (bisect_right puts a diameter equal to a
+    # threshold in the next tier); warning-time ladders with '>' (bisect_left).
+    KINETIC_DIAMETERS = (100, 300, 500)  # m
+    KINETIC_SUCCESS = (0.95, 0.85, 0.70, 0.50)  # Decreases with asteroid size
+    GRAVITY_WARNINGS = (5, 10)  # years
+    GRAVITY_SUCCESS = (0.50, 0.75, 0.90)  # Very high if enough time
+    NUCLEAR_DIAMETERS = (200, 500)  # m
+    NUCLEAR_SUCCESS = (0.85, 0.75, 0.65)
+    NUCLEAR_FRAGMENTATION = (0.60, 0.30, 0.10)  # High risk of breaking small asteroids
+    ION_WARNINGS = (10,)  # years
+    ION_SUCCESS = (0.60, 0.85)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override the mission constants; refold them per class
+        cls._fold_constants()
+    
+    @classmethod
+    def _fold_constants(cls):
+        """Fold the mission constants into the values the strategy kernels take"""
+        # Momentum transferred by the kinetic impactor
+        cls._KINETIC_MOMENTUM = (
+            cls.KINETIC_BETA * cls.KINETIC_IMPACTOR_MASS * (cls.KINETIC_IMPACTOR_VELOCITY * 1000)
+        )  # kg·m/s
+        # Gravitational acceleration on the asteroid from the tractor
+        cls._GRAVITY_ACCEL = cls.G * cls.GRAVITY_TRACTOR_MASS / (cls.GRAVITY_TRACTOR_DISTANCE ** 2)  # m/s²
+        # Twice the detonation energy coupled into the asteroid
+        cls._NUCLEAR_ENERGY_X2 = (
+            2 * cls.NUCLEAR_EFFICIENCY * cls.NUCLEAR_YIELD_MT * JOULES_PER_MEGATON
+        )  # J
+    
     def __init__(self, mission: DeflectionMission):
         self.mission = mission
         self.results = {}
         
-    def calculate_required_deflection(self, impact_date: datetime) -> float:
+        # Every strategy works over the same warning time and mission duration
+        self._warning_s = float(mission.warning_time_years * self.SEC_PER_YEAR)
+        self._duration_s = float(mission.mission_duration_years * self.SEC_PER_YEAR)
+        
+    def calculate_required_deflection(self, impact_date: Union[datetime, float]) -> float:
         """
         Calculate minimum deflection needed to miss Earth
         
+        Args:
+            impact_date: datetime or epoch seconds
+        
         Returns:
             Required velocity change in m/s
         """
@@ -42,8 +295,8 @@ class MitigationCalculator:
         safety_margin = 10 * earth_radius  # Miss by at least 10 Earth radii
         
         # Time until impact
-        time_until_impact = (impact_date - self.mission.launch_date).total_seconds()
-        time_years = time_until_impact / (365.25 * 24 * 3600)
+        time_until_impact = _epoch_seconds(impact_date) - self.mission.launch_ts
+        time_years = time_until_impact / self.SEC_PER_YEAR
         
         # Required deflection distance
         deflection_distance = safety_margin  # km
@@ -51,7 +304,7 @@ class MitigationCalculator:
         # Required velocity change (simplified)
         # Δv needed decreases with more warning time
         delta_v = deflection_distance / time_years  # km/year
-        delta_v_ms = (delta_v * 1000) / (365.25 * 24 * 3600)  # m/s
+        delta_v_ms = (delta_v * 1000) / self.SEC_PER_YEAR  # m/s
         
         self.results['required_delta_v_ms'] = delta_v_ms
         self.results['warning_time_years'] = time_years
@@ -63,31 +316,14 @@ class MitigationCalculator:
         Calculate deflection from kinetic impactor mission
         NASA DART-style mission
         """
-        # Momentum transfer
-        impactor_mass = self.KINETIC_IMPACTOR_MASS
-        impactor_velocity = self.KINETIC_IMPACTOR_VELOCITY * 1000  # m/s
-        
-        # Momentum enhancement factor (beta) - typically 2-5
-        # Accounts for ejecta momentum
-        beta = 3.5
-        
-        # Change in velocity of asteroid
-        momentum_change = beta * impactor_mass * impactor_velocity
-        delta_v = momentum_change / self.mission.asteroid_mass  # m/s
-        
-        # Deflection distance after warning time
-        warning_time_seconds = self.mission.warning_time_years * 365.25 * 24 * 3600
-        deflection_distance = delta_v * warning_time_seconds / 1000  # km
+        delta_v, deflection_distance = _kinetic_core(
+            float(self.mission.asteroid_mass), self._warning_s, float(self._KINETIC_MOMENTUM)
+        )
         
         # Success probability (decreases with asteroid size)
-        if self.mission.asteroid_diameter < 100:
-            success_prob = 0.95
-        elif self.mission.asteroid_diameter < 300:
-            success_prob = 0.85
-        elif self.mission.asteroid_diameter < 500:
-            success_prob = 0.70
-        else:
-            success_prob = 0.50
+        success_prob = self.KINETIC_SUCCESS[
+            bisect_right(self.KINETIC_DIAMETERS, self.mission.asteroid_diameter)
+        ]
         
         # Mission cost estimate (millions USD)
         mission_cost = 300 + (self.mission.asteroid_diameter / 10)
@@ -101,20 +337,7 @@ class MitigationCalculator:
             'success_probability': success_prob,
             'mission_cost_million_usd': mission_cost,
             'preparation_time_years': prep_time,
-            'technology_readiness': 'High (DART proven)',
-            'advantages': [
-                'Proven technology (NASA DART)',
-                'Relatively low cost',
-                'Fast deployment',
-                'No radioactive materials'
-            ],
-            'disadvantages': [
-                'Single attempt',
-                'Less effective on large asteroids',
-                'Requires precise targeting',
-                'Limited by launch windows'
-            ],
-            'recommended_for': 'Small to medium asteroids (<500m) with 5+ years warning'
+            **_KINETIC_META
         }
     
     def gravity_tractor_deflection(self) -> Dict:
@@ -122,33 +345,14 @@ class MitigationCalculator:
         Calculate deflection from gravity tractor mission
         Slow but steady approach
         """
-        # Gravitational constant
-        G = 6.674e-11  # m³/kg/s²
-        
-        # Station-keeping distance
-        distance = 100  # meters from asteroid surface
-        
-        # Gravitational acceleration on asteroid from spacecraft
-        spacecraft_mass = self.GRAVITY_TRACTOR_MASS
-        accel = G * spacecraft_mass / (distance ** 2)  # m/s²
-        
-        # Duration of mission
-        mission_duration_seconds = self.mission.mission_duration_years * 365.25 * 24 * 3600
-        
-        # Velocity change (Δv = a * t)
-        delta_v = accel * mission_duration_seconds  # m/s
-        
-        # Deflection distance
-        warning_time_seconds = self.mission.warning_time_years * 365.25 * 24 * 3600
-        deflection_distance = delta_v * warning_time_seconds / 1000  # km
+        delta_v, deflection_distance = _gravity_core(
+            self._duration_s, self._warning_s, float(self._GRAVITY_ACCEL)
+        )
         
         # Success probability (very high if enough time)
-        if self.mission.warning_time_years > 10:
-            success_prob = 0.90
-        elif self.mission.warning_time_years > 5:
-            success_prob = 0.75
-        else:
-            success_prob = 0.50
+        success_prob = self.GRAVITY_SUCCESS[
+            bisect_left(self.GRAVITY_WARNINGS, self.mission.warning_time_years)
+        ]
         
         # Mission cost (very high due to long duration)
         mission_cost = 1000 + (self.mission.mission_duration_years * 200)
@@ -160,20 +364,7 @@ class MitigationCalculator:
             'mission_cost_million_usd': mission_cost,
             'preparation_time_years': 5,
             'mission_duration_years': self.mission.mission_duration_years,
-            'technology_readiness': 'Medium (requires development)',
-            'advantages': [
-                'Precise control',
-                'Adjustable in real-time',
-                'No physical contact needed',
-                'Works on any asteroid type'
-            ],
-            'disadvantages': [
-                'Extremely slow',
-                'Very expensive',
-                'Requires decades of warning',
-                'Complex station-keeping'
-            ],
-            'recommended_for': 'Any size asteroid with 15+ years warning'
+            **_GRAVITY_TRACTOR_META
         }
     
     def nuclear_deflection(self) -> Dict:
@@ -181,32 +372,14 @@ class MitigationCalculator:
         Calculate deflection from nuclear device
         Last resort option
         """
-        # Nuclear yield
-        yield_mt = self.NUCLEAR_YIELD_MT
-        energy_joules = yield_mt * 4.184e15  # Joules
-        
-        # Fraction of energy transferred to asteroid
-        # Standoff detonation: ~1-5% efficiency
-        # Surface detonation: ~10-30% efficiency
-        efficiency = 0.15  # Average assumption
+        delta_v, deflection_distance = _nuclear_core(
+            float(self.mission.asteroid_mass), self._warning_s, float(self._NUCLEAR_ENERGY_X2)
+        )
         
-        momentum_transfer = math.sqrt(2 * efficiency * energy_joules * self.mission.asteroid_mass)
-        delta_v = momentum_transfer / self.mission.asteroid_mass  # m/s
-        
-        # Deflection distance
-        warning_time_seconds = self.mission.warning_time_years * 365.25 * 24 * 3600
-        deflection_distance = delta_v * warning_time_seconds / 1000  # km
-        
-        # Success probability
-        if self.mission.asteroid_diameter < 200:
-            success_prob = 0.85
-            fragmentation_risk = 0.60  # High risk of breaking asteroid
-        elif self.mission.asteroid_diameter < 500:
-            success_prob = 0.75
-            fragmentation_risk = 0.30
-        else:
-            success_prob = 0.65
-            fragmentation_risk = 0.10
+        # Success probability and fragmentation risk
+        tier = bisect_right(self.NUCLEAR_DIAMETERS, self.mission.asteroid_diameter)
+        success_prob = self.NUCLEAR_SUCCESS[tier]
+        fragmentation_risk = self.NUCLEAR_FRAGMENTATION[tier]
         
         # Mission cost
         mission_cost = 5000  # Very expensive, requires special authorization
@@ -218,21 +391,7 @@ class MitigationCalculator:
             'fragmentation_risk': fragmentation_risk,
             'mission_cost_million_usd': mission_cost,
             'preparation_time_years': 2,
-            'technology_readiness': 'High (but untested in space)',
-            'advantages': [
-                'Most powerful option',
-                'Effective on large asteroids',
-                'Can be deployed quickly',
-                'Multiple devices possible'
-            ],
-            'disadvantages': [
-                'Risk of fragmentation',
-                'International treaty concerns',
-                'Radioactive contamination',
-                'Political challenges'
-            ],
-            'recommended_for': 'Last resort for large asteroids (>500m) or short warning time',
-            'warning': '⚠️ Risk of creating multiple dangerous fragments'
+            **_NUCLEAR_META
         }
     
     def laser_ablation_deflection(self) -> Dict:
@@ -240,28 +399,9 @@ class MitigationCalculator:
         Calculate deflection from laser ablation
         Vaporize surface material to create thrust
         """
-        # Laser power (megawatts)
-        laser_power = 10  # MW
-        
-        # Ablation efficiency
-        efficiency = 0.001  # kg/s per MW
-        
-        # Mission duration
-        mission_duration_seconds = self.mission.mission_duration_years * 365.25 * 24 * 3600
-        
-        # Mass ablated
-        mass_ablated = laser_power * efficiency * mission_duration_seconds  # kg
-        
-        # Exhaust velocity (typical for sublimation)
-        exhaust_velocity = 1000  # m/s
-        
-        # Momentum transfer (rocket equation)
-        delta_v = exhaust_velocity * math.log(self.mission.asteroid_mass / 
-                                              (self.mission.asteroid_mass - mass_ablated))
-        
-        # Deflection distance
-        warning_time_seconds = self.mission.warning_time_years * 365.25 * 24 * 3600
-        deflection_distance = delta_v * warning_time_seconds / 1000  # km
+        delta_v, deflection_distance = _laser_core(
+            float(self.mission.asteroid_mass), self._duration_s, self._warning_s
+        )
         
         # Success probability
         success_prob = 0.65
@@ -276,20 +416,7 @@ class MitigationCalculator:
             'mission_cost_million_usd': mission_cost,
             'preparation_time_years': 8,
             'mission_duration_years': self.mission.mission_duration_years,
-            'technology_readiness': 'Low (requires significant development)',
-            'advantages': [
-                'Continuous thrust',
-                'Precise control',
-                'No physical contact',
-                'Scalable power'
-            ],
-            'disadvantages': [
-                'Unproven technology',
-                'Requires large power source',
-                'Very expensive',
-                'Slow deflection'
-            ],
-            'recommended_for': 'Future missions with 20+ years warning'
+            **_LASER_ABLATION_META
         }
     
     def ion_beam_deflection(self) -> Dict:
@@ -297,27 +424,14 @@ class MitigationCalculator:
         Calculate deflection from ion beam shepherd
         Similar to gravity tractor but uses ion beam
         """
-        # Ion beam thrust
-        thrust = 0.5  # Newtons
-        
-        # Mission duration
-        mission_duration_seconds = self.mission.mission_duration_years * 365.25 * 24 * 3600
-        
-        # Acceleration on asteroid
-        accel = thrust / self.mission.asteroid_mass  # m/s²
-        
-        # Velocity change
-        delta_v = accel * mission_duration_seconds  # m/s
-        
-        # Deflection distance
-        warning_time_seconds = self.mission.warning_time_years * 365.25 * 24 * 3600
-        deflection_distance = delta_v * warning_time_seconds / 1000  # km
+        delta_v, deflection_distance = _ion_core(
+            float(self.mission.asteroid_mass), self._duration_s, self._warning_s
+        )
         
         # Success probability
-        if self.mission.warning_time_years > 10:
-            success_prob = 0.85
-        else:
-            success_prob = 0.60
+        success_prob = self.ION_SUCCESS[
+            bisect_left(self.ION_WARNINGS, self.mission.warning_time_years)
+        ]
         
         # Mission cost
         mission_cost = 1500 + (self.mission.mission_duration_years * 250)
@@ -329,24 +443,24 @@ class MitigationCalculator:
             'mission_cost_million_usd': mission_cost,
             'preparation_time_years': 6,
             'mission_duration_years': self.mission.mission_duration_years,
-            'technology_readiness': 'Medium (ion drives proven)',
-            'advantages': [
-                'More efficient than gravity tractor',
-                'Proven ion drive technology',
-                'Precise control',
-                'No contact needed'
-            ],
-            'disadvantages': [
-                'Slow deflection',
-                'Expensive',
-                'Long mission duration',
-                'Requires decades of warning'
-            ],
-            'recommended_for': 'Medium asteroids with 10+ years warning'
+            **_ION_BEAM_META
         }
     
-    def compare_all_strategies(self, impact_date: datetime) -> Dict:
-        """Compare all deflection strategies"""
+    def compare_all_strategies(self, impact_date: Union[datetime, float]) -> Dict:
+        """
+        Compare all deflection strategies
+        
+        Memoized per calculator class, mission and impact date (a datetime
+        or epoch seconds); the result is shared between callers, copy it
+        before modifying.
+        """
+        comparison, results = _compare_cached(
+            type(self), self.mission, _epoch_seconds(impact_date)
+        )
+        self.results.update(results)
+        return comparison
+    
+    def _compare_all_strategies_uncached(self, impact_date: Union[datetime, float]) -> Dict:
         required_dv = self.calculate_required_deflection(impact_date)
         
         strategies = {
@@ -357,30 +471,28 @@ class MitigationCalculator:
             'ion_beam': self.ion_beam_deflection()
         }
         
-        # Rank strategies
-        rankings = []
-        for name, data in strategies.items():
-            # Calculate effectiveness score
-            dv_ratio = data['delta_v_ms'] / required_dv if required_dv > 0 else 0
-            
-            # Weighted score
-            score = (
-                dv_ratio * 0.3 +  # Effectiveness
-                data['success_probability'] * 0.3 +  # Success probability
-                (1000 / data['mission_cost_million_usd']) * 0.2 +  # Cost efficiency
-                (1 / max(data['preparation_time_years'], 1)) * 0.2  # Time to deploy
-            )
-            
-            rankings.append({
-                'strategy': name,
-                'score': score,
-                'is_sufficient': dv_ratio >= 1.0,
-                'effectiveness_ratio': dv_ratio,
-                'data': data
-            })
-        
-        # Sort by score
-        rankings.sort(key=lambda x: x['score'], reverse=True)
+        # Score and rank all strategies in one compiled pass over the metric columns
+        names = list(strategies)
+        results = list(strategies.values())
+        delta_v, success, cost, prep_time = np.array([
+            (data['delta_v_ms'], data['success_probability'],
+             data['mission_cost_million_usd'], data['preparation_time_years'])
+            for data in results
+        ], dtype=np.float64).T.copy()
+        dv_ratios, scores, order = _rank_core(delta_v, success, cost, prep_time, float(required_dv))
+        
+        dv_ratios = dv_ratios.tolist()
+        score_list = scores.tolist()
+        rankings = [
+            {
+                'strategy': names[i],
+                'score': score_list[i],
+                'is_sufficient': dv_ratios[i] >= 1.0,
+                'effectiveness_ratio': dv_ratios[i],
+                'data': results[i]
+            }
+            for i in order.tolist()
+        ]
         
         # Recommendations
         recommendations = self.generate_recommendations(rankings, required_dv)
@@ -452,6 +564,17 @@ class MitigationCalculator:
             }
 
 
+MitigationCalculator._fold_constants()
+
+
+@lru_cache(maxsize=256)
+def _compare_cached(calculator_class, mission: DeflectionMission,
+                    impact_ts: float) -> Tuple[Dict, Dict]:
+    """compare_all_strategies and the calculator's results for one mission"""
+    calculator = calculator_class(mission)
+    comparison = calculator._compare_all_strategies_uncached(impact_ts)
+    return comparison, calculator.results
+
 def simulate_deflection_scenario(
     asteroid_diameter: float,
     asteroid_velocity: float,
@@ -467,33 +590,128 @@ def simulate_deflection_scenario(
         asteroid_diameter: meters
         asteroid_velocity: km/s
         warning_years: years of warning time
-        impact_date: predicted impact date
+        impact_date: predicted impact date (datetime or epoch seconds)
         strategy: deflection strategy to use
         mission_duration_years: duration for continuous strategies
     
     Returns:
         Complete simulation results
     """
-    # Calculate asteroid mass
-    radius = asteroid_diameter / 2
-    volume = (4/3) * math.pi * (radius ** 3)
-    density = 3000  # kg/m³
-    mass = volume * density
-    
-    # Create mission
-    launch_date = impact_date - timedelta(days=warning_years * 365.25)
+    # Calculate asteroid mass (3000 kg/m³ rocky body)
+    mass = asteroid_mass(asteroid_diameter)
+    
+    # Create mission, launched warning_years (Julian) before impact; the time
+    # arithmetic stays in epoch seconds
+    impact_ts = _epoch_seconds(impact_date)
     mission = DeflectionMission(
         strategy=strategy,
-        launch_date=launch_date,
+        launch_date=None,
         asteroid_diameter=asteroid_diameter,
         asteroid_velocity=asteroid_velocity,
         asteroid_mass=mass,
         warning_time_years=warning_years,
-        mission_duration_years=mission_duration_years
+        mission_duration_years=mission_duration_years,
+        launch_ts=impact_ts - warning_years * MitigationCalculator.SEC_PER_YEAR
     )
     
     # Calculate deflection
     calculator = MitigationCalculator(mission)
-    comparison = calculator.compare_all_strategies(impact_date)
+    comparison = calculator.compare_all_strategies(impact_ts)
     
     return comparison
+
+# Strategy order of the (N, 5) arrays returned by simulate_deflection_scenarios_batch
+STRATEGY_NAMES = ('kinetic_impactor', 'gravity_tractor', 'nuclear', 'laser_ablation', 'ion_beam')
+
+def simulate_deflection_scenarios_batch(
+    asteroid_diameter,
+    warning_years,
+    mission_duration_years=5
+) -> Dict[str, np.ndarray]:
+    """
+    compare_all_strategies for many asteroids at once (risk studies, sweeps)
+    
+    The required deflection only depends on the warning time, so no impact
+    dates are needed; asteroid velocity does not enter the strategy models.
+    
+    Args:
+        asteroid_diameter: meters (array-like, broadcast with the other arguments)
+        warning_years: years of warning time
+        mission_duration_years: duration for continuous strategies
+    
+    Returns:
+        Dictionary of arrays: per-asteroid mass_kg, required_deflection_ms,
+        fragmentation_risk (nuclear option) and best_strategy (indices into
+        STRATEGY_NAMES) of shape (N,), and per-strategy metrics of shape (N, 5)
+        with columns in STRATEGY_NAMES order
+    """
+    diameter, warning, duration = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(column, dtype=np.float64))
+          for column in (asteroid_diameter, warning_years, mission_duration_years))
+    )
+    calc = MitigationCalculator
+    mass = (4/3) * np.pi * ((diameter / 2) ** 3) * 3000
+    warning_s = warning * calc.SEC_PER_YEAR
+    duration_s = duration * calc.SEC_PER_YEAR
+    
+    # Required deflection: 10 Earth radii over the warning time
+    with np.errstate(divide='ignore'):
+        required_dv = ((10 * 6371 / warning) * 1000) / calc.SEC_PER_YEAR
+    
+    # Delta-v per strategy, as in the _*_core kernels
+    delta_v = np.stack([
+        calc._KINETIC_MOMENTUM / mass,
+        calc._GRAVITY_ACCEL * duration_s,
+        np.sqrt(calc._NUCLEAR_ENERGY_X2 / mass),
+        -1000 * np.log1p(-np.minimum(10 * 0.001 * duration_s / mass, 0.999)),
+        0.5 / mass * duration_s
+    ], axis=1)
+    
+    # Success tables of MitigationCalculator, '<' ladders on the right side
+    nuclear_tier = np.searchsorted(calc.NUCLEAR_DIAMETERS, diameter, side='right')
+    success = np.stack([
+        np.take(calc.KINETIC_SUCCESS, np.searchsorted(calc.KINETIC_DIAMETERS, diameter, side='right')),
+        np.take(calc.GRAVITY_SUCCESS, np.searchsorted(calc.GRAVITY_WARNINGS, warning, side='left')),
+        np.take(calc.NUCLEAR_SUCCESS, nuclear_tier),
+        np.full_like(diameter, 0.65),
+        np.take(calc.ION_SUCCESS, np.searchsorted(calc.ION_WARNINGS, warning, side='left'))
+    ], axis=1)
+    cost = np.stack([
+        300 + (diameter / 10),
+        1000 + (duration * 200),
+        np.full_like(diameter, 5000.0),
+        2000 + (duration * 300),
+        1500 + (duration * 250)
+    ], axis=1)
+    prep_time = np.stack([
+        3 + (diameter / 200),
+        np.full_like(diameter, 5.0),
+        np.full_like(diameter, 2.0),
+        np.full_like(diameter, 8.0),
+        np.full_like(diameter, 6.0)
+    ], axis=1)
+    
+    # Scoring as in compare_all_strategies
+    positive = (required_dv > 0)[:, None]
+    dv_ratios = np.where(positive, delta_v / np.where(positive, required_dv[:, None], 1), 0.0)
+    scores = (
+        dv_ratios * 0.3 +
+        success * 0.3 +
+        (1000 / cost) * 0.2 +
+        (1 / np.maximum(prep_time, 1)) * 0.2
+    )
+    
+    return {
+        'mass_kg': mass,
+        'required_deflection_ms': required_dv,
+        'delta_v_ms': delta_v,
+        'deflection_distance_km': delta_v * warning_s[:, None] / 1000,
+        'success_probability': success,
+        'fragmentation_risk': np.take(calc.NUCLEAR_FRAGMENTATION, nuclear_tier),
+        'mission_cost_million_usd': cost,
+        'preparation_time_years': prep_time,
+        'effectiveness_ratio': dv_ratios,
+        'score': scores,
+        'is_sufficient': dv_ratios >= 1.0,
+        'best_strategy': np.argmax(scores, axis=1)
+    }
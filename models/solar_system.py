@@ -6,7 +6,7 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import math
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CelestialBody:
     """Base class for all celestial bodies"""
     name: str
@@ -19,7 +19,7 @@ class CelestialBody:
     discovery_date: Optional[str] = None
     description: str = ""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Planet(CelestialBody):
     """Planet data model"""
     planet_type: str = "terrestrial"  # terrestrial, gas_giant, ice_giant
@@ -36,7 +36,7 @@ class Planet(CelestialBody):
             return math.sqrt(1.327e11 / (self.distance_from_sun * 1.496e8))
         return 0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Moon(CelestialBody):
     """Moon/satellite data model"""
     parent_planet: str = ""
@@ -44,13 +44,13 @@ class Moon(CelestialBody):
     synchronous_rotation: bool = True
     surface_composition: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DwarfPlanet(CelestialBody):
     """Dwarf planet data model"""
     classification_criteria: List[str] = field(default_factory=list)
     location: str = ""  # asteroid belt, kuiper belt, etc.
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpaceMission:
     """Space mission data model"""
     name: str = ""
@@ -64,7 +64,7 @@ class SpaceMission:
     description: str = ""
     achievements: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Astronaut:
     """Astronaut data model"""
     name: str = ""
@@ -84,6 +84,16 @@ class SolarSystemDatabase:
         self.moons = self._initialize_major_moons()
         self.missions = self._initialize_missions()
         
+        # Lowercased search keys, built once since the database never changes
+        self._body_search_index = [
+            (body.name.lower(), body)
+            for body in (*self.planets.values(), *self.moons.values(), *self.dwarf_planets.values())
+        ]
+        self._mission_search_index = [
+            (mission.name.lower(), mission.country.lower(), mission)
+            for mission in self.missions.values()
+        ]
+        
     def _initialize_planets(self) -> Dict[str, Planet]:
         """Initialize planet data"""
         return {
@@ -339,23 +349,14 @@ class SolarSystemDatabase:
                 if mission.country.upper() == country.upper()]
     
     def search_celestial_bodies(self, query: str) -> List[CelestialBody]:
-        """Search for celestial bodies by name"""
-        results = []
+        """Search planets, moons and dwarf planets by name"""
         query_lower = query.lower()
-        
-        # Search planets
-        for planet in self.planets.values():
-            if query_lower in planet.name.lower():
-                results.append(planet)
-        
-        # Search moons
-        for moon in self.moons.values():
-            if query_lower in moon.name.lower():
-                results.append(moon)
-        
-        # Search dwarf planets
-        for dwarf_planet in self.dwarf_planets.values():
-            if query_lower in dwarf_planet.name.lower():
-                results.append(dwarf_planet)
-        
-        return results
\ No newline at end of file
+        return [body for name, body in self._body_search_index if query_lower in name]
+    
+    def search_missions(self, query: str) -> List[SpaceMission]:
+        """Search missions by name or country"""
+        query_lower = query.lower()
+        return [
+            mission for name, country, mission in self._mission_search_index
+            if query_lower in name or query_lower in country
+        ]
\ No newline at end of file
@@ -2,12 +2,30 @@
 Real-time space tracking and Stellarium-like functionality
 """
 import math
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import requests
 from dataclasses import dataclass
 from utils.nasa_api import nasa_client
 
+# Default satellites of interest
+DEFAULT_SATELLITE_IDS = [
+    25544,  # ISS
+    20580,  # HST (Hubble)
+    43013,  # Starlink example
+    37849,  # JWST
+    41765   # Tiangong
+]
+
+SATELLITE_NAMES = {
+    25544: 'International Space Station',
+    20580: 'Hubble Space Telescope',
+    43013: 'Starlink Satellite',
+    37849: 'James Webb Space Telescope',
+    41765: 'Tiangong Space Station'
+}
+
 @dataclass
 class SatellitePosition:
     """Satellite position data"""
@@ -88,51 +106,34 @@ class SpaceTracker:
     
     def get_satellite_positions(self, satellite_ids: List[int] = None) -> Dict[str, SatellitePosition]:
         """Get positions of multiple satellites"""
-        satellites = {}
-        
         if satellite_ids is None:
-            # Default satellites of interest
-            satellite_ids = [
-                25544,  # ISS
-                20580,  # HST (Hubble)
-                43013,  # Starlink example
-                37849,  # JWST
-                41765   # Tiangong
-            ]
+            satellite_ids = DEFAULT_SATELLITE_IDS
         
-        satellite_names = {
-            25544: 'International Space Station',
-            20580: 'Hubble Space Telescope',
-            43013: 'Starlink Satellite',
-            37849: 'James Webb Space Telescope',
-            41765: 'Tiangong Space Station'
-        }
+        # Sample satellite position calculation
+        # In real implementation, this would use TLE data and orbital mechanics
+        current_time = datetime.now()
         
-        for sat_id in satellite_ids:
-            try:
-                # Sample satellite position calculation
-                # In real implementation, this would use TLE data and orbital mechanics
-                current_time = datetime.now()
-                
-                # Simulate orbital motion
-                orbit_fraction = (current_time.minute / 60.0) + (current_time.second / 3600.0)
-                lat = 51.6 * math.sin(2 * math.pi * orbit_fraction)
-                lon = (orbit_fraction * 360) % 360 - 180
-                
-                satellites[str(sat_id)] = SatellitePosition(
-                    name=satellite_names.get(sat_id, f'Satellite {sat_id}'),
-                    latitude=lat,
-                    longitude=lon,
-                    altitude=408 + (sat_id % 100),
-                    velocity=7.66,
-                    timestamp=current_time,
-                    visibility='visible' if abs(lat) < 60 else 'eclipsed'
-                )
-                
-            except Exception as e:
-                print(f"Error getting satellite {sat_id}: {e}")
+        # Simulate orbital motion (one snapshot time shared by all satellites)
+        orbit_fraction = (current_time.minute / 60.0) + (current_time.second / 3600.0)
+        lat = 51.6 * math.sin(2 * math.pi * orbit_fraction)
+        lon = (orbit_fraction * 360) % 360 - 180
+        visibility = 'visible' if abs(lat) < 60 else 'eclipsed'
         
-        return satellites
+        # Per-satellite terms evaluated for the whole batch at once
+        altitudes = (408 + np.asarray(satellite_ids, dtype=np.int64) % 100).tolist()
+        
+        return {
+            str(sat_id): SatellitePosition(
+                name=SATELLITE_NAMES.get(sat_id, f'Satellite {sat_id}'),
+                latitude=lat,
+                longitude=lon,
+                altitude=altitude,
+                velocity=7.66,
+                timestamp=current_time,
+                visibility=visibility
+            )
+            for sat_id, altitude in zip(satellite_ids, altitudes)
+        }
 
 class StellariumEngine:
     """Stellarium-like sky simulation engine"""
@@ -149,30 +150,41 @@ class StellariumEngine:
         """Set observation time"""
         self.current_time = observation_time or datetime.now()
     
-    def get_sky_view(self) -> Dict:
-        """Get current sky view for observer location and time"""
+    def get_sky_view(self, lat: float = None, lon: float = None, elevation: float = 0,
+                     observation_time: datetime = None) -> Dict:
+        """
+        Get sky view for an observer location and time
+        
+        Location and time are passed per call so a shared engine can serve
+        concurrent requests; omitted values fall back to the engine defaults.
+        """
+        if lat is None or lon is None:
+            observer = self.observer_location
+        else:
+            observer = {'lat': lat, 'lon': lon, 'elevation': elevation}
+        observation_time = observation_time or self.current_time
         
         sky_data = {
-            'observer': self.observer_location,
-            'observation_time': self.current_time.isoformat(),
-            'sun': self._get_sun_position(),
-            'moon': self._get_moon_position(),
+            'observer': observer,
+            'observation_time': observation_time.isoformat(),
+            'sun': self._get_sun_position(observer, observation_time),
+            'moon': self._get_moon_position(observation_time),
             'planets': self._get_planet_positions(),
             'satellites': self._get_visible_satellites(),
             'stars': self._get_bright_stars(),
             'constellations': self._get_visible_constellations(),
             'deep_sky': self._get_deep_sky_objects(),
-            'meteors': self._get_meteor_showers(),
+            'meteors': self._get_meteor_showers(observation_time),
             'local_conditions': self._get_local_conditions()
         }
         
         return sky_data
     
-    def _get_sun_position(self) -> SkyObject:
+    def _get_sun_position(self, observer: Dict, observation_time: datetime) -> SkyObject:
         """Calculate sun position"""
         # Simplified sun position calculation
-        day_of_year = self.current_time.timetuple().tm_yday
-        hour = self.current_time.hour + self.current_time.minute/60.0
+        day_of_year = observation_time.timetuple().tm_yday
+        hour = observation_time.hour + observation_time.minute/60.0
         
         # Solar declination approximation
         declination = 23.45 * math.sin(math.radians((360/365) * (day_of_year - 81)))
@@ -181,7 +193,7 @@ class StellariumEngine:
         hour_angle = 15 * (hour - 12)
         
         # Convert to altitude and azimuth
-        lat_rad = math.radians(self.observer_location['lat'])
+        lat_rad = math.radians(observer['lat'])
         dec_rad = math.radians(declination)
         ha_rad = math.radians(hour_angle)
         
@@ -205,10 +217,10 @@ class StellariumEngine:
             visible=altitude > 0
         )
     
-    def _get_moon_position(self) -> Dict:
+    def _get_moon_position(self, observation_time: datetime) -> Dict:
         """Calculate moon position and phase"""
         # Simplified moon calculations
-        days_since_new = (self.current_time - datetime(2025, 1, 1)).days % 29.53
+        days_since_new = (observation_time - datetime(2025, 1, 1)).days % 29.53
         phase = days_since_new / 29.53
         
         # Moon position (simplified)
@@ -338,10 +350,10 @@ class StellariumEngine:
         
         return objects
     
-    def _get_meteor_showers(self) -> List[Dict]:
+    def _get_meteor_showers(self, observation_time: datetime) -> List[Dict]:
         """Get active meteor showers"""
         # Sample meteor shower data
-        current_month = self.current_time.month
+        current_month = observation_time.month
         
         shower_calendar = {
             1: [{'name': 'Quadrantids', 'peak': '2025-01-04', 'zhr': 120}],
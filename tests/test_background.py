@@ -0,0 +1,23 @@
+"""
+PeriodicSnapshot refresh behaviour (driven inline, without the thread)
+"""
+from utils.background import PeriodicSnapshot
+
+
+def test_error_payload_is_not_held():
+    payloads = iter([{'error': 'NEO feed unavailable'}, {'near_earth_objects': {'2025-01-01': []}}])
+    snapshot = PeriodicSnapshot(lambda: next(payloads), 3600, 'test', retry_interval=60)
+    
+    assert snapshot.get() == {'error': 'NEO feed unavailable'}
+    # The failed fetch was not kept, so the next read fetches again
+    assert snapshot.get() == {'near_earth_objects': {'2025-01-01': []}}
+
+
+def test_error_keeps_previous_snapshot():
+    payloads = iter([{'count': 1}, {'error': 'timeout'}])
+    snapshot = PeriodicSnapshot(lambda: next(payloads), 3600, 'test')
+    
+    snapshot.refresh()
+    
+    assert snapshot.refresh() == {'count': 1}
+    assert snapshot.get() == {'count': 1}
@@ -0,0 +1,130 @@
+"""
+Batch (NumPy array) paths agree with the scalar models they vectorize
+"""
+import math
+from datetime import datetime
+import numpy as np
+import pytest
+from models.asteroid import Asteroid, AsteroidBatch
+from models.deflection import (
+    gravity_tractor_effectiveness, kinetic_impactor_effectiveness,
+    nuclear_option_effectiveness, strategy_grid, strategy_masks
+)
+from models.impact_physics import (
+    BLAST_EFFECT_LABELS, EJECTA_EFFECT_LABELS, SEISMIC_CRATER_CODE, THERMAL_EFFECT_LABELS,
+    TSUNAMI_HAZARD_LABELS, calculate_impact, calculate_impact_batch, format_intensity
+)
+from models.mitigation import (
+    STRATEGY_NAMES, simulate_deflection_scenario, simulate_deflection_scenarios_batch
+)
+
+DIAMETERS = np.array([5, 40, 150, 300, 1000, 12000], dtype=np.float64)
+VELOCITIES = np.array([11, 17, 20, 25, 42, 70], dtype=np.float64)
+DENSITIES = np.array([1000, 3000, 3000, 8000, 2500, 3000], dtype=np.float64)
+ANGLES = np.array([10, 30, 45, 60, 75, 90], dtype=np.float64)
+
+
+def test_asteroid_batch_matches_asteroid():
+    batch = AsteroidBatch(DIAMETERS, VELOCITIES, DENSITIES, ANGLES)
+    
+    for i in range(len(batch)):
+        single = Asteroid(DIAMETERS[i], VELOCITIES[i], DENSITIES[i], ANGLES[i])
+        for name in ("mass", "kinetic_energy", "impact_energy", "tnt_equivalent"):
+            assert getattr(batch, name)[i] == pytest.approx(getattr(single, name), rel=1e-12)
+
+
+@pytest.mark.parametrize('target_type', ['land', 'water'])
+def test_calculate_impact_batch_matches_scalar(target_type):
+    batch = calculate_impact_batch(DIAMETERS, VELOCITIES, DENSITIES, ANGLES, target_type)
+    
+    for i in range(DIAMETERS.size):
+        single = calculate_impact(float(DIAMETERS[i]), float(VELOCITIES[i]), float(DENSITIES[i]),
+                                  float(ANGLES[i]), target_type)['calculations']
+        for key in ('mass', 'kinetic_energy_joules', 'effective_megatons', 'crater_diameter_km',
+                    'crater_volume_km3', 'seismic_magnitude', 'ejecta_mass_kg',
+                    'ejecta_blanket_radius_km'):
+            assert batch[key][i] == pytest.approx(single[key], rel=1e-12), key
+        
+        for j, distance in enumerate(batch['blast_effects']['distance_km'].astype(int).tolist()):
+            effect = single['blast_effects'][distance]
+            assert batch['blast_effects']['overpressure_psi'][i, j] == effect['overpressure_psi']
+            assert BLAST_EFFECT_LABELS[batch['blast_effects']['effect_code'][i, j]] == effect['effect']
+        
+        for j, distance in enumerate(batch['thermal_effects']['distance_km'].astype(int).tolist()):
+            effect = single['thermal_effects'][distance]
+            assert batch['thermal_effects']['thermal_flux_cal_cm2'][i, j] == pytest.approx(
+                effect['thermal_flux_cal_cm2'], rel=1e-12)
+            assert THERMAL_EFFECT_LABELS[batch['thermal_effects']['effect_code'][i, j]] == effect['effect']
+        
+        codes = batch['seismic_category_code'][i]
+        for j, (distance, label) in enumerate(single['seismic_intensities'].items()):
+            if codes[j] == SEISMIC_CRATER_CODE:
+                assert label == format_intensity(SEISMIC_CRATER_CODE)
+            else:
+                assert label == format_intensity(codes[j], batch['seismic_intensity'][i, j])
+        
+        ejecta = batch['ejecta_effects']
+        expected = {
+            distance: (thickness, EJECTA_EFFECT_LABELS[code])
+            for distance, thickness, code in zip(ejecta['distance_km'].astype(int).tolist(),
+                                                 ejecta['thickness_m'][i], ejecta['effect_code'][i])
+            if not math.isnan(thickness)
+        }
+        assert list(expected) == list(single['ejecta_effects'])
+        for distance, (thickness, label) in expected.items():
+            assert thickness == pytest.approx(single['ejecta_effects'][distance]['thickness_m'], rel=1e-12)
+            assert label == single['ejecta_effects'][distance]['effect']
+        
+        if target_type == 'water':
+            tsunami = batch['tsunami_effects']
+            for j, distance in enumerate(tsunami['distance_km'].astype(int).tolist()):
+                effect = single['tsunami_effects'][distance]
+                assert tsunami['wave_height_m'][i, j] == pytest.approx(effect['wave_height_m'], rel=1e-12)
+                assert TSUNAMI_HAZARD_LABELS[tsunami['effect_code'][i, j]] == effect['hazard_level']
+        else:
+            assert 'tsunami_effects' not in single
+            assert np.isnan(batch['tsunami_initial_height_m'][i])
+
+
+def test_calculate_impact_dispatches_arrays_to_batch():
+    result = calculate_impact(DIAMETERS, 20.0)
+    
+    assert result['mass'].shape == DIAMETERS.shape
+
+
+def test_strategy_grid_matches_scalar_functions():
+    diameters = [50, 120, 300, 499, 800]
+    times = [10, 30, 90, 364, 365, 2000]
+    velocity = 18
+    grid = strategy_grid(diameters, times, velocity)
+    
+    for i, diameter in enumerate(diameters):
+        for j, days in enumerate(times):
+            kinetic_ok, gravity_ok, nuclear_ok = strategy_masks(diameter, days)
+            expected = {
+                "kinetic": kinetic_impactor_effectiveness(diameter, velocity, days) if kinetic_ok else None,
+                "gravity_tractor": gravity_tractor_effectiveness(diameter, days) if gravity_ok else None,
+                "nuclear": nuclear_option_effectiveness(diameter, velocity) if nuclear_ok else None
+            }
+            for method, value in expected.items():
+                if value is None:
+                    assert np.isnan(grid[method][i, j])
+                else:
+                    assert grid[method][i, j] == value
+
+
+def test_deflection_scenarios_batch_matches_scalar():
+    diameters = [50, 100, 250, 300, 600, 1500]
+    warnings = [0.5, 3, 5, 10, 12, 30]
+    batch = simulate_deflection_scenarios_batch(diameters, warnings, 5)
+    
+    for i, (diameter, warning) in enumerate(zip(diameters, warnings)):
+        single = simulate_deflection_scenario(diameter, 18.0, warning, datetime(2040, 1, 1),
+                                              mission_duration_years=5)
+        assert batch['required_deflection_ms'][i] == pytest.approx(single['required_deflection_ms'], rel=1e-9)
+        assert STRATEGY_NAMES[batch['best_strategy'][i]] == single['rankings'][0]['strategy']
+        for k, name in enumerate(STRATEGY_NAMES):
+            data = single['strategies'][name]
+            for key in ('delta_v_ms', 'success_probability', 'mission_cost_million_usd',
+                        'preparation_time_years'):
+                assert batch[key][i, k] == pytest.approx(data[key], rel=1e-12), (name, key)
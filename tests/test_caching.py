@@ -0,0 +1,84 @@
+"""
+Memoized results: private copies stay private, shared results stay unchanged
+"""
+import copy
+import dataclasses
+from datetime import datetime
+import pytest
+from models.asteroid import Asteroid
+from models.deflection import evaluate_all
+from models.impact_physics import (
+    ImpactParameters, ImpactPhysicsCalculator, calculate_enhanced_impact, calculate_impact
+)
+from models.mitigation import DeflectionMission, MitigationCalculator, asteroid_mass
+
+
+def test_calculate_all_returns_private_copy():
+    params = ImpactParameters(diameter=220, velocity=21, density=3000, angle=50, target_type='water')
+    first = ImpactPhysicsCalculator(params).calculate_all()
+    expected = copy.deepcopy(first)
+    
+    first['mass'] = -1
+    first['blast_effects'][1]['effect'] = 'changed'
+    first['tsunami_effects'].clear()
+    
+    assert ImpactPhysicsCalculator(params).calculate_all() == expected
+
+
+def test_calculate_impact_shares_one_unchanged_result():
+    first = calculate_impact(180, 19, 3000, 40, 'land')
+    expected = copy.deepcopy(first)
+    
+    # A calculator over the same parameters works on its own copy
+    ImpactPhysicsCalculator(ImpactParameters(180, 19, 3000, 40, 'land')).calculate_all()['mass'] = 0
+    
+    second = calculate_impact(180, 19, 3000, 40, 'land')
+    assert second is first
+    assert second == expected
+    # typed cache: an int and a float diameter are separate entries
+    assert calculate_impact(180.0, 19, 3000, 40, 'land') is not first
+
+
+def test_calculate_enhanced_impact_is_memoized():
+    first = calculate_enhanced_impact(90, 17, 3000, 45, 'ocean')
+    
+    assert calculate_enhanced_impact(90, 17, 3000, 45, 'ocean') is first
+
+
+def test_evaluate_all_result_is_read_only():
+    probabilities = evaluate_all(250, 18, 800)
+    
+    with pytest.raises(ValueError):
+        probabilities[0] = 1.0
+    assert evaluate_all(250, 18, 800) is probabilities
+
+
+def test_asteroid_to_dict_is_read_only():
+    with pytest.raises(TypeError):
+        Asteroid(100, 20).to_dict()["mass"] = 0
+
+
+def make_mission():
+    return DeflectionMission('kinetic_impactor', datetime(2030, 1, 1), 400, 18.0,
+                             asteroid_mass(400), 10, 5)
+
+
+def test_deflection_mission_is_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        make_mission().asteroid_diameter = 1
+
+
+def test_compare_all_strategies_shares_result_but_not_calculator_state():
+    impact_date = datetime(2040, 1, 1)
+    first_calculator = MitigationCalculator(make_mission())
+    first = first_calculator.compare_all_strategies(impact_date)
+    expected = copy.deepcopy(first)
+    first_calculator.results['required_delta_v_ms'] = -1
+    
+    second_calculator = MitigationCalculator(make_mission())
+    second = second_calculator.compare_all_strategies(impact_date)
+    
+    assert second is first
+    assert second == expected
+    assert second_calculator.results['required_delta_v_ms'] == expected['required_deflection_ms']
+    assert MitigationCalculator(make_mission())._compare_all_strategies_uncached(impact_date) == expected
@@ -0,0 +1,49 @@
+"""
+Scalar and array paths of the utils.calculations helpers
+"""
+import math
+import numpy as np
+from models.asteroid import Asteroid, AsteroidBatch
+from models.impact import ImpactSimulator
+from utils.calculations import crater_diameter
+
+DIAMETERS = [10, 100, 450, 1000]
+VELOCITIES = [15, 20, 18.5, 30]
+ANGLES = [30, 45, 60, 89]
+
+
+def test_crater_diameter_array_matches_scalar():
+    energy = np.array([1e12, 4.184e15, 3.2e18, 7.5e20])
+    angle = np.array(ANGLES, dtype=np.float64)
+    
+    batch = crater_diameter(energy, angle=angle)
+    
+    assert batch.shape == (4,)
+    np.testing.assert_allclose(
+        batch, [crater_diameter(float(e), angle=float(a)) for e, a in zip(energy, angle)],
+        rtol=1e-12
+    )
+
+
+def test_crater_diameter_negative_energy_is_nan():
+    assert math.isnan(crater_diameter(1e15, angle=-30))
+    
+    batch = crater_diameter(np.array([1e15, 1e15]), angle=np.array([-30.0, 30.0]))
+    assert np.isnan(batch[0])
+    assert batch[1] == crater_diameter(1e15, angle=30.0)
+
+
+def test_impact_simulator_batch_matches_scalar():
+    batch = AsteroidBatch(DIAMETERS, VELOCITIES, angle=ANGLES)
+    
+    for is_ocean in (False, True):
+        results = ImpactSimulator(batch, 0, 0, is_ocean=is_ocean).calculate_impact()
+        for i, (diameter, velocity, angle) in enumerate(zip(DIAMETERS, VELOCITIES, ANGLES)):
+            single = ImpactSimulator(
+                Asteroid(diameter, velocity, angle=angle), 0, 0, is_ocean=is_ocean
+            ).calculate_impact()
+            for group in ("crater", "blast_effects", "thermal_effects"):
+                for key, value in single[group].items():
+                    np.testing.assert_allclose(
+                        np.broadcast_to(results[group][key], (len(batch),))[i], value, rtol=1e-12
+                    )
@@ -0,0 +1,33 @@
+"""
+ImpactPhysicsCalculator and the module-level impact functions
+"""
+import warnings
+import pytest
+from models.impact_physics import ImpactParameters, ImpactPhysicsCalculator, calculate_impact
+
+STEPS = (
+    'calculate_kinetic_energy', 'calculate_crater_dimensions', 'calculate_seismic_effects',
+    'calculate_blast_effects', 'calculate_thermal_effects', 'calculate_tsunami_effects',
+    'calculate_atmospheric_effects', 'calculate_ejecta_effects'
+)
+
+
+@pytest.mark.parametrize('target_type', ['land', 'water'])
+def test_step_methods_match_fused_pass(target_type):
+    params = ImpactParameters(diameter=300, velocity=19, density=3000, angle=40,
+                              target_type=target_type)
+    calculator = ImpactPhysicsCalculator(params)
+    for step in STEPS:
+        getattr(calculator, step)()
+    
+    fused = ImpactPhysicsCalculator(params)._calculate_all_uncached()
+    
+    assert list(calculator.results) == list(fused)
+    assert calculator.results == fused
+
+
+@pytest.mark.parametrize('diameter, angle', [(100, 0), (0, 45)])
+def test_zero_energy_impact_emits_no_warnings(diameter, angle):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        calculate_impact(diameter, 20, 3000, angle, 'water')
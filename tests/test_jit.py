@@ -0,0 +1,57 @@
+"""
+utils.jit falls back to plain Python when numba is not installed
+"""
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_jit_without_numba(monkeypatch):
+    """A fresh copy of utils/jit.py, imported while numba is unimportable"""
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    spec = importlib.util.spec_from_file_location('jit_without_numba', REPO_ROOT / 'utils' / 'jit.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_fallback_njit_returns_the_function(monkeypatch):
+    jit = load_jit_without_numba(monkeypatch)
+    
+    def add(a, b):
+        return a + b
+    
+    assert jit.njit(add) is add
+    assert jit.njit(cache=True)(add) is add
+    assert jit.njit('float64(float64, float64)', cache=True)(add) is add
+    assert jit.prange is range
+
+
+# Runs in a child process so the jitted modules of this one are not replaced
+_MODELS_SCRIPT = """
+import json, sys
+if sys.argv[1] == 'plain':
+    sys.modules['numba'] = None
+from datetime import datetime
+from models.impact_physics import calculate_enhanced_impact, calculate_impact
+from models.mitigation import simulate_deflection_scenario
+print(json.dumps([
+    calculate_impact(300, 20, 3000, 45, 'water')['calculations']['seismic_magnitude'],
+    calculate_enhanced_impact(120, 18, 3000, 30, 'ocean')['crater_diameter_m'],
+    simulate_deflection_scenario(350, 18, 8, datetime(2040, 1, 1))['rankings'][0]['score'],
+]))
+"""
+
+
+def run_models(mode):
+    output = subprocess.run([sys.executable, '-c', _MODELS_SCRIPT, mode], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def test_models_match_with_and_without_numba():
+    assert run_models('plain') == run_models('jit')
@@ -0,0 +1,46 @@
+"""
+MitigationCalculator strategy models
+"""
+from datetime import datetime
+from models.mitigation import DeflectionMission, MitigationCalculator, asteroid_mass
+
+IMPACT_DATE = datetime(2040, 1, 1)
+
+
+def make_mission(diameter=300, warning_years=10, duration_years=5):
+    return DeflectionMission(
+        strategy='kinetic_impactor',
+        launch_date=None,
+        asteroid_diameter=diameter,
+        asteroid_velocity=18.0,
+        asteroid_mass=asteroid_mass(diameter),
+        warning_time_years=warning_years,
+        mission_duration_years=duration_years,
+        launch_ts=0.0
+    )
+
+
+def test_subclass_overrides_kinetic_and_gravity_constants():
+    class HeavyCalculator(MitigationCalculator):
+        KINETIC_IMPACTOR_MASS = 1000
+        GRAVITY_TRACTOR_MASS = 4000
+    
+    mission = make_mission()
+    base = MitigationCalculator(mission)
+    heavy = HeavyCalculator(mission)
+    
+    assert heavy.kinetic_impactor_deflection()['delta_v_ms'] == 2 * base.kinetic_impactor_deflection()['delta_v_ms']
+    assert heavy.gravity_tractor_deflection()['delta_v_ms'] == 4 * base.gravity_tractor_deflection()['delta_v_ms']
+    # The base class keeps its own folded constants
+    assert MitigationCalculator._KINETIC_MOMENTUM == 3.5 * 500 * 10000
+
+
+def test_subclass_overrides_nuclear_yield():
+    class MegatonCalculator(MitigationCalculator):
+        NUCLEAR_YIELD_MT = 4
+    
+    mission = make_mission()
+    base = MitigationCalculator(mission).nuclear_deflection()['delta_v_ms']
+    
+    # delta_v scales with the square root of the yield
+    assert abs(MegatonCalculator(mission).nuclear_deflection()['delta_v_ms'] - 2 * base) < 1e-12 * base
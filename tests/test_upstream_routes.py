@@ -0,0 +1,93 @@
+"""
+Proxy routes don't cache upstream failures: the next request goes upstream again
+"""
+import pytest
+import requests
+import app as app_module
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return self.payload
+
+
+class FlakyUpstream:
+    """session.get stand-in that fails the first call and then returns `response`"""
+    
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+    
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise requests.ConnectionError("upstream down")
+        return self.response
+
+
+@pytest.fixture
+def client():
+    app_module.cache.clear()
+    yield app_module.app.test_client()
+    app_module.cache.clear()
+
+
+SBDB_PAYLOAD = {'object': {'fullname': '99942 Apophis (2004 MN4)'}, 'orbit': {}, 'phys_par': []}
+
+
+@pytest.mark.parametrize('path, payload', [
+    ('/api/enhanced-nasa/small-body-database/Apophis', SBDB_PAYLOAD),
+    ('/api/enhanced-nasa/horizons-ephemeris?target=Apophis', {'result': 'ephemeris'}),
+    ('/api/enhanced-nasa/near-earth-comets', [{'object': '1P/Halley'}]),
+])
+def test_failure_is_not_cached(client, monkeypatch, path, payload):
+    upstream = FlakyUpstream(FakeResponse(payload))
+    monkeypatch.setattr(app_module.enhanced_nasa_client.session, 'get', upstream)
+    
+    failed = client.get(path)
+    assert failed.status_code == 502
+    assert 'error' in failed.get_json()
+    
+    recovered = client.get(path)
+    assert recovered.status_code == 200
+    assert recovered.get_json()
+    assert upstream.calls == 2
+    
+    # The successful answer is cached
+    client.get(path)
+    assert upstream.calls == 2
+
+
+class FakeCatalogResponse(FakeResponse):
+    content = b'{"type":"FeatureCollection","features":[]}'
+    headers = {'ETag': '"catalog-1"'}
+
+
+def test_earthquake_catalog_failure_is_not_cached(client, monkeypatch):
+    upstream = FlakyUpstream(FakeCatalogResponse(None))
+    monkeypatch.setattr(app_module.usgs_seismic.session, 'get', upstream)
+    path = '/api/usgs/earthquake-catalog?min_magnitude=6'
+    
+    failed = client.get(path)
+    assert failed.status_code == 502
+    assert 'error' in failed.get_json()
+    
+    recovered = client.get(path)
+    assert recovered.status_code == 200
+    assert recovered.data == FakeCatalogResponse.content
+    assert upstream.calls == 2
+
+
+def test_earthquake_catalog_dict_keeps_empty_result_on_failure(monkeypatch):
+    def fail(*args, **kwargs):
+        raise requests.ConnectionError("upstream down")
+    
+    monkeypatch.setattr(app_module.usgs_seismic.session, 'get', fail)
+    
+    assert app_module.usgs_seismic.get_earthquake_catalog(min_magnitude=7.0) == {}
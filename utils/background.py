@@ -0,0 +1,101 @@
+"""
+Background refresh of upstream data and deferred writes
+A single worker thread does the slow I/O so request handlers never wait on it
+"""
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+class PeriodicSnapshot:
+    """
+    Re-fetch a payload every `interval` seconds and hold it (as JSON bytes when `encode` is given)
+
+    Upstream error payloads ({'error': ...}) are never held; until the first
+    successful fetch the thread retries every `retry_interval` seconds
+    """
+
+    def __init__(self, fetch: Callable[[], object], interval: float, name: str,
+                 encode: Optional[Callable[[object], bytes]] = None,
+                 retry_interval: Optional[float] = None):
+        self.fetch = fetch
+        self.encode = encode
+        self.interval = interval
+        self.retry_interval = interval if retry_interval is None else retry_interval
+        self.name = name
+        self._body: Optional[bytes] = None
+        self._thread: Optional[threading.Thread] = None
+        self._first_refresh = threading.Event()
+
+    def start(self):
+        """Start the refresh thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def refresh(self):
+        """Fetch and encode a new snapshot; upstream errors keep the previous one"""
+        result = self.fetch()
+        if isinstance(result, dict) and 'error' in result:
+            # Returned to the caller but not held, so the next get() tries again
+            if self._body is not None:
+                return self._body
+            return self.encode(result) if self.encode else result
+
+        # Rebinding the reference is atomic, so readers never see a partial update
+        self._body = self.encode(result) if self.encode else result
+        return self._body
+
+    def get(self):
+        """Latest snapshot, fetched inline if the thread hasn't produced one"""
+        body = self._body
+        if body is None:
+            if self._thread is not None:
+                self._first_refresh.wait()
+            body = self._body or self.refresh()
+        return body
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"{self.name} refresh failed: {e}")
+            finally:
+                self._first_refresh.set()
+            time.sleep(self.interval if self._body is not None else self.retry_interval)
+
+class BackgroundWriter:
+    """Hand items to `write` on a worker thread so requests return before the I/O completes"""
+
+    def __init__(self, write: Callable[[object], None], name: str):
+        self.write = write
+        self.name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the writer thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def put(self, item):
+        """Queue an item without blocking"""
+        self._queue.put_nowait(item)
+
+    def join(self):
+        """Block until every queued item has been written"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                self.write(item)
+            except Exception as e:
+                print(f"{self.name} write failed: {e}")
+            finally:
+                self._queue.task_done()
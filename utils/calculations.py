@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 def kinetic_energy_joules(mass, velocity):
@@ -46,7 +47,16 @@ def crater_diameter(energy, target_density=2500, gravity=9.8, angle=90):
     # where a, b, c are empirical constants
     
     # Adjust for impact angle
-    energy_adjusted = energy * np.sin(np.radians(angle))
+    if np.ndim(energy) == 0 and np.ndim(angle) == 0:
+        # Scalar fast path (single impacts); math skips the numpy dispatch
+        energy_adjusted = energy * math.sin(math.radians(angle))
+        if energy_adjusted < 0:
+            # A float power of a negative base is complex; numpy gives nan here
+            return math.nan
+    else:
+        # Arrays (AsteroidBatch): nan where the adjusted energy is negative
+        energy_adjusted = energy * np.sin(np.radians(angle))
+        energy_adjusted = np.where(energy_adjusted < 0, np.nan, energy_adjusted)
     
     # Simplified calculation
     diameter = 1.161 * ((energy_adjusted / (10**6)) ** 0.333)
@@ -5,10 +5,14 @@ Comprehensive integration with NASA's official data sources and partner agencies
 import requests
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import math
 import numpy as np
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from utils.jit import njit
+from utils.nasa_api import make_session
+import config
 
 @dataclass
 class KeplerianElements:
@@ -21,6 +25,67 @@ class KeplerianElements:
     mean_anomaly: float  # degrees
     epoch: datetime
     
+@njit(cache=True)
+def solve_kepler(M: float, e: float, tolerance: float = 1e-8) -> float:
+    """Eccentric anomaly for mean anomaly M (Newton-Raphson on M = E - e sin E)"""
+    E = M  # Initial guess
+    
+    for _ in range(100):  # Maximum iterations
+        f = E - e * math.sin(E) - M
+        f_prime = 1 - e * math.cos(E)
+        
+        if abs(f) < tolerance:
+            break
+            
+        E = E - f / f_prime
+    
+    return E
+
+@njit(cache=True)
+def keplerian_positions(julian_dates: np.ndarray, epoch_jd: float, semi_major_axis: float,
+                        eccentricity: float, inclination: float, longitude_ascending_node: float,
+                        argument_periapsis: float, mean_anomaly: float) -> np.ndarray:
+    """Positions along a Keplerian orbit at each Julian date, as an (N, 3) array"""
+    # Mean motion (radians per day)
+    n = math.sqrt(398600.4418 / (semi_major_axis * 1.496e8)**3) * 86400
+    
+    # Rotation to ecliptic coordinates is the same for every date
+    cos_om = math.cos(math.radians(longitude_ascending_node))
+    sin_om = math.sin(math.radians(longitude_ascending_node))
+    cos_w = math.cos(math.radians(argument_periapsis))
+    sin_w = math.sin(math.radians(argument_periapsis))
+    cos_i = math.cos(math.radians(inclination))
+    sin_i = math.sin(math.radians(inclination))
+    
+    positions = np.empty((julian_dates.shape[0], 3))
+    for k in range(julian_dates.shape[0]):
+        # Mean anomaly at time t
+        M = math.radians(mean_anomaly) + n * (julian_dates[k] - epoch_jd)
+        
+        # Solve Kepler's equation for eccentric anomaly
+        E = solve_kepler(M, eccentricity)
+        
+        # True anomaly
+        nu = 2 * math.atan2(
+            math.sqrt(1 + eccentricity) * math.sin(E/2),
+            math.sqrt(1 - eccentricity) * math.cos(E/2)
+        )
+        
+        # Distance from focus
+        r = semi_major_axis * (1 - eccentricity * math.cos(E))
+        
+        # Position in orbital plane
+        x_orbit = r * math.cos(nu)
+        y_orbit = r * math.sin(nu)
+        
+        positions[k, 0] = (cos_om * cos_w - sin_om * sin_w * cos_i) * x_orbit + \
+            (-cos_om * sin_w - sin_om * cos_w * cos_i) * y_orbit
+        positions[k, 1] = (sin_om * cos_w + cos_om * sin_w * cos_i) * x_orbit + \
+            (-sin_om * sin_w + cos_om * cos_w * cos_i) * y_orbit
+        positions[k, 2] = sin_w * sin_i * x_orbit + cos_w * sin_i * y_orbit
+    
+    return positions
+
 class EnhancedNASAClient:
     """Enhanced NASA API client with comprehensive data integration"""
     
@@ -33,7 +98,10 @@ class EnhancedNASAClient:
             'cneos': 'https://cneos.jpl.nasa.gov/stats/api',
             'neossat': 'https://www.asc-csa.gc.ca/eng/satellites/neossat'
         }
-        self.session = requests.Session()
+        # Pooled keep-alive connections shared by every request to these hosts,
+        # with responses cached on disk across gunicorn workers
+        self.session = make_session(cache_name=config.Config.HTTP_CACHE_PATH,
+                                    expire_after=config.Config.ASTEROID_UPDATE_INTERVAL)
         
     def get_neo_detailed_data(self, asteroid_id: str = None, 
                              start_date: str = None, end_date: str = None) -> Dict:
@@ -57,6 +125,12 @@ class EnhancedNASAClient:
             print(f"NEO API request failed: {e}")
             return {}
     
+    def get_enhanced_neo_data(self) -> Dict:
+        """
+        Current NEO feed (today's close approaches) for the professional dashboard
+        """
+        return self.get_neo_detailed_data()
+    
     def get_small_body_database_query(self, object_name: str) -> Dict:
         """
         Query NASA's Small-Body Database for detailed asteroid parameters
@@ -77,7 +151,7 @@ class EnhancedNASAClient:
             return {}
         except requests.RequestException as e:
             print(f"SBDB API request failed: {e}")
-            return {}
+            return {"error": f"SBDB API request failed: {e}"}
     
     def parse_sbdb_data(self, data: Dict) -> Dict:
         """Parse Small-Body Database response into usable format"""
@@ -137,10 +211,11 @@ class EnhancedNASAClient:
         """
         url = self.base_urls['horizons']
         
+        now = datetime.now()
         if not start_time:
-            start_time = datetime.now().strftime('%Y-%m-%d')
+            start_time = now.strftime('%Y-%m-%d')
         if not stop_time:
-            stop_time = (datetime.now() + timedelta(days=365)).strftime('%Y-%m-%d')
+            stop_time = (now + timedelta(days=365)).strftime('%Y-%m-%d')
         
         params = {
             'format': 'json',
@@ -161,11 +236,12 @@ class EnhancedNASAClient:
             return response.json()
         except requests.RequestException as e:
             print(f"Horizons API request failed: {e}")
-            return {}
+            return {"error": f"Horizons API request failed: {e}"}
     
-    def get_near_earth_comets(self) -> List[Dict]:
+    def get_near_earth_comets(self) -> Union[List[Dict], Dict]:
         """
         Get Near-Earth Comets orbital elements from NASA Open Data Portal
+        (a dict with an 'error' key if the request fails)
         """
         url = 'https://data.nasa.gov/resource/b67r-rgxc.json'
         
@@ -175,7 +251,7 @@ class EnhancedNASAClient:
             return response.json()
         except requests.RequestException as e:
             print(f"Near-Earth Comets API request failed: {e}")
-            return []
+            return {"error": f"Near-Earth Comets API request failed: {e}"}
     
     def calculate_orbital_position(self, elements: KeplerianElements, 
                                  julian_date: float) -> Tuple[float, float, float]:
@@ -183,64 +259,28 @@ class EnhancedNASAClient:
         Calculate orbital position using Keplerian elements
         Based on NASA's elliptical orbit simulator algorithms
         """
-        # Time since epoch
-        dt = julian_date - self.datetime_to_julian(elements.epoch)
-        
-        # Mean motion (radians per day)
-        n = math.sqrt(398600.4418 / (elements.semi_major_axis * 1.496e8)**3) * 86400
-        
-        # Mean anomaly at time t
-        M = math.radians(elements.mean_anomaly) + n * dt
-        
-        # Solve Kepler's equation for eccentric anomaly
-        E = self.solve_keplers_equation(M, elements.eccentricity)
-        
-        # True anomaly
-        nu = 2 * math.atan2(
-            math.sqrt(1 + elements.eccentricity) * math.sin(E/2),
-            math.sqrt(1 - elements.eccentricity) * math.cos(E/2)
-        )
-        
-        # Distance from focus
-        r = elements.semi_major_axis * (1 - elements.eccentricity * math.cos(E))
-        
-        # Position in orbital plane
-        x_orbit = r * math.cos(nu)
-        y_orbit = r * math.sin(nu)
-        z_orbit = 0
-        
-        # Rotate to ecliptic coordinates
-        cos_om = math.cos(math.radians(elements.longitude_ascending_node))
-        sin_om = math.sin(math.radians(elements.longitude_ascending_node))
-        cos_w = math.cos(math.radians(elements.argument_periapsis))
-        sin_w = math.sin(math.radians(elements.argument_periapsis))
-        cos_i = math.cos(math.radians(elements.inclination))
-        sin_i = math.sin(math.radians(elements.inclination))
-        
-        x = (cos_om * cos_w - sin_om * sin_w * cos_i) * x_orbit + \
-            (-cos_om * sin_w - sin_om * cos_w * cos_i) * y_orbit
-        y = (sin_om * cos_w + cos_om * sin_w * cos_i) * x_orbit + \
-            (-sin_om * sin_w + cos_om * cos_w * cos_i) * y_orbit
-        z = sin_w * sin_i * x_orbit + cos_w * sin_i * y_orbit
-        
+        x, y, z = self.calculate_orbital_trajectory(elements, [julian_date])[0].tolist()
         return x, y, z
     
+    def calculate_orbital_trajectory(self, elements: KeplerianElements,
+                                     julian_dates) -> np.ndarray:
+        """
+        Heliocentric ecliptic positions (AU) for many Julian dates in one pass
+        Returns an (N, 3) array of x, y, z
+        """
+        return keplerian_positions(
+            np.asarray(julian_dates, dtype=np.float64),
+            self.datetime_to_julian(elements.epoch),
+            float(elements.semi_major_axis), float(elements.eccentricity),
+            float(elements.inclination), float(elements.longitude_ascending_node),
+            float(elements.argument_periapsis), float(elements.mean_anomaly)
+        )
+    
     def solve_keplers_equation(self, M: float, e: float, tolerance: float = 1e-8) -> float:
         """
         Solve Kepler's equation using Newton-Raphson method
         """
-        E = M  # Initial guess
-        
-        for _ in range(100):  # Maximum iterations
-            f = E - e * math.sin(E) - M
-            f_prime = 1 - e * math.cos(E)
-            
-            if abs(f) < tolerance:
-                break
-                
-            E = E - f / f_prime
-        
-        return E
+        return solve_kepler(float(M), float(e), float(tolerance))
     
     def datetime_to_julian(self, dt: datetime) -> float:
         """Convert datetime to Julian date"""
@@ -275,17 +315,20 @@ class EnhancedNASAClient:
         julian_impact = self.datetime_to_julian(impact_date)
         
         # Generate trajectory points
-        trajectory = []
-        for days_before in range(365, -1, -10):  # One year trajectory
-            date = impact_date - timedelta(days=days_before)
-            jd = self.datetime_to_julian(date)
-            x, y, z = self.calculate_orbital_position(elements, jd)
-            
-            trajectory.append({
+        days_before_impact = range(365, -1, -10)  # One year trajectory
+        dates = [impact_date - timedelta(days=days_before) for days_before in days_before_impact]
+        positions = self.calculate_orbital_trajectory(
+            elements, [self.datetime_to_julian(date) for date in dates]
+        ).tolist()
+        
+        trajectory = [
+            {
                 'date': date.isoformat(),
                 'position': {'x': x, 'y': y, 'z': z},
                 'days_to_impact': days_before
-            })
+            }
+            for date, days_before, (x, y, z) in zip(dates, days_before_impact, positions)
+        ]
         
         return {
             'name': 'Impactor-2025',
@@ -325,12 +368,28 @@ class USGSSeismicIntegration:
     
     def __init__(self):
         self.base_url = 'https://earthquake.usgs.gov/fdsnws/event/1'
+        self.session = make_session()
         
     def get_earthquake_catalog(self, start_date: str = None, end_date: str = None,
                               min_magnitude: float = 5.0) -> Dict:
         """
         Get earthquake data from USGS NEIC catalog
         """
+        try:
+            raw, _ = self.get_earthquake_catalog_raw(start_date, end_date, min_magnitude)
+        except requests.RequestException as e:
+            print(f"USGS API request failed: {e}")
+            return {}
+        return json.loads(raw)
+    
+    def get_earthquake_catalog_raw(self, start_date: str = None, end_date: str = None,
+                                   min_magnitude: float = 5.0) -> Tuple[bytes, Optional[str]]:
+        """
+        Get the USGS GeoJSON catalog as undecoded bytes, with the upstream ETag
+        
+        Raises:
+            requests.RequestException: if the USGS request fails
+        """
         params = {
             'format': 'geojson',
             'minmagnitude': min_magnitude
@@ -341,13 +400,9 @@ class USGSSeismicIntegration:
         if end_date:
             params['endtime'] = end_date
             
-        try:
-            response = requests.get(f"{self.base_url}/query", params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"USGS API request failed: {e}")
-            return {}
+        response = self.session.get(f"{self.base_url}/query", params=params, timeout=30)
+        response.raise_for_status()
+        return response.content, response.headers.get('ETag')
     
     def calculate_impact_seismic_equivalent(self, kinetic_energy: float) -> Dict:
         """
@@ -437,16 +492,23 @@ def integrate_all_nasa_resources(api_key: str) -> Dict:
     usgs_client = USGSSeismicIntegration()
     neossat_client = CSANEOSSATIntegration()
     
+    # Fetch the upstream sources concurrently; the scenario is computed meanwhile
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        real_neo_data = pool.submit(nasa_client.get_neo_detailed_data)
+        near_earth_comets = pool.submit(nasa_client.get_near_earth_comets)
+        seismic_integration = pool.submit(
+            usgs_client.get_earthquake_catalog, start_date='2020-01-01', min_magnitude=7.0
+        )
+        impactor_2025_scenario = nasa_client.create_impactor_2025_scenario()
+        neossat_data = neossat_client.get_neossat_observations()
+    
     # Create comprehensive data package
     integrated_data = {
-        'impactor_2025_scenario': nasa_client.create_impactor_2025_scenario(),
-        'real_neo_data': nasa_client.get_neo_detailed_data(),
-        'near_earth_comets': nasa_client.get_near_earth_comets(),
-        'seismic_integration': usgs_client.get_earthquake_catalog(
-            start_date='2020-01-01',
-            min_magnitude=7.0
-        ),
-        'neossat_data': neossat_client.get_neossat_observations(),
+        'impactor_2025_scenario': impactor_2025_scenario,
+        'real_neo_data': real_neo_data.result(),
+        'near_earth_comets': near_earth_comets.result(),
+        'seismic_integration': seismic_integration.result(),
+        'neossat_data': neossat_data,
         'orbital_mechanics': {
             'keplerian_calculator': True,
             'trajectory_propagator': True,
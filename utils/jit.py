@@ -0,0 +1,14 @@
+"""
+Optional Numba JIT for the scalar numeric cores
+Without numba installed the decorated functions run as plain Python
+"""
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
@@ -0,0 +1,80 @@
+"""
+orjson-backed JSON provider for Flask
+Routes keep calling jsonify()/get_json(); encoding and parsing happen in orjson
+"""
+import orjson
+from functools import partial
+from types import MappingProxyType
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson"""
+    
+    # Physics results use numeric dict keys (distances in km) and may hold numpy values
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    sort_keys = False
+    
+    @staticmethod
+    def default(o):
+        """Encode read-only mappings (e.g. Asteroid.to_dict()) as JSON objects"""
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+    
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize to a JSON string, deferring to the stdlib for custom kwargs"""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def dumps_bytes(self, obj) -> bytes:
+        """Serialize to compact JSON bytes, e.g. for payloads encoded once and reused"""
+        return orjson.dumps(obj, default=self.default, option=self.option)
+    
+    def loads(self, s, **kwargs):
+        """Parse JSON (including request.get_json() bodies) with orjson"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Build a JSON response straight from orjson's bytes output"""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
+    
+    def iter_encode(self, obj):
+        """Yield JSON chunks, encoding one top-level value or list item at a time"""
+        dumps = partial(orjson.dumps, default=self.default, option=self.option)
+        
+        if isinstance(obj, dict):
+            yield b'{'
+            for i, (key, value) in enumerate(obj.items()):
+                yield (b',' if i else b'') + dumps(str(key)) + b':'
+                if isinstance(value, (list, tuple)):
+                    yield from self._iter_list(value, dumps)
+                else:
+                    yield dumps(value)
+            yield b'}'
+        elif isinstance(obj, (list, tuple)):
+            yield from self._iter_list(obj, dumps)
+        else:
+            yield dumps(obj)
+    
+    @staticmethod
+    def _iter_list(items, dumps):
+        yield b'['
+        for i, item in enumerate(items):
+            yield (b',' if i else b'') + dumps(item)
+        yield b']'
+    
+    def stream_response(self, obj):
+        """Build a streamed JSON response so large payloads are never fully buffered"""
+        return self._app.response_class(self.iter_encode(obj), mimetype=self.mimetype)
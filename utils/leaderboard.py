@@ -0,0 +1,52 @@
+"""
+Defend-Earth game leaderboard
+Scores live in a Redis sorted set when configured, otherwise in process memory
+"""
+import heapq
+import itertools
+import json
+import threading
+from typing import Dict, List, Optional
+
+class Leaderboard:
+    """Top player scores, highest first"""
+
+    KEY = 'leaderboard'
+
+    def __init__(self, redis_url: Optional[str] = None, size: int = 100):
+        self.size = size
+        self._redis = None
+        if redis_url:
+            import redis
+            self._redis = redis.Redis.from_url(redis_url)
+
+        # Min-heap of (score, sequence, entry) so the lowest score is evicted first
+        self._entries = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def add(self, entry: Dict):
+        """Record an entry with 'name', 'score' and 'date' keys"""
+        if self._redis is not None:
+            member = json.dumps(entry, sort_keys=True)
+            pipe = self._redis.pipeline()
+            pipe.zadd(self.KEY, {member: entry['score']})
+            pipe.zremrangebyrank(self.KEY, 0, -(self.size + 1))
+            pipe.execute()
+            return
+
+        item = (entry['score'], next(self._sequence), entry)
+        with self._lock:
+            if len(self._entries) < self.size:
+                heapq.heappush(self._entries, item)
+            else:
+                heapq.heappushpop(self._entries, item)
+
+    def top(self, count: int = 10) -> List[Dict]:
+        """Best `count` entries, highest score first"""
+        if self._redis is not None:
+            return [json.loads(member) for member in self._redis.zrevrange(self.KEY, 0, count - 1)]
+
+        with self._lock:
+            best = heapq.nlargest(count, self._entries)
+        return [entry for _, _, entry in best]
@@ -1,17 +1,82 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import os
+import glob
+import tempfile
+from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import config
 import time
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+class _UncachedResult(Exception):
+    """Carries an upstream error out of an lru_cache'd call so it is not memoized"""
+
+def cache_successful(maxsize: int):
+    """lru_cache variant that never stores API error payloads"""
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(*args):
+            result = func(*args)
+            if isinstance(result, dict) and 'error' in result:
+                raise _UncachedResult(result)
+            return result
+        
+        @wraps(func)
+        def wrapper(*args):
+            try:
+                return cached(*args)
+            except _UncachedResult as e:
+                return e.args[0]
+        
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        return wrapper
+    return decorator
+
+def make_session(pool_size: int = 32, retries: int = 3, cache_name: Optional[str] = None,
+                 expire_after: Optional[int] = None) -> requests.Session:
+    """
+    Create a pooled HTTP session with retry/backoff and gzip transfer
+
+    With cache_name set and requests-cache installed, successful responses are
+    kept in that SQLite file for expire_after seconds, shared by every worker
+    process on the host.
+    """
+    if cache_name and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name, backend='sqlite', expire_after=expire_after, allowable_codes=(200,)
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.2,
+                          status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip'
+    return session
+
 class NASAAPIClient:
     """Comprehensive NASA API client for all space data"""
     
     def __init__(self):
         self.api_key = config.Config.NASA_API_KEY
         self.endpoints = config.Config.NASA_ENDPOINTS
-        self.session = requests.Session()
+        # Pooled keep-alive connections, sized for concurrent fan-out from the app
+        self.session = make_session()
         self.session.headers.update({
             'User-Agent': 'AstroDefense-Stellarium-App/1.0',
             'Accept': 'application/json'
@@ -51,11 +116,18 @@ class NASAAPIClient:
                 params['end_date'] = end_date
             return self._make_request(url, params)
     
+    def get_asteroid_details(self, asteroid_id):
+        """Look up a single NEO by SPK-ID; None if NeoWs has no such object"""
+        data = self.get_asteroid_data(asteroid_id=asteroid_id)
+        if str(data.get('error', '')).startswith('404'):
+            return None
+        return data
+    
     def get_close_approach_data(self, days=7):
         """Get near-Earth objects approaching in the next specified days"""
-        end_date = datetime.now() + timedelta(days=days)
-        start_date = datetime.now().strftime('%Y-%m-%d')
-        end_date = end_date.strftime('%Y-%m-%d')
+        now = datetime.now()
+        start_date = now.strftime('%Y-%m-%d')
+        end_date = (now + timedelta(days=days)).strftime('%Y-%m-%d')
         
         return self.get_asteroid_data(start_date, end_date)
     
@@ -68,6 +140,10 @@ class NASAAPIClient:
     # ASTRONOMY PICTURE OF THE DAY
     def get_apod(self, date=None, count=None, start_date=None, end_date=None):
         """Get Astronomy Picture of the Day"""
+        # Past APOD entries never change, so they are memoized by date
+        if date and not (count or start_date or end_date) and date < datetime.now().strftime('%Y-%m-%d'):
+            return self._get_archived_apod(date)
+        
         url = self.endpoints['APOD']
         params = {}
         
@@ -82,6 +158,37 @@ class NASAAPIClient:
             
         return self._make_request(url, params)
     
+    @cache_successful(maxsize=4096)
+    def _get_archived_apod(self, date):
+        return self._make_request(self.endpoints['APOD'], {'date': date})
+    
+    def cached_apod_image(self, date: str, cache_dir: str) -> Optional[str]:
+        """Path of a previously downloaded APOD image, if any"""
+        cached = glob.glob(os.path.join(cache_dir, f"{date}.*"))
+        return cached[0] if cached else None
+    
+    def download_apod_image(self, date: str, url: str, cache_dir: str) -> str:
+        """Download an APOD image into cache_dir and return its path"""
+        extension = os.path.splitext(urlparse(url).path)[1] or '.jpg'
+        path = os.path.join(cache_dir, f"{date}{extension}")
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        response = self.session.get(url, timeout=30, stream=True, headers={'Accept': 'image/*'})
+        response.raise_for_status()
+        
+        # Write to a temp file and rename so concurrent readers never see a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        return path
+    
     # MARS ROVER DATA
     def get_mars_rover_photos(self, rover='curiosity', sol=None, earth_date=None, camera=None):
         """Get Mars rover photos"""
@@ -102,7 +209,11 @@ class NASAAPIClient:
         return self._make_request(url, params)
     
     def get_mars_rover_info(self, rover='curiosity'):
-        """Get Mars rover mission information"""
+        """Get Mars rover mission information (refreshed once a day)"""
+        return self._get_mars_rover_info(rover, datetime.now().strftime('%Y-%m-%d'))
+    
+    @cache_successful(maxsize=16)
+    def _get_mars_rover_info(self, rover, day):
         url = f"{self.endpoints['MARS_ROVER']}/rovers/{rover}"
         return self._make_request(url)
     
@@ -196,13 +307,21 @@ class NASAAPIClient:
         """Get current space events and phenomena"""
         current_time = datetime.now()
         
+        # The feeds are independent, so wait on all of them at once rather than in turn
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            iss_location = pool.submit(self.get_iss_location)
+            people_in_space = pool.submit(self.get_people_in_space)
+            close_approaches = pool.submit(self.get_close_approach_data, 1)
+            apod = pool.submit(self.get_apod)
+            epic_latest = pool.submit(self.get_epic_images)
+        
         events = {
             'timestamp': current_time.isoformat(),
-            'iss_location': self.get_iss_location(),
-            'people_in_space': self.get_people_in_space(),
-            'close_approaches_today': self.get_close_approach_data(1),
-            'apod': self.get_apod(),
-            'epic_latest': self.get_epic_images()
+            'iss_location': iss_location.result(),
+            'people_in_space': people_in_space.result(),
+            'close_approaches_today': close_approaches.result(),
+            'apod': apod.result(),
+            'epic_latest': epic_latest.result()
         }
         
         return events
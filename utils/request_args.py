@@ -0,0 +1,35 @@
+"""
+Typed query-string parsing for Flask views
+"""
+from functools import wraps
+from flask import request
+
+def typed_args(**spec):
+    """
+    Parse query arguments once and pass them to the view as keyword arguments
+
+    Each keyword maps an argument name to a converter, or to a
+    (converter, default) tuple. Missing or unconvertible values fall back to
+    the default (None when not given), matching request.args.get(type=...).
+
+    Example:
+        @typed_args(lat=float, lon=float, elevation=(float, 0), time=str)
+        def sky_view(lat, lon, elevation, time): ...
+    """
+    fields = [
+        (name, *(rule if isinstance(rule, tuple) else (rule, None)))
+        for name, rule in spec.items()
+    ]
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            query = request.args
+            for name, convert, default in fields:
+                try:
+                    kwargs[name] = convert(query[name])
+                except (KeyError, ValueError, TypeError):
+                    kwargs[name] = default
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,142 @@
+"""
+Request body schemas for the JSON API
+Bodies are parsed and coerced in one pass by pydantic's compiled core
+"""
+from typing import ClassVar, List, Optional
+from datetime import date, datetime
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+class ImpactRequest(BaseModel):
+    """Body of /api/meteor-madness/impact-calculation"""
+    diameter: float = 100  # meters
+    velocity: float = 20  # km/s
+    density: float = 3000  # kg/m³
+    angle: float = 45  # degrees
+    location: str = 'ocean'  # impact location
+
+class DeflectionRequest(BaseModel):
+    """Body of /api/meteor-madness/deflection-simulation"""
+    # Asteroid parameters
+    diameter: float = 100  # meters
+    velocity: float = 20  # km/s
+    density: float = 3000  # kg/m³
+    distance: float = 1.0  # AU from Earth
+
+    # Mission parameters
+    method: str = 'kinetic'
+    warning_time: float = 5  # years
+    budget: float = 1e9  # USD
+    technology_level: str = 'current'
+
+    def asteroid_params(self) -> dict:
+        return self.model_dump(include={'diameter', 'velocity', 'density', 'distance'})
+
+    def mission_params(self) -> dict:
+        return self.model_dump(include={'method', 'warning_time', 'budget', 'technology_level'})
+
+class PhysicsImpactRequest(BaseModel):
+    """Body of /api/impact/calculate"""
+    diameter: float = 100  # meters
+    velocity: float = 20  # km/s
+    density: float = 3000  # kg/m³
+    angle: float = 45  # degrees
+    target_type: str = 'land'  # or 'water'
+
+class ImpactScenarioRequest(BaseModel):
+    """Body of /api/impact/scenario"""
+    asteroid_id: str = 'Unknown'
+    latitude: float = 0
+    longitude: float = 0
+    impact_date: Optional[str] = None  # YYYY-MM-DD, defaults to today
+    diameter: float = 100  # meters
+    velocity: float = 20  # km/s
+    target_type: str = 'land'
+
+class DeflectionCompareRequest(BaseModel):
+    """Body of /api/deflection/compare"""
+    asteroid_diameter: float = 300  # meters
+    asteroid_velocity: float = 15  # km/s
+    warning_years: float = 10
+    impact_date: date = date(2035, 1, 1)  # YYYY-MM-DD
+
+class DeflectionScenarioRequest(DeflectionCompareRequest):
+    """Body of /api/deflection/simulate"""
+    strategy: str = 'kinetic_impactor'
+    mission_duration_years: float = 5
+
+class ProfessionalImpactRequest(BaseModel):
+    """Body of /api/professional/impact-assessment"""
+    # Asteroid parameters
+    diameter: float = 100  # meters
+    velocity: float = 20  # km/s
+    density: float = 2500  # kg/m³
+    angle: float = 45  # degrees
+    composition: str = 'rocky'
+
+    # Target parameters
+    latitude: float = 40.7128
+    longitude: float = -74.0060
+    terrain_type: str = 'land'
+    population_density: int = 1000  # people/km²
+
+class MitigationStrategiesRequest(BaseModel):
+    """Body of /api/professional/mitigation-strategies"""
+    diameter: float = Field(default=100, gt=0)  # meters
+    velocity: float = Field(default=20, ge=0)  # km/s
+    time_to_impact: float = Field(default=365, ge=0)  # days
+
+class MitigationGridRequest(BaseModel):
+    """Body of /api/professional/mitigation-grid"""
+    diameters: List[float]  # meters
+    times_to_impact: List[float]  # days
+    velocity: float = Field(default=20, ge=0)  # km/s
+
+    MAX_CELLS: ClassVar[int] = 100000
+
+    @model_validator(mode='after')
+    def check_cells(self):
+        if len(self.diameters) * len(self.times_to_impact) > self.MAX_CELLS:
+            raise ValueError(f'diameters x times_to_impact must have at most {self.MAX_CELLS} cells')
+        return self
+
+class OrbitalTrajectoryRequest(BaseModel):
+    """Body of /api/enhanced-nasa/orbital-trajectory"""
+    # Keplerian elements
+    semi_major_axis: float  # AU
+    eccentricity: float = Field(ge=0, lt=1)
+    inclination: float  # degrees
+    longitude_ascending_node: float  # degrees
+    argument_periapsis: float  # degrees
+    mean_anomaly: float  # degrees
+    epoch: datetime
+
+    # Sampling
+    start_julian_date: Optional[float] = None  # defaults to now
+    days: float = Field(365, gt=0)
+    step_days: float = Field(1, gt=0)
+
+    MAX_POINTS: ClassVar[int] = 100000
+
+    @model_validator(mode='after')
+    def check_points(self):
+        if self.days / self.step_days >= self.MAX_POINTS:
+            raise ValueError(f'days / step_days must be below {self.MAX_POINTS}')
+        return self
+
+class ThreatBatchRequest(BaseModel):
+    """Body of /api/asteroids/threat-batch"""
+    ids: List[str]
+    miss_km: List[float]  # miss distance per id, km
+
+    @model_validator(mode='after')
+    def check_lengths(self):
+        if len(self.ids) != len(self.miss_km):
+            raise ValueError('ids and miss_km must have the same length')
+        return self
+
+def validation_error_response(error: ValidationError):
+    """Body for a 422 response describing which fields failed validation"""
+    return {
+        'error': 'Invalid request body',
+        'details': error.errors(include_url=False, include_context=False, include_input=False)
+    }
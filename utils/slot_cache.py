@@ -0,0 +1,35 @@
+"""
+cached_property for classes with __slots__
+The value is stored in a private slot instead of the instance __dict__
+"""
+
+class slot_cached_property:
+    """
+    Compute a property once and keep it in the slot named '_' + the property name
+
+    Example:
+        class Sphere:
+            __slots__ = ("radius", "_volume")
+
+            @slot_cached_property
+            def volume(self): ...
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.slot = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            # Unassigned slots raise AttributeError, so they double as "not computed yet"
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value